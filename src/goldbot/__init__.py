@@ -1,13 +1,29 @@
-"""Top-level package for the GOLD XAUUSD trading stack."""
+"""Top-level package for the GOLD XAUUSD trading stack.
 
-from importlib import metadata
+Subpackages and ``settings`` are loaded on first access, so ``import goldbot``
+stays cheap for CLIs and worker processes.
+"""
 
-try:
-    __version__ = metadata.version("goldbot")
-except metadata.PackageNotFoundError:  # pragma: no cover
-    __version__ = "0.1.0"
+from __future__ import annotations
 
-from .config import settings  # noqa: E402
+from typing import Any
 
 __all__ = ["__version__", "settings"]
 
+
+def __getattr__(name: str) -> Any:
+    if name == "settings":
+        from .config import settings
+
+        value = settings
+    elif name == "__version__":
+        from importlib import metadata
+
+        try:
+            value = metadata.version("goldbot")
+        except metadata.PackageNotFoundError:  # pragma: no cover
+            value = "0.1.0"
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
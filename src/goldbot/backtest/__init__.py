@@ -1,6 +1,21 @@
-"""Backtest toolkit."""
+"""Backtest toolkit, imported on first use."""
 
-from .engine import BacktestResult, VectorizedBacktester
+from goldbot.utils.lazy import lazy_exports
 
-__all__ = ["BacktestResult", "VectorizedBacktester"]
+_EXPORTS = {
+    "BacktestResult": ".engine",
+    "VectorizedBacktester": ".engine",
+    "EventDrivenBacktester": ".event_engine",
+    "MovingAverageSweep": ".sweep",
+    "PortfolioBacktester": ".portfolio",
+    "PortfolioResult": ".portfolio",
+    "build_trade_ledger": ".trades",
+    "MonteCarloStress": ".stress",
+    "StressResult": ".stress",
+    "WalkForwardRunner": ".walkforward",
+    "WalkForwardResult": ".walkforward",
+    "walk_forward_folds": ".walkforward",
+}
 
+__all__ = list(_EXPORTS)
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -7,7 +7,11 @@ from dataclasses import dataclass
 import numpy as np
 import pandas as pd
 
+from goldbot.backtest.metrics import curve_metrics, infer_periods_per_year
+from goldbot.backtest.trades import build_trade_ledger
 from goldbot.config import settings
+from goldbot.strategies.base import BaseStrategy, lag_signal
+from goldbot.utils.tracing import traced
 
 
 @dataclass(slots=True)
@@ -18,39 +22,67 @@ class BacktestResult:
 
 
 class VectorizedBacktester:
-    def __init__(self, initial_capital: float | None = None) -> None:
+    """Bar-by-bar returns of a position series.
+
+    Stats come from ``goldbot.backtest.metrics``; ``periods_per_year`` is
+    inferred from the bar spacing and trading sessions unless given.
+    """
+
+    def __init__(self, initial_capital: float | None = None, periods_per_year: float | None = None) -> None:
         self.initial_capital = initial_capital or settings.backtest.initial_capital
+        self.periods_per_year = periods_per_year
 
     def run(self, signals: pd.DataFrame) -> BacktestResult:
-        df = signals.copy()
-        df["returns"] = df["close"].pct_change().fillna(0)
-        df["strategy_ret"] = df["position"].shift(1).fillna(0) * df["returns"]
-        df["strategy_ret"] -= settings.backtest.commission_perc * df["returns"].abs()
-
-        equity = (1 + df["strategy_ret"]).cumprod() * self.initial_capital
-        trades = self._extract_trades(df)
-        stats = self._compute_stats(df["strategy_ret"], equity)
-        return BacktestResult(equity_curve=equity, trades=trades, stats=stats)
+        """Backtest a frame with ``close`` and ``position`` columns (``high``/``low`` optional)."""
+
+        return self.run_arrays(
+            signals.index,
+            signals["close"].to_numpy(dtype=np.float64),
+            signals["position"].fillna(0).to_numpy(),
+            high=signals["high"].to_numpy() if "high" in signals else None,
+            low=signals["low"].to_numpy() if "low" in signals else None,
+        )
 
-    @staticmethod
-    def _compute_stats(returns: pd.Series, equity: pd.Series) -> dict[str, float]:
-        cagr = (equity.iloc[-1] / equity.iloc[0]) ** (252 / len(equity)) - 1
-        vol = returns.std() * np.sqrt(252)
-        sharpe = (returns.mean() * 252 - settings.backtest.risk_free_rate) / (vol or 1e-9)
-        drawdown = (equity / equity.cummax()) - 1
-        max_dd = drawdown.min()
-        return {
-            "cagr": float(cagr),
-            "volatility": float(vol),
-            "sharpe": float(sharpe),
-            "max_drawdown": float(max_dd),
-        }
-
-    @staticmethod
-    def _extract_trades(df: pd.DataFrame) -> pd.DataFrame:
-        positions = df["position"].fillna(0)
-        entries = (positions.diff() != 0).astype(int)
-        trades = df.loc[entries == 1, ["close", "position"]].copy()
-        trades.rename(columns={"close": "entry_price"}, inplace=True)
-        return trades
+    def run_strategy(self, strategy: BaseStrategy, data: pd.DataFrame) -> BacktestResult:
+        """Backtest ``strategy.positions(data)`` without building a signal frame."""
 
+        return self.run_arrays(
+            data.index,
+            data["close"].to_numpy(dtype=np.float64),
+            strategy.positions(data),
+            high=data["high"].to_numpy() if "high" in data else None,
+            low=data["low"].to_numpy() if "low" in data else None,
+        )
+
+    @traced(rows_arg="close")
+    def run_arrays(
+        self,
+        index: pd.Index,
+        close: np.ndarray,
+        position: np.ndarray,
+        high: np.ndarray | None = None,
+        low: np.ndarray | None = None,
+    ) -> BacktestResult:
+        """Core loop on aligned arrays; ``position`` (any numeric dtype, e.g. int8) is applied from the next bar."""
+
+        returns = np.zeros_like(close)
+        np.divide(close[1:], close[:-1], out=returns[1:])
+        returns[1:] -= 1.0
+        held = lag_signal(position)
+        strategy_ret = held.astype(np.float64)
+        strategy_ret *= returns
+        strategy_ret -= settings.backtest.commission_perc * np.abs(returns)
+
+        strategy_ret = pd.Series(strategy_ret, index=index, name="strategy_ret")
+        equity = (1 + strategy_ret).cumprod() * self.initial_capital
+        trades = build_trade_ledger(
+            index,
+            close,
+            position,
+            high=high,
+            low=low,
+            commission=settings.backtest.commission_perc,
+        )
+        periods = self.periods_per_year or infer_periods_per_year(index)
+        stats = curve_metrics(strategy_ret, periods, positions=held)
+        return BacktestResult(equity_curve=equity, trades=trades, stats=stats)
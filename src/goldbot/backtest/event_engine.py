@@ -0,0 +1,301 @@
+"""Bar-by-bar event-driven backtester with an order/fill simulator and trade ledger."""
+
+from __future__ import annotations
+
+import math
+import types
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from goldbot.backtest.engine import BacktestResult
+from goldbot.backtest.metrics import curve_metrics, infer_periods_per_year
+from goldbot.config import settings
+from goldbot.utils.tracing import traced
+
+ORDER_TYPES = {"market": 0, "limit": 1, "stop": 2}
+EXIT_REASONS = ("signal", "stop_loss", "take_profit", "open")
+
+
+def _fill_price(raw: float, direction: float, half_spread: float, slip: float) -> float:
+    return raw + direction * (half_spread + raw * slip)
+
+
+def _simulate(
+    open_,
+    high,
+    low,
+    close,
+    target,
+    order_type,
+    order_price,
+    spread,
+    capital,
+    slippage,
+    commission,
+    stop_loss,
+    take_profit,
+    next_open,
+):
+    """Replay bars through the order/fill state machine.
+
+    Written against plain indexable sequences and scalars only so the same
+    source runs interpreted or compiled with numba ``njit``.
+    """
+
+    n = len(close)
+    equity = np.empty(n)
+    tr_entry_bar = np.empty(n, dtype=np.int64)
+    tr_exit_bar = np.empty(n, dtype=np.int64)
+    tr_side = np.empty(n)
+    tr_qty = np.empty(n)
+    tr_entry_px = np.empty(n)
+    tr_exit_px = np.empty(n)
+    tr_pnl = np.empty(n)
+    tr_reason = np.empty(n, dtype=np.int64)
+    n_trades = 0
+
+    cash = capital
+    units = 0.0
+    side = 0.0
+    entry_px = 0.0
+    entry_bar = -1
+    entry_fee = 0.0
+    acted = 0.0
+    pending = False
+    pend_target = 0.0
+    pend_type = 0
+    pend_price = 0.0
+
+    for i in range(n):
+        half_spread = spread[i] * 0.5
+        fill_target = 0.0
+        fill_raw = 0.0
+        fill_slip = 0.0
+        do_fill = False
+
+        if pending:
+            buy = pend_target > side
+            if pend_type == 0:
+                do_fill, fill_raw, fill_slip = True, open_[i], slippage
+            elif pend_type == 1:
+                if buy and low[i] <= pend_price:
+                    do_fill, fill_raw, fill_slip = True, min(open_[i], pend_price), 0.0
+                elif not buy and high[i] >= pend_price:
+                    do_fill, fill_raw, fill_slip = True, max(open_[i], pend_price), 0.0
+            else:
+                if buy and high[i] >= pend_price:
+                    do_fill, fill_raw, fill_slip = True, max(open_[i], pend_price), slippage
+                elif not buy and low[i] <= pend_price:
+                    do_fill, fill_raw, fill_slip = True, min(open_[i], pend_price), slippage
+            if do_fill:
+                fill_target = pend_target
+                pending = False
+
+        # Protective exits apply from the bar after entry; the stop wins if both trigger.
+        if not do_fill and side != 0.0 and entry_bar < i and (stop_loss > 0.0 or take_profit > 0.0):
+            reason = -1
+            exit_raw = 0.0
+            if side > 0:
+                sl_level = entry_px * (1.0 - stop_loss)
+                tp_level = entry_px * (1.0 + take_profit)
+                if stop_loss > 0.0 and low[i] <= sl_level:
+                    reason, exit_raw = 1, min(open_[i], sl_level)
+                elif take_profit > 0.0 and high[i] >= tp_level:
+                    reason, exit_raw = 2, max(open_[i], tp_level)
+            else:
+                sl_level = entry_px * (1.0 + stop_loss)
+                tp_level = entry_px * (1.0 - take_profit)
+                if stop_loss > 0.0 and high[i] >= sl_level:
+                    reason, exit_raw = 1, max(open_[i], sl_level)
+                elif take_profit > 0.0 and low[i] <= tp_level:
+                    reason, exit_raw = 2, min(open_[i], tp_level)
+            if reason > 0:
+                slip = slippage if reason == 1 else 0.0
+                px = _fill_price(exit_raw, -side, half_spread, slip)
+                fee = commission * abs(units) * px
+                cash += units * px - fee
+                tr_entry_bar[n_trades] = entry_bar
+                tr_exit_bar[n_trades] = i
+                tr_side[n_trades] = side
+                tr_qty[n_trades] = abs(units)
+                tr_entry_px[n_trades] = entry_px
+                tr_exit_px[n_trades] = px
+                tr_pnl[n_trades] = units * (px - entry_px) - entry_fee - fee
+                tr_reason[n_trades] = reason
+                n_trades += 1
+                units = 0.0
+                side = 0.0
+
+        if not do_fill and target[i] != acted:
+            acted = target[i]
+            kind = order_type[i]
+            price = order_price[i]
+            if kind != 0 and math.isnan(price):
+                kind = 0
+            if kind == 0 and not next_open:
+                do_fill, fill_target, fill_raw, fill_slip = True, acted, close[i], slippage
+            else:
+                pending, pend_target, pend_type, pend_price = True, acted, kind, price
+
+        if do_fill:
+            new_side = 0.0 if fill_target == 0.0 else math.copysign(1.0, fill_target)
+            if side != 0.0 and fill_target != side:
+                px = _fill_price(fill_raw, -side, half_spread, fill_slip)
+                fee = commission * abs(units) * px
+                cash += units * px - fee
+                tr_entry_bar[n_trades] = entry_bar
+                tr_exit_bar[n_trades] = i
+                tr_side[n_trades] = side
+                tr_qty[n_trades] = abs(units)
+                tr_entry_px[n_trades] = entry_px
+                tr_exit_px[n_trades] = px
+                tr_pnl[n_trades] = units * (px - entry_px) - entry_fee - fee
+                tr_reason[n_trades] = 0
+                n_trades += 1
+                units = 0.0
+                side = 0.0
+            if new_side != 0.0 and side == 0.0:
+                px = _fill_price(fill_raw, new_side, half_spread, fill_slip)
+                qty = cash * abs(fill_target) / (px * (1.0 + commission))
+                entry_fee = commission * qty * px
+                units = new_side * qty
+                cash -= units * px + entry_fee
+                side = new_side
+                entry_px = px
+                entry_bar = i
+
+        equity[i] = cash + units * close[i]
+
+    if side != 0.0:
+        tr_entry_bar[n_trades] = entry_bar
+        tr_exit_bar[n_trades] = n - 1
+        tr_side[n_trades] = side
+        tr_qty[n_trades] = abs(units)
+        tr_entry_px[n_trades] = entry_px
+        tr_exit_px[n_trades] = close[n - 1]
+        tr_pnl[n_trades] = units * (close[n - 1] - entry_px) - entry_fee
+        tr_reason[n_trades] = 3
+        n_trades += 1
+
+    return (
+        equity,
+        tr_entry_bar[:n_trades],
+        tr_exit_bar[:n_trades],
+        tr_side[:n_trades],
+        tr_qty[:n_trades],
+        tr_entry_px[:n_trades],
+        tr_exit_px[:n_trades],
+        tr_pnl[:n_trades],
+        tr_reason[:n_trades],
+    )
+
+
+_UNCOMPILED = object()
+_fill_price_compiled: Any = _UNCOMPILED
+_simulate_compiled: Any = _UNCOMPILED
+
+
+def _compiled_kernel() -> Any:
+    """``_simulate`` compiled with numba, or ``None`` without it; numba is imported on first call."""
+
+    global _fill_price_compiled, _simulate_compiled
+    if _simulate_compiled is _UNCOMPILED:
+        try:  # pragma: no cover - optional accelerator
+            from numba import njit
+        except ImportError:  # pragma: no cover
+            _fill_price_compiled = _simulate_compiled = None
+        else:
+            _fill_price_compiled = njit(cache=True)(_fill_price)
+            # Same code object, but resolving ``_fill_price`` to the compiled helper.
+            _simulate_compiled = njit(cache=True)(
+                types.FunctionType(_simulate.__code__, {**globals(), "_fill_price": _fill_price_compiled}, "_simulate")
+            )
+    return _simulate_compiled
+
+
+@dataclass(slots=True)
+class EventDrivenBacktester:
+    """Replay bars through market/limit/stop orders with SL/TP, spread, and slippage.
+
+    ``signals`` needs ``open/high/low/close`` plus a target ``position`` column
+    (fraction of equity, sign = direction). Optional columns:
+
+    - ``order_type``: ``"market"`` (default), ``"limit"`` or ``"stop"`` per bar
+    - ``order_price``: trigger/limit price for non-market orders
+    - ``spread``: quoted spread in price units, overriding ``spread``
+
+    Market orders fill at the signal bar's close (matching the vectorized
+    engine) or at the next open with ``fill_on="next_open"``. Pending
+    limit/stop orders work from the next bar and are replaced when the target
+    changes. The inner loop is compiled with numba when it is installed.
+    """
+
+    initial_capital: float | None = None
+    spread: float = 0.0
+    slippage_bps: float | None = None
+    commission_perc: float | None = None
+    stop_loss_pct: float = 0.0
+    take_profit_pct: float = 0.0
+    fill_on: str = "close"
+    use_numba: bool = True
+    periods_per_year: float | None = None  # inferred from the bar index when None
+
+    @traced(rows_arg="signals")
+    def run(self, signals: pd.DataFrame) -> BacktestResult:
+        if self.fill_on not in {"close", "next_open"}:
+            raise ValueError(f"Unknown fill_on {self.fill_on!r}")
+        cfg = settings.backtest
+        capital = float(self.initial_capital or cfg.initial_capital)
+        slippage = (cfg.slippage_bps if self.slippage_bps is None else self.slippage_bps) / 10_000
+        commission = cfg.commission_perc if self.commission_perc is None else self.commission_perc
+
+        n = len(signals)
+        close = signals["close"].to_numpy(dtype=np.float64)
+        open_ = signals["open"].to_numpy(dtype=np.float64) if "open" in signals else close
+        high = signals["high"].to_numpy(dtype=np.float64) if "high" in signals else close
+        low = signals["low"].to_numpy(dtype=np.float64) if "low" in signals else close
+        target = signals["position"].fillna(0).to_numpy(dtype=np.float64)
+        if "order_type" in signals:
+            order_type = signals["order_type"].map(ORDER_TYPES).fillna(0).to_numpy(dtype=np.int64)
+        else:
+            order_type = np.zeros(n, dtype=np.int64)
+        order_price = (
+            signals["order_price"].to_numpy(dtype=np.float64) if "order_price" in signals else np.full(n, np.nan)
+        )
+        spread = (
+            signals["spread"].fillna(self.spread).to_numpy(dtype=np.float64)
+            if "spread" in signals
+            else np.full(n, float(self.spread))
+        )
+
+        arrays = (open_, high, low, close, target, order_type, order_price, spread)
+        params = (capital, slippage, commission, self.stop_loss_pct, self.take_profit_pct, self.fill_on == "next_open")
+        kernel = _compiled_kernel() if self.use_numba else None
+        if kernel is not None:
+            out = kernel(*arrays, *params)
+        else:
+            out = _simulate(*(a.tolist() for a in arrays), *params)
+
+        equity_values, entry_bar, exit_bar, side, qty, entry_px, exit_px, pnl, reason = out
+        index = signals.index
+        equity = pd.Series(equity_values, index=index, name="equity")
+        trades = pd.DataFrame(
+            {
+                "entry_time": index[entry_bar],
+                "exit_time": index[exit_bar],
+                "side": side.astype(np.int8),
+                "quantity": qty,
+                "entry_price": entry_px,
+                "exit_price": exit_px,
+                "pnl": pnl,
+                "return": pnl / (qty * entry_px),
+                "bars_held": exit_bar - entry_bar,
+                "exit_reason": np.asarray(EXIT_REASONS, dtype=object)[reason],
+            }
+        )
+        returns = equity.pct_change().fillna(equity.iloc[0] / capital - 1)
+        stats = curve_metrics(returns, self.periods_per_year or infer_periods_per_year(index))
+        return BacktestResult(equity_curve=equity, trades=trades, stats=stats)
@@ -0,0 +1,361 @@
+"""Vectorized performance metrics for one or many return curves.
+
+``compute_metrics`` scores a ``(bars, curves)`` matrix of simple returns in a
+single pass, so a sweep with tens of thousands of parameter combinations is
+scored with a handful of NumPy reductions instead of one pandas pipeline per
+curve. Annualization uses ``infer_periods_per_year``, which derives the
+number of bars per year from the bar spacing and the trading-session calendar.
+"""
+
+from __future__ import annotations
+
+import math
+import warnings
+from typing import Any, Optional
+
+import numpy as np
+import pandas as pd
+
+from goldbot.config import settings
+from goldbot.data.sessions import NS_PER_MINUTE, SessionCalendar
+
+TRADING_DAYS_PER_YEAR = 252
+DAYS_PER_YEAR = 365.25
+NS_PER_DAY = 1_440 * NS_PER_MINUTE
+# 1970-01-05 00:00 UTC was a Monday.
+_REFERENCE_MONDAY_NS = 4 * NS_PER_DAY
+
+METRIC_NAMES = (
+    "total_return",
+    "cagr",
+    "volatility",
+    "sharpe",
+    "sortino",
+    "max_drawdown",
+    "calmar",
+    "ulcer_index",
+    "max_drawdown_duration",
+    "hit_rate",
+    "exposure",
+    "rolling_sharpe_min",
+    "rolling_sharpe_median",
+)
+
+
+def bar_step_ns(index: pd.Index) -> Optional[int]:
+    """Median spacing of a datetime index in nanoseconds (``None`` if it cannot be told)."""
+
+    if not isinstance(index, pd.DatetimeIndex) or len(index) < 2:
+        return None
+    steps = np.diff(index.asi8)
+    steps = steps[steps > 0]
+    return int(np.median(steps)) if steps.size else None
+
+
+def infer_periods_per_year(index: pd.Index, calendar: Optional[SessionCalendar] = None) -> float:
+    """Bars per year implied by the spacing of ``index`` and the trading sessions.
+
+    Intraday bars are counted over one reference week of ``calendar`` (a bar
+    counts when any part of it trades), so 1h XAUUSD bars give about 6,000
+    periods per year rather than 252 or 8,766. Daily-to-weekly bars use
+    ``TRADING_DAYS_PER_YEAR``; coarser bars use calendar time. Falls back to
+    ``TRADING_DAYS_PER_YEAR`` when the index carries no usable timestamps.
+    """
+
+    step = bar_step_ns(index)
+    if step is None:
+        return float(TRADING_DAYS_PER_YEAR)
+    if step >= 7 * NS_PER_DAY:
+        return DAYS_PER_YEAR * NS_PER_DAY / step
+    if step >= NS_PER_DAY:
+        return TRADING_DAYS_PER_YEAR * NS_PER_DAY / step
+    calendar = calendar or SessionCalendar()
+    week = np.arange(_REFERENCE_MONDAY_NS, _REFERENCE_MONDAY_NS + 7 * NS_PER_DAY, step, dtype=np.int64)
+    open_bars = int(np.count_nonzero(calendar.bar_closure(week, step) == 0))
+    return open_bars * DAYS_PER_YEAR / 7
+
+
+def default_rolling_window(periods_per_year: float) -> int:
+    """About one quarter of bars."""
+
+    return max(2, int(round(periods_per_year / 4)))
+
+
+def rolling_sharpe(
+    returns: np.ndarray,
+    window: int,
+    periods_per_year: float,
+    risk_free_rate: Optional[float] = None,
+) -> np.ndarray:
+    """Annualized Sharpe over trailing ``window`` bars for each column of ``(bars, curves)``.
+
+    Rows before the first full window are NaN. Uses running sums, so the cost
+    does not grow with ``window``.
+    """
+
+    r = np.asarray(returns, dtype=np.float64)
+    squeeze = r.ndim == 1
+    if squeeze:
+        r = r[:, None]
+    rf = settings.backtest.risk_free_rate if risk_free_rate is None else risk_free_rate
+    out = np.full(r.shape, np.nan)
+    if window < 2 or r.shape[0] < window:
+        return out[:, 0] if squeeze else out
+    sums = np.zeros((r.shape[0] + 1, r.shape[1]))
+    np.cumsum(r, axis=0, out=sums[1:])
+    mean = (sums[window:] - sums[:-window]) / window
+    np.cumsum(np.square(r), axis=0, out=sums[1:])
+    var = sums[window:] - sums[:-window]
+    var -= window * np.square(mean)
+    var *= periods_per_year / (window - 1)
+    del sums
+    vol = np.sqrt(np.maximum(var, 0.0, out=var), out=var)
+    vol[vol < 1e-12] = np.nan
+    mean *= periods_per_year
+    mean -= rf
+    np.divide(mean, vol, out=out[window - 1 :])
+    return out[:, 0] if squeeze else out
+
+
+def _score_curves(returns, positions, periods_per_year, rf, window):
+    """One loop over each ``(curves, bars)`` row producing every metric in ``METRIC_NAMES`` order."""
+
+    n_curves, n_bars = returns.shape
+    has_positions = positions.shape[0] == n_curves
+    out = np.empty((n_curves, 13))
+    root_periods = math.sqrt(periods_per_year)
+    for c in range(n_curves):
+        r = returns[c]
+        mean = 0.0
+        m2 = 0.0
+        loss_sq = 0.0
+        equity = 1.0
+        peak = -math.inf
+        last_peak = 0
+        duration = 0
+        max_dd = 0.0
+        dd_sq = 0.0
+        n_active = 0
+        hits = 0
+        roll_sum = 0.0
+        roll_sq = 0.0
+        rolling = np.empty(n_bars - window + 1 if window else 0)
+        n_rolling = 0
+        for i in range(n_bars):
+            x = r[i]
+            delta = x - mean
+            mean += delta / (i + 1)
+            m2 += delta * (x - mean)
+            if x < 0:
+                loss_sq += x * x
+            equity *= 1.0 + x
+            if equity >= peak:
+                peak = equity
+                last_peak = i
+            elif i - last_peak > duration:
+                duration = i - last_peak
+            dd = equity / peak - 1.0
+            dd_sq += dd * dd
+            if dd < max_dd:
+                max_dd = dd
+            active = positions[c, i] != 0 if has_positions else x != 0
+            if active:
+                n_active += 1
+                if x > 0:
+                    hits += 1
+            if window >= 2:
+                roll_sum += x
+                roll_sq += x * x
+                if i >= window:
+                    old = r[i - window]
+                    roll_sum -= old
+                    roll_sq -= old * old
+                if i >= window - 1:
+                    w_mean = roll_sum / window
+                    var = (roll_sq - roll_sum * w_mean) * periods_per_year / (window - 1)
+                    vol_w = math.sqrt(var) if var > 0 else 0.0
+                    if vol_w >= 1e-12:
+                        rolling[n_rolling] = (w_mean * periods_per_year - rf) / vol_w
+                        n_rolling += 1
+
+        excess = mean * periods_per_year - rf
+        vol = math.sqrt(m2 / (n_bars - 1)) * root_periods
+        downside = math.sqrt(loss_sq / n_bars) * root_periods
+        cagr = equity ** (periods_per_year / n_bars) - 1.0 if equity >= 0 else math.nan
+        row = out[c]
+        row[0] = equity - 1.0
+        row[1] = cagr
+        row[2] = vol
+        row[3] = excess / (vol if vol != 0 else 1e-9)
+        row[4] = excess / (downside if downside != 0 else 1e-9)
+        row[5] = max_dd
+        row[6] = cagr / -max_dd if max_dd < 0 else math.nan
+        row[7] = math.sqrt(dd_sq / n_bars)
+        row[8] = duration
+        row[9] = hits / n_active if n_active else math.nan
+        row[10] = n_active / n_bars
+        if n_rolling:
+            row[11] = rolling[:n_rolling].min()
+            row[12] = np.median(rolling[:n_rolling])
+        else:
+            row[11] = math.nan
+            row[12] = math.nan
+    return out
+
+
+_UNCOMPILED = object()
+_score_curves_compiled: Any = _UNCOMPILED
+
+
+def _compiled_scorer() -> Any:
+    """``_score_curves`` compiled with numba, or ``None`` without it; numba is imported on first call."""
+
+    global _score_curves_compiled
+    if _score_curves_compiled is _UNCOMPILED:
+        try:  # pragma: no cover - optional accelerator
+            from numba import njit
+        except ImportError:  # pragma: no cover
+            _score_curves_compiled = None
+        else:
+            _score_curves_compiled = njit(cache=True)(_score_curves)
+    return _score_curves_compiled
+
+
+def compute_metrics(
+    returns: np.ndarray,
+    periods_per_year: float = TRADING_DAYS_PER_YEAR,
+    positions: Optional[np.ndarray] = None,
+    risk_free_rate: Optional[float] = None,
+    rolling_window: Optional[int] = None,
+    use_numba: bool = True,
+) -> dict[str, np.ndarray]:
+    """Score every column of a ``(bars, curves)`` return matrix; returns one array per metric.
+
+    ``positions`` (same shape, the position held over each bar's return)
+    defines active bars for ``exposure`` and ``hit_rate``; without it a bar
+    is active when its return is non-zero. Drawdown metrics are fractions
+    of the running peak (``ulcer_index`` is their root mean square) and
+    ``max_drawdown_duration`` counts bars spent below a previous peak.
+    Rolling Sharpe uses ``rolling_window`` bars (about a quarter by default);
+    ``rolling_window=0`` skips it. With numba installed every curve is scored
+    in one compiled loop; otherwise with whole-matrix NumPy passes.
+    """
+
+    r = np.asarray(returns, dtype=np.float64)
+    if r.ndim == 1:
+        r = r[:, None]
+    if r.shape[0] < 2:
+        raise ValueError("Need at least two bars to compute metrics.")
+    if positions is not None:
+        positions = np.asarray(positions).reshape(r.shape)
+    rf = settings.backtest.risk_free_rate if risk_free_rate is None else risk_free_rate
+    window = default_rolling_window(periods_per_year) if rolling_window is None else rolling_window
+    window = window if 2 <= window <= r.shape[0] else 0
+
+    scorer = _compiled_scorer() if use_numba else None
+    if scorer is not None:
+        held = np.empty((0, 0), dtype=np.int8) if positions is None else np.ascontiguousarray(positions.T)
+        scored = scorer(np.ascontiguousarray(r.T), held, float(periods_per_year), float(rf), window)
+        return {name: scored[:, k] for k, name in enumerate(METRIC_NAMES)}
+    return _score_matrix(r, positions, periods_per_year, rf, window)
+
+
+def _score_matrix(
+    r: np.ndarray,
+    positions: Optional[np.ndarray],
+    periods_per_year: float,
+    rf: float,
+    window: int,
+) -> dict[str, np.ndarray]:
+    n_bars = r.shape[0]
+    root_periods = np.sqrt(periods_per_year)
+
+    excess = r.mean(axis=0) * periods_per_year - rf
+    vol = r.std(axis=0, ddof=1) * root_periods
+    losses = np.minimum(r, 0.0)
+    downside = np.sqrt(np.mean(np.square(losses, out=losses), axis=0)) * root_periods
+    del losses
+
+    equity = np.cumprod(1.0 + r, axis=0)
+    final = equity[-1].copy()
+    peaks = np.maximum.accumulate(equity, axis=0)
+    bars = np.arange(n_bars, dtype=np.int32)[:, None]
+    last_peak = np.where(equity >= peaks, bars, np.int32(0))
+    np.maximum.accumulate(last_peak, axis=0, out=last_peak)
+    np.subtract(bars, last_peak, out=last_peak)
+    duration = last_peak.max(axis=0)
+    del last_peak
+    drawdown = np.divide(equity, peaks, out=equity)
+    drawdown -= 1.0
+    del peaks
+    max_dd = drawdown.min(axis=0)
+    ulcer = np.sqrt(np.mean(np.square(drawdown, out=drawdown), axis=0))
+    del drawdown
+
+    active = (positions if positions is not None else r) != 0
+    n_active = active.sum(axis=0)
+    hits = np.count_nonzero(active & (r > 0), axis=0)
+
+    if window:
+        rolling = rolling_sharpe(r, window, periods_per_year, rf)[window - 1 :]
+        with np.errstate(invalid="ignore"), warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)  # all-NaN columns (flat curves)
+            rolling_min = np.nanmin(rolling, axis=0)
+            rolling_median = np.nanmedian(rolling, axis=0)
+        del rolling
+    else:
+        rolling_min = rolling_median = np.full(r.shape[1], np.nan)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        cagr = final ** (periods_per_year / n_bars) - 1
+        metrics = {
+            "total_return": final - 1,
+            "cagr": cagr,
+            "volatility": vol,
+            "sharpe": excess / np.where(vol == 0, 1e-9, vol),
+            "sortino": excess / np.where(downside == 0, 1e-9, downside),
+            "max_drawdown": max_dd,
+            "calmar": np.where(max_dd < 0, cagr / np.abs(max_dd), np.nan),
+            "ulcer_index": ulcer,
+            "max_drawdown_duration": duration.astype(np.float64),
+            "hit_rate": np.where(n_active > 0, hits / np.maximum(n_active, 1), np.nan),
+            "exposure": n_active / n_bars,
+            "rolling_sharpe_min": rolling_min,
+            "rolling_sharpe_median": rolling_median,
+        }
+    return metrics
+
+
+def curve_metrics(
+    returns: pd.Series | np.ndarray,
+    periods_per_year: Optional[float] = None,
+    positions: Optional[np.ndarray] = None,
+    **kwargs,
+) -> dict[str, float]:
+    """``compute_metrics`` for a single curve; infers periods per year from a Series index."""
+
+    if periods_per_year is None:
+        index = returns.index if isinstance(returns, pd.Series) else None
+        periods_per_year = infer_periods_per_year(index) if index is not None else TRADING_DAYS_PER_YEAR
+    values = returns.to_numpy(dtype=np.float64) if isinstance(returns, pd.Series) else returns
+    scored = compute_metrics(values, periods_per_year, positions=positions, **kwargs)
+    return {name: float(value[0]) for name, value in scored.items()}
+
+
+def metrics_frame(
+    returns: pd.DataFrame,
+    periods_per_year: Optional[float] = None,
+    positions: Optional[pd.DataFrame] = None,
+    **kwargs,
+) -> pd.DataFrame:
+    """One row of metrics per column of a returns frame."""
+
+    if periods_per_year is None:
+        periods_per_year = infer_periods_per_year(returns.index)
+    scored = compute_metrics(
+        returns.to_numpy(dtype=np.float64),
+        periods_per_year,
+        positions=positions.to_numpy() if positions is not None else None,
+        **kwargs,
+    )
+    return pd.DataFrame(scored, index=returns.columns)
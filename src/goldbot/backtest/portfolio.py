@@ -0,0 +1,219 @@
+"""Run many strategies over one shared feature frame and combine them into a portfolio."""
+
+from __future__ import annotations
+
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import Mapping, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from goldbot.backtest.metrics import metrics_frame
+from goldbot.config import settings
+from goldbot.data import load_cached_prices
+from goldbot.features import engineer_feature_set
+from goldbot.strategies import parse_strategy_spec, strategy_label
+from goldbot.strategies.base import BaseStrategy, lag_signal
+from goldbot.utils.logging import configure_logging
+from goldbot.utils.tracing import traced
+
+ALLOCATIONS = ("equal", "inverse_vol", "fixed")
+
+
+@dataclass(frozen=True, slots=True)
+class _SharedFrame:
+    """Numeric feature matrix in shared memory plus what is needed to rebuild the frame."""
+
+    name: str
+    shape: tuple[int, int]
+    columns: tuple[str, ...]
+    index: np.ndarray  # int64 ns
+    tz: Optional[str]
+
+    @classmethod
+    def create(cls, features: pd.DataFrame) -> tuple[_SharedFrame, shared_memory.SharedMemory]:
+        values = features.to_numpy(dtype=np.float64)
+        shm = shared_memory.SharedMemory(create=True, size=max(values.nbytes, 1))
+        np.ndarray(values.shape, dtype=np.float64, buffer=shm.buf)[:] = values
+        index = features.index
+        tz = str(index.tz) if getattr(index, "tz", None) is not None else None
+        return cls(shm.name, values.shape, tuple(features.columns), index.asi8, tz), shm
+
+    def attach(self) -> tuple[np.ndarray, shared_memory.SharedMemory]:
+        shm = shared_memory.SharedMemory(name=self.name)
+        return np.ndarray(self.shape, dtype=np.float64, buffer=shm.buf), shm
+
+    def datetime_index(self) -> pd.DatetimeIndex:
+        index = pd.DatetimeIndex(self.index)
+        return index if self.tz is None else index.tz_localize("UTC").tz_convert(self.tz)
+
+
+def _read_only_view(values: np.ndarray, columns: Sequence[str], index: pd.Index) -> pd.DataFrame:
+    """Wrap ``values`` as a DataFrame without copying; writes to the buffer raise."""
+
+    values = values.view()
+    values.flags.writeable = False
+    return pd.DataFrame(values, index=index, columns=list(columns), copy=False)
+
+
+_WORKER: dict[str, object] = {}
+
+
+def _attach_worker(shared: _SharedFrame) -> None:
+    values, shm = shared.attach()
+    _WORKER.update(values=values, shm=shm, columns=shared.columns, index=shared.datetime_index())
+
+
+def _worker_positions(strategy: BaseStrategy) -> np.ndarray:
+    view = _read_only_view(_WORKER["values"], _WORKER["columns"], _WORKER["index"])
+    return strategy.positions(view)
+
+
+@dataclass(slots=True)
+class PortfolioResult:
+    positions: pd.DataFrame  # per-strategy int8 position on each bar
+    returns: pd.DataFrame  # per-strategy net returns
+    weights: pd.DataFrame  # capital share of each strategy on each bar
+    portfolio_returns: pd.Series
+    equity_curve: pd.Series
+    stats: pd.DataFrame  # one row per strategy plus "portfolio"
+
+
+@dataclass(slots=True)
+class PortfolioBacktester:
+    """Evaluate strategies side by side on the same features and allocate capital across them.
+
+    Features are computed once (or passed in). Each strategy receives a
+    read-only DataFrame view over one shared float64 matrix instead of its own
+    copy; with ``max_workers != 1`` the matrix sits in shared memory that every
+    worker process attaches to once. Per-strategy returns follow
+    ``VectorizedBacktester.run_arrays`` and are combined with one of ``ALLOCATIONS``:
+
+    * ``equal``: ``1 / n`` of capital each.
+    * ``inverse_vol``: weights proportional to ``1 / vol`` over the trailing
+      ``vol_window`` bars, using only information before each bar.
+    * ``fixed``: ``weights`` mapping of strategy label (or name) to weight,
+      normalised to sum to one.
+    """
+
+    strategies: Sequence[BaseStrategy]
+    allocation: str = "equal"
+    weights: Optional[Mapping[str, float]] = None
+    vol_window: int = 500
+    max_workers: Optional[int] = None
+    initial_capital: Optional[float] = None
+    periods_per_year: Optional[float] = None  # inferred from the feature index when None
+
+    @traced(rows_arg="prices")
+    def run(self, prices: pd.DataFrame, features: Optional[pd.DataFrame] = None) -> PortfolioResult:
+        if self.allocation not in ALLOCATIONS:
+            raise ValueError(f"Unknown allocation {self.allocation!r}; choose from {ALLOCATIONS}")
+        if not self.strategies:
+            raise ValueError("PortfolioBacktester needs at least one strategy.")
+        labels = [strategy_label(s) for s in self.strategies]
+        if len(set(labels)) != len(labels):
+            raise ValueError(f"Duplicate strategy configurations: {labels}")
+
+        features = engineer_feature_set(prices) if features is None else features
+        numeric = features.select_dtypes("number")
+        positions = pd.DataFrame(
+            np.column_stack(self._positions(numeric)), index=numeric.index, columns=labels
+        )
+
+        close = numeric["close"].to_numpy()
+        returns = np.zeros_like(close)
+        returns[1:] = close[1:] / close[:-1] - 1.0
+        held = lag_signal(positions.to_numpy()).astype(np.float64)
+        strategy_returns = held * returns[:, None] - settings.backtest.commission_perc * np.abs(returns)[:, None]
+        strategy_returns = pd.DataFrame(strategy_returns, index=numeric.index, columns=labels)
+
+        weights = self._weights(strategy_returns)
+        portfolio_returns = (weights * strategy_returns).sum(axis=1).rename("portfolio")
+        capital = self.initial_capital or settings.backtest.initial_capital
+        equity = ((1 + portfolio_returns).cumprod() * capital).rename("equity")
+
+        curves = pd.concat([strategy_returns, portfolio_returns], axis=1)
+        exposure = np.column_stack([held, (weights.to_numpy() * np.abs(held)).sum(axis=1)])
+        stats = metrics_frame(curves, self.periods_per_year, positions=pd.DataFrame(exposure, index=curves.index))
+        return PortfolioResult(
+            positions=positions,
+            returns=strategy_returns,
+            weights=weights,
+            portfolio_returns=portfolio_returns,
+            equity_curve=equity,
+            stats=stats,
+        )
+
+    def _positions(self, numeric: pd.DataFrame) -> list[np.ndarray]:
+        if self.max_workers == 1 or len(self.strategies) == 1:
+            values = np.ascontiguousarray(numeric.to_numpy(dtype=np.float64))
+            return [s.positions(_read_only_view(values, numeric.columns, numeric.index)) for s in self.strategies]
+        shared, shm = _SharedFrame.create(numeric)
+        try:
+            with ProcessPoolExecutor(
+                max_workers=self.max_workers, initializer=_attach_worker, initargs=(shared,)
+            ) as pool:
+                return list(pool.map(_worker_positions, self.strategies))
+        finally:
+            shm.close()
+            shm.unlink()
+
+    def _weights(self, strategy_returns: pd.DataFrame) -> pd.DataFrame:
+        n = strategy_returns.shape[1]
+        if self.allocation == "equal":
+            return pd.DataFrame(1.0 / n, index=strategy_returns.index, columns=strategy_returns.columns)
+        if self.allocation == "fixed":
+            if not self.weights:
+                raise ValueError("allocation='fixed' needs a weights mapping")
+            raw = np.array(
+                [
+                    self.weights.get(label, self.weights.get(s.name, 0.0))
+                    for label, s in zip(strategy_returns.columns, self.strategies)
+                ],
+                dtype=np.float64,
+            )
+            if raw.sum() <= 0:
+                raise ValueError("Fixed weights must sum to a positive number")
+            return pd.DataFrame(
+                np.broadcast_to(raw / raw.sum(), strategy_returns.shape).copy(),
+                index=strategy_returns.index,
+                columns=strategy_returns.columns,
+            )
+        vol = strategy_returns.rolling(self.vol_window, min_periods=20).std().shift(1)
+        inverse = 1.0 / vol.where(vol > 0)
+        weights = inverse.div(inverse.sum(axis=1), axis=0)
+        # Before enough history (or when every strategy is flat) fall back to equal weights.
+        return weights.where(weights.notna().any(axis=1), other=1.0 / n, axis=0).fillna(0.0)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Backtest several strategies as one portfolio on cached data")
+    parser.add_argument("--symbol", default="XAUUSD")
+    parser.add_argument("--timeframe", default="1h")
+    parser.add_argument(
+        "--strategy",
+        action="append",
+        help="name[:key=value,...]; repeat for each strategy (default: one of each registered strategy)",
+    )
+    parser.add_argument("--allocation", choices=ALLOCATIONS, default="equal")
+    parser.add_argument("--vol-window", type=int, default=500)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    configure_logging()
+    specs = args.strategy or ["dual_ma_trend", "donchian_breakout", "bollinger_reversion"]
+    runner = PortfolioBacktester(
+        strategies=[parse_strategy_spec(spec) for spec in specs],
+        allocation=args.allocation,
+        vol_window=args.vol_window,
+        max_workers=args.workers,
+    )
+    result = runner.run(load_cached_prices(symbol=args.symbol, timeframe=args.timeframe))
+    print(result.stats.to_string())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""Batched parameter sweeps for the dual moving-average strategy."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from itertools import product
+from typing import Iterable
+
+import numpy as np
+import pandas as pd
+
+from goldbot.backtest.metrics import compute_metrics, infer_periods_per_year
+from goldbot.config import settings
+from goldbot.utils.tracing import traced
+
+
+def ma_grid(fast_windows: Iterable[int], slow_windows: Iterable[int]) -> np.ndarray:
+    """Return ``(n_combos, 2)`` array of valid ``fast < slow`` window pairs."""
+
+    pairs = [(f, s) for f, s in product(sorted(set(fast_windows)), sorted(set(slow_windows))) if f < s]
+    if not pairs:
+        raise ValueError("Parameter grid is empty; need at least one fast < slow pair.")
+    return np.asarray(pairs, dtype=np.int64)
+
+
+def rolling_means(close: np.ndarray, windows: Iterable[int]) -> tuple[np.ndarray, np.ndarray]:
+    """Compute each distinct SMA window once.
+
+    Returns the sorted window lengths and a ``(n_windows, bars)`` matrix whose
+    rows line up with them.
+    """
+
+    series = pd.Series(close, copy=False)
+    unique = np.unique(np.asarray(list(windows), dtype=np.int64))
+    matrix = np.empty((unique.size, close.size), dtype=np.float64)
+    for row, window in enumerate(unique):
+        matrix[row] = series.rolling(int(window)).mean().to_numpy()
+    return unique, matrix
+
+
+def ma_positions(fast_sma: np.ndarray, slow_sma: np.ndarray) -> np.ndarray:
+    """int8 position held over each bar's return for SMA pairs laid out with bars on the last axis.
+
+    Mirrors ``DualMovingAverageStrategy.positions`` followed by
+    ``VectorizedBacktester.run_arrays``: the crossover signal is lagged once into a
+    position and the position is lagged again when applied to returns.
+    """
+
+    # NaN comparisons are False, so warm-up bars stay flat like the strategy.
+    signal = np.greater(fast_sma, slow_sma).astype(np.int8) - np.less(fast_sma, slow_sma)
+    held = np.zeros(signal.shape, dtype=np.int8)
+    held[..., 2:] = signal[..., :-2]
+    return held
+
+
+def returns_from_positions(close: np.ndarray, held: np.ndarray, commission: float) -> np.ndarray:
+    """Per-bar net returns of ``held`` positions (bars on the last axis) over ``close``."""
+
+    returns = np.zeros_like(close, dtype=np.float64)
+    returns[1:] = close[1:] / close[:-1] - 1.0
+    strategy_ret = held.astype(np.float64)
+    strategy_ret *= returns
+    strategy_ret -= commission * np.abs(returns)
+    return strategy_ret
+
+
+def ma_strategy_returns(
+    close: np.ndarray,
+    fast_sma: np.ndarray,
+    slow_sma: np.ndarray,
+    commission: float,
+) -> np.ndarray:
+    """Per-bar strategy returns for SMA pairs laid out with bars on the last axis."""
+
+    return returns_from_positions(close, ma_positions(fast_sma, slow_sma), commission)
+
+
+@dataclass(slots=True)
+class MovingAverageSweep:
+    """Evaluate a fast/slow SMA grid in chunked ``(combos x bars)`` blocks.
+
+    Every distinct window is rolled once and shared by all combos that use it;
+    ``chunk_size`` caps how many combos are materialized at the same time.
+    Each block is scored with ``compute_metrics`` in one pass; the annualization
+    factor is inferred from the price index unless ``periods_per_year`` is set.
+    """
+
+    chunk_size: int = 64
+    periods_per_year: float | None = None
+    commission: float | None = None
+
+    @traced(rows_arg="prices")
+    def run(
+        self,
+        prices: pd.DataFrame | pd.Series,
+        fast_windows: Iterable[int],
+        slow_windows: Iterable[int],
+    ) -> pd.DataFrame:
+        """Return one stats row per ``(fast, slow)`` combo."""
+
+        close_series = prices["close"] if isinstance(prices, pd.DataFrame) else prices
+        close = close_series.to_numpy(dtype=np.float64)
+        if close.size < 2:
+            raise ValueError("Need at least two bars to run a sweep.")
+
+        grid = ma_grid(fast_windows, slow_windows)
+        windows, smas = rolling_means(close, grid.ravel())
+        fast_rows = np.searchsorted(windows, grid[:, 0])
+        slow_rows = np.searchsorted(windows, grid[:, 1])
+        commission = settings.backtest.commission_perc if self.commission is None else self.commission
+        periods = self.periods_per_year or infer_periods_per_year(close_series.index)
+
+        frames: list[pd.DataFrame] = []
+        for start in range(0, len(grid), self.chunk_size):
+            block = slice(start, start + self.chunk_size)
+            held = ma_positions(smas[fast_rows[block]], smas[slow_rows[block]])
+            strategy_ret = returns_from_positions(close, held, commission)
+            stats = compute_metrics(strategy_ret.T, periods, positions=held.T)
+            frames.append(pd.DataFrame({"fast": grid[block, 0], "slow": grid[block, 1], **stats}))
+        return pd.concat(frames, ignore_index=True)
@@ -0,0 +1,110 @@
+"""Vectorized round-trip trade reconstruction from position series."""
+
+from __future__ import annotations
+
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+LEDGER_COLUMNS = [
+    "entry_time",
+    "exit_time",
+    "side",
+    "size",
+    "entry_price",
+    "exit_price",
+    "gross_return",
+    "net_return",
+    "gross_pnl",
+    "net_pnl",
+    "bars_held",
+    "mae",
+    "mfe",
+    "is_open",
+]
+
+
+def _segment_reduce(ufunc: np.ufunc, values: np.ndarray, starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    """Apply ``ufunc.reduceat`` over disjoint ``[start, end)`` spans in one call."""
+
+    padded = np.append(values, values[-1])
+    bounds = np.column_stack([starts, ends]).ravel()
+    return ufunc.reduceat(padded, bounds)[::2]
+
+
+def build_trade_ledger(
+    index: pd.Index,
+    close: np.ndarray,
+    position: np.ndarray,
+    high: Optional[np.ndarray] = None,
+    low: Optional[np.ndarray] = None,
+    commission: float = 0.0,
+) -> pd.DataFrame:
+    """Pair entries with exits using run-length encoding of ``position``.
+
+    A position value at bar ``t`` is held from ``close[t]`` onward (the
+    ``VectorizedBacktester`` convention), so a run of equal non-zero positions
+    ``[s, e)`` is one round trip entered at ``close[s]`` and exited at
+    ``close[e]``. Reversals split into an exit and a new entry on the same bar.
+    Runs still open on the last bar are marked ``is_open`` and valued at the
+    final close. MAE/MFE are fractional excursions from the entry price using
+    ``high``/``low`` (falling back to ``close``) over bars ``(s, exit]``.
+    """
+
+    close = np.asarray(close, dtype=np.float64)
+    pos = np.nan_to_num(np.asarray(position, dtype=np.float64), nan=0.0)
+    n = close.size
+    if n == 0:
+        return pd.DataFrame(columns=LEDGER_COLUMNS)
+
+    changes = np.flatnonzero(pos[1:] != pos[:-1]) + 1
+    run_starts = np.concatenate(([0], changes))
+    run_ends = np.concatenate((changes, [n]))
+    run_values = pos[run_starts]
+    held = run_values != 0
+    entry_bar = run_starts[held]
+    is_open = run_ends[held] == n
+    exit_bar = np.where(is_open, n - 1, run_ends[held])
+    values = run_values[held]
+    if entry_bar.size == 0:
+        return pd.DataFrame(columns=LEDGER_COLUMNS)
+
+    side = np.sign(values)
+    size = np.abs(values)
+    entry_price = close[entry_bar]
+    exit_price = close[exit_bar]
+    move = exit_price / entry_price - 1.0
+    gross_return = side * size * move
+    fees = commission * size * np.where(is_open, 1.0, 2.0)
+
+    highs = close if high is None else np.asarray(high, dtype=np.float64)
+    lows = close if low is None else np.asarray(low, dtype=np.float64)
+    span_start = np.minimum(entry_bar + 1, n)
+    span_end = exit_bar + 1
+    empty = span_start >= span_end
+    max_high = np.where(empty, entry_price, _segment_reduce(np.maximum, highs, span_start, span_end))
+    min_low = np.where(empty, entry_price, _segment_reduce(np.minimum, lows, span_start, span_end))
+    up = max_high / entry_price - 1.0
+    down = min_low / entry_price - 1.0
+    mfe = np.maximum(np.where(side > 0, up, -down), 0.0)
+    mae = np.minimum(np.where(side > 0, down, -up), 0.0)
+
+    return pd.DataFrame(
+        {
+            "entry_time": index[entry_bar],
+            "exit_time": index[exit_bar],
+            "side": side.astype(np.int8),
+            "size": size,
+            "entry_price": entry_price,
+            "exit_price": exit_price,
+            "gross_return": gross_return,
+            "net_return": gross_return - fees,
+            "gross_pnl": side * size * (exit_price - entry_price),
+            "net_pnl": side * size * (exit_price - entry_price) - fees * entry_price,
+            "bars_held": exit_bar - entry_bar,
+            "mae": mae,
+            "mfe": mfe,
+            "is_open": is_open,
+        }
+    )
@@ -0,0 +1,242 @@
+"""Walk-forward optimization over rolling or anchored train/test windows."""
+
+from __future__ import annotations
+
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from multiprocessing import shared_memory
+from typing import Sequence
+
+import numpy as np
+import pandas as pd
+
+from goldbot.backtest.metrics import infer_periods_per_year
+from goldbot.backtest.sweep import MovingAverageSweep, ma_strategy_returns, rolling_means
+from goldbot.config import settings
+from goldbot.data import load_cached_prices
+from goldbot.utils.logging import configure_logging
+from goldbot.utils.tracing import traced
+
+
+@dataclass(frozen=True, slots=True)
+class WalkForwardFold:
+    """Bar offsets for one fold; ``train_start:train_end`` then ``train_end:test_end``."""
+
+    fold: int
+    train_start: int
+    train_end: int
+    test_end: int
+
+
+@dataclass(slots=True)
+class WalkForwardResult:
+    folds: pd.DataFrame
+    oos_returns: pd.Series
+    equity_curve: pd.Series
+    stats: dict[str, float] = field(default_factory=dict)
+
+
+def walk_forward_folds(
+    n_bars: int,
+    train_bars: int,
+    test_bars: int,
+    anchored: bool = False,
+) -> list[WalkForwardFold]:
+    """Split ``n_bars`` into consecutive folds whose test windows do not overlap."""
+
+    if train_bars <= 0 or test_bars <= 0:
+        raise ValueError("train_bars and test_bars must be positive.")
+    folds: list[WalkForwardFold] = []
+    train_end = train_bars
+    while train_end < n_bars:
+        test_end = min(train_end + test_bars, n_bars)
+        train_start = 0 if anchored else train_end - train_bars
+        folds.append(WalkForwardFold(len(folds), train_start, train_end, test_end))
+        train_end = test_end
+    if not folds:
+        raise ValueError(f"Need more than {train_bars} bars for a walk-forward split, got {n_bars}.")
+    return folds
+
+
+@dataclass(frozen=True, slots=True)
+class _SharedArray:
+    name: str
+    size: int
+
+    @classmethod
+    def create(cls, values: np.ndarray) -> tuple[_SharedArray, shared_memory.SharedMemory]:
+        shm = shared_memory.SharedMemory(create=True, size=max(values.nbytes, 1))
+        np.ndarray(values.shape, dtype=np.float64, buffer=shm.buf)[:] = values
+        return cls(name=shm.name, size=values.size), shm
+
+    def attach(self) -> tuple[np.ndarray, shared_memory.SharedMemory]:
+        shm = shared_memory.SharedMemory(name=self.name)
+        return np.ndarray((self.size,), dtype=np.float64, buffer=shm.buf), shm
+
+
+def _evaluate_fold(
+    close: np.ndarray,
+    fold: WalkForwardFold,
+    fast_windows: Sequence[int],
+    slow_windows: Sequence[int],
+    objective: str,
+    commission: float,
+    periods_per_year: float,
+) -> tuple[dict[str, float], np.ndarray]:
+    sweep = MovingAverageSweep(periods_per_year=periods_per_year, commission=commission)
+    in_sample = sweep.run(pd.Series(close[fold.train_start : fold.train_end]), fast_windows, slow_windows)
+    best = in_sample.loc[in_sample[objective].fillna(-np.inf).idxmax()]
+    fast, slow = int(best["fast"]), int(best["slow"])
+
+    # Warm the SMAs (and the two-bar signal lag) on history preceding the test window.
+    warm_start = max(0, fold.train_end - slow - 2)
+    window = close[warm_start : fold.test_end]
+    windows, smas = rolling_means(window, (fast, slow))
+    rets = ma_strategy_returns(
+        window,
+        smas[np.searchsorted(windows, fast)],
+        smas[np.searchsorted(windows, slow)],
+        commission,
+    )
+    oos = rets[fold.train_end - warm_start :]
+    summary = {
+        "fold": fold.fold,
+        "fast": fast,
+        "slow": slow,
+        f"is_{objective}": float(best[objective]),
+        "oos_return": float(np.prod(1.0 + oos) - 1.0),
+    }
+    return summary, oos
+
+
+def _evaluate_shared_fold(
+    shared: _SharedArray,
+    fold: WalkForwardFold,
+    fast_windows: Sequence[int],
+    slow_windows: Sequence[int],
+    objective: str,
+    commission: float,
+    periods_per_year: float,
+) -> tuple[dict[str, float], np.ndarray]:
+    close, shm = shared.attach()
+    try:
+        return _evaluate_fold(
+            close, fold, fast_windows, slow_windows, objective, commission, periods_per_year
+        )
+    finally:
+        del close
+        shm.close()
+
+
+@dataclass(slots=True)
+class WalkForwardRunner:
+    """Optimize dual-MA windows in-sample and score them out-of-sample per fold.
+
+    Folds run in a ``ProcessPoolExecutor``; the close series is placed in shared
+    memory once so workers attach to it instead of unpickling price frames.
+    """
+
+    fast_windows: Sequence[int]
+    slow_windows: Sequence[int]
+    train_bars: int
+    test_bars: int
+    anchored: bool = False
+    objective: str = "sharpe"
+    max_workers: int | None = None
+    periods_per_year: float | None = None  # inferred from the price index when None
+    initial_capital: float | None = None
+
+    def folds(self, n_bars: int) -> list[WalkForwardFold]:
+        return walk_forward_folds(n_bars, self.train_bars, self.test_bars, anchored=self.anchored)
+
+    @traced(rows_arg="prices")
+    def run(self, prices: pd.DataFrame | pd.Series) -> WalkForwardResult:
+        close_series = prices["close"] if isinstance(prices, pd.DataFrame) else prices
+        close = close_series.to_numpy(dtype=np.float64)
+        folds = self.folds(close.size)
+        commission = settings.backtest.commission_perc
+        periods = self.periods_per_year or infer_periods_per_year(close_series.index)
+        args = (self.fast_windows, self.slow_windows, self.objective, commission, periods)
+
+        if self.max_workers == 1:
+            outcomes = [_evaluate_fold(close, fold, *args) for fold in folds]
+        else:
+            shared, shm = _SharedArray.create(close)
+            try:
+                with ProcessPoolExecutor(max_workers=self.max_workers) as pool:
+                    futures = [pool.submit(_evaluate_shared_fold, shared, fold, *args) for fold in folds]
+                    outcomes = [future.result() for future in futures]
+            finally:
+                shm.close()
+                shm.unlink()
+
+        return self._stitch(close_series.index, folds, outcomes, periods)
+
+    def _stitch(
+        self,
+        index: pd.Index,
+        folds: list[WalkForwardFold],
+        outcomes: list[tuple[dict[str, float], np.ndarray]],
+        periods_per_year: float,
+    ) -> WalkForwardResult:
+        rows = []
+        for fold, (summary, _) in zip(folds, outcomes):
+            rows.append(
+                {
+                    **summary,
+                    "train_start": index[fold.train_start],
+                    "test_start": index[fold.train_end],
+                    "test_end": index[fold.test_end - 1],
+                }
+            )
+        oos_index = index[folds[0].train_end : folds[-1].test_end]
+        oos_returns = pd.Series(np.concatenate([oos for _, oos in outcomes]), index=oos_index, name="oos_ret")
+        capital = self.initial_capital or settings.backtest.initial_capital
+        equity = (1 + oos_returns).cumprod() * capital
+        equity.name = "equity"
+        years = len(oos_returns) / periods_per_year
+        stats = {
+            "total_return": float(equity.iloc[-1] / capital - 1),
+            "cagr": float((equity.iloc[-1] / capital) ** (1 / years) - 1) if years else 0.0,
+            "max_drawdown": float((equity / equity.cummax() - 1).min()),
+            "n_folds": float(len(folds)),
+        }
+        return WalkForwardResult(folds=pd.DataFrame(rows), oos_returns=oos_returns, equity_curve=equity, stats=stats)
+
+
+def parse_range(spec: str) -> range:
+    """Parse ``start:stop[:step]`` into a window range."""
+
+    return range(*(int(part) for part in spec.split(":")))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Walk-forward optimize the dual-MA strategy on cached data")
+    parser.add_argument("--symbol", default="XAUUSD")
+    parser.add_argument("--timeframe", default="1h")
+    parser.add_argument("--fast", default="5:50:5", help="fast window range start:stop[:step]")
+    parser.add_argument("--slow", default="20:200:10", help="slow window range start:stop[:step]")
+    parser.add_argument("--train-bars", type=int, default=2000)
+    parser.add_argument("--test-bars", type=int, default=500)
+    parser.add_argument("--anchored", action="store_true")
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    configure_logging()
+    prices = load_cached_prices(symbol=args.symbol, timeframe=args.timeframe)
+    runner = WalkForwardRunner(
+        fast_windows=list(parse_range(args.fast)),
+        slow_windows=list(parse_range(args.slow)),
+        train_bars=args.train_bars,
+        test_bars=args.test_bars,
+        anchored=args.anchored,
+        max_workers=args.workers,
+    )
+    result = runner.run(prices)
+    print(result.folds.to_string(index=False))
+    print("Stats:", result.stats)
+
+
+if __name__ == "__main__":
+    main()
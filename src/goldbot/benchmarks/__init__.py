@@ -0,0 +1,16 @@
+"""Benchmark exports, imported on first use."""
+
+from goldbot.utils.lazy import lazy_exports
+
+_EXPORTS = {
+    "synthetic_bars": ".synthetic",
+    "synthetic_ticks": ".synthetic",
+    "parse_scale": ".synthetic",
+    "BenchmarkResult": ".suite",
+    "run_scale": ".suite",
+    "run_suite": ".suite",
+    "compare_results": ".suite",
+}
+
+__all__ = list(_EXPORTS)
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -0,0 +1,323 @@
+"""Timing and peak-memory benchmarks for the research pipeline, with a baseline comparison."""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Iterator, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+from goldbot.backtest import VectorizedBacktester
+from goldbot.benchmarks.synthetic import parse_scale, synthetic_bars, synthetic_ticks
+from goldbot.config import settings
+from goldbot.data import compute_quality_report, load_cached_prices, save_price_data
+from goldbot.data.ticks import aggregate_ticks
+from goldbot.features import engineer_feature_set
+from goldbot.reporting import ReportRun, render_report
+from goldbot.strategies import DualMovingAverageStrategy
+from goldbot.utils.logging import configure_logging
+
+CASES = (
+    "load_cached_prices",
+    "compute_quality_report",
+    "engineer_feature_set",
+    "generate_signals",
+    "backtest_run",
+    "render_report",
+    "aggregate_ticks",
+)
+DEFAULT_SCALES = ("10k", "1m")
+DEFAULT_BASELINE = Path("benchmarks/baseline.json")
+SYMBOL = "XAUUSD"
+TIMEFRAME = "1min"
+TICK_CHUNK_ROWS = 1_000_000
+# Start-up commands timed as overhead over a bare ``python -c pass``, with their budgets in seconds.
+STARTUP_COMMANDS = {
+    "import_goldbot": ("-c", "import goldbot"),
+    "baseline_help": ("-m", "goldbot.pipeline.baseline", "--help"),
+}
+STARTUP_BUDGETS = {"import_goldbot": 0.05, "baseline_help": 0.25}
+STARTUP_SCALE = "startup"
+
+
+@dataclass(slots=True)
+class BenchmarkResult:
+    case: str
+    scale: str
+    rows: int
+    seconds: float
+    median_seconds: float
+    peak_mb: Optional[float]
+
+
+@contextmanager
+def _raw_dir(path: Path) -> Iterator[None]:
+    """Point the price cache at ``path`` for the duration of the block."""
+
+    previous = settings.data.raw_dir
+    settings.data.raw_dir = path
+    try:
+        yield
+    finally:
+        settings.data.raw_dir = previous
+
+
+def _measure(func: Callable[[], Any], repeats: int, memory: bool) -> tuple[Any, list[float], Optional[float]]:
+    """Run ``func`` ``repeats`` times for wall time, then once more under ``tracemalloc`` for peak memory.
+
+    Memory is measured in its own pass because tracing allocations slows the
+    call down and would distort the timings.
+    """
+
+    times = []
+    result = None
+    for _ in range(max(1, repeats)):
+        gc.collect()
+        start = time.perf_counter()
+        result = func()
+        times.append(time.perf_counter() - start)
+    peak_mb = None
+    if memory:
+        del result
+        gc.collect()
+        tracemalloc.start()
+        try:
+            result = func()
+            peak_mb = tracemalloc.get_traced_memory()[1] / 2**20
+        finally:
+            tracemalloc.stop()
+    return result, times, peak_mb
+
+
+def run_scale(scale: str, repeats: int = 3, memory: bool = True, seed: int = 0) -> list[BenchmarkResult]:
+    """Benchmark every case in ``CASES`` on ``scale`` synthetic 1-minute bars (and as many ticks).
+
+    Each stage feeds the next (cached prices → features → signals →
+    backtest → report), so the inputs are the ones the pipeline really sees.
+    """
+
+    n_rows = parse_scale(scale)
+    results = []
+    with tempfile.TemporaryDirectory(prefix="goldbot-bench-") as tmp:
+        workdir = Path(tmp)
+        state: dict[str, Any] = {}
+        stages: dict[str, tuple[Callable[[], Any], Optional[str]]] = {
+            "load_cached_prices": (lambda: load_cached_prices(SYMBOL, TIMEFRAME), "prices"),
+            "compute_quality_report": (lambda: compute_quality_report(state["prices"], freq=TIMEFRAME), None),
+            "engineer_feature_set": (lambda: engineer_feature_set(state["prices"]), "features"),
+            "generate_signals": (
+                lambda: DualMovingAverageStrategy().generate_signals(state["features"]),
+                "signals",
+            ),
+            "backtest_run": (lambda: VectorizedBacktester().run(state["signals"]), "result"),
+            "render_report": (
+                lambda: render_report(ReportRun.from_result("benchmark", state["result"]), workdir / "reports"),
+                None,
+            ),
+            "aggregate_ticks": (
+                lambda: aggregate_ticks(
+                    state["ticks"].iloc[i : i + TICK_CHUNK_ROWS] for i in range(0, n_rows, TICK_CHUNK_ROWS)
+                ),
+                None,
+            ),
+        }
+        with _raw_dir(workdir / "raw"):
+            save_price_data(synthetic_bars(n_rows, freq=TIMEFRAME, seed=seed), SYMBOL, TIMEFRAME)
+            state["ticks"] = synthetic_ticks(n_rows, seed=seed)
+            for case in CASES:
+                func, key = stages[case]
+                output, times, peak_mb = _measure(func, repeats, memory)
+                if key is not None:
+                    state[key] = output
+                del output
+                results.append(
+                    BenchmarkResult(case, scale, n_rows, min(times), statistics.median(times), peak_mb)
+                )
+                logger.info(
+                    "{} @ {}: best {:.4f}s{}",
+                    case,
+                    scale,
+                    min(times),
+                    "" if peak_mb is None else f", peak {peak_mb:.1f} MB",
+                )
+    return results
+
+
+def _spawn_seconds(args: Sequence[str], cwd: Path) -> float:
+    start = time.perf_counter()
+    subprocess.run([sys.executable, *args], cwd=cwd, check=True, stdout=subprocess.DEVNULL)
+    return time.perf_counter() - start
+
+
+def run_startup(repeats: int = 5) -> list[BenchmarkResult]:
+    """Time each ``STARTUP_COMMANDS`` entry in a fresh interpreter, minus bare interpreter start-up.
+
+    Commands run from an empty temporary directory, so anything that writes
+    to the working directory on import shows up as a failed check rather than
+    going unnoticed.
+    """
+
+    results = []
+    with tempfile.TemporaryDirectory(prefix="goldbot-startup-") as tmp:
+        cwd = Path(tmp)
+        bare = min(_spawn_seconds(("-c", "pass"), cwd) for _ in range(max(1, repeats)))
+        for case, args in STARTUP_COMMANDS.items():
+            times = [max(0.0, _spawn_seconds(args, cwd) - bare) for _ in range(max(1, repeats))]
+            results.append(BenchmarkResult(case, STARTUP_SCALE, 0, min(times), statistics.median(times), None))
+            logger.info("{}: best {:.4f}s over bare start-up ({:.4f}s)", case, min(times), bare)
+        if any(cwd.iterdir()):
+            raise RuntimeError(f"Start-up commands created files: {sorted(p.name for p in cwd.iterdir())}")
+    return results
+
+
+def startup_over_budget(results: Sequence[BenchmarkResult]) -> list[BenchmarkResult]:
+    return [r for r in results if r.case in STARTUP_BUDGETS and r.seconds > STARTUP_BUDGETS[r.case]]
+
+
+def run_suite(
+    scales: Sequence[str] = DEFAULT_SCALES,
+    repeats: int = 3,
+    memory: bool = True,
+    seed: int = 0,
+    startup: bool = True,
+) -> dict[str, Any]:
+    """Run every scale (and the start-up checks) and return the JSON-ready document (``meta`` + ``results``)."""
+
+    results = run_startup(max(repeats, 5)) if startup else []
+    results += [result for scale in scales for result in run_scale(scale, repeats, memory, seed)]
+    return {"meta": _environment(repeats, memory, seed), "results": [asdict(result) for result in results]}
+
+
+def _environment(repeats: int, memory: bool, seed: int) -> dict[str, Any]:
+    return {
+        "created": pd.Timestamp.now(tz="UTC").isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "repeats": repeats,
+        "memory": memory,
+        "seed": seed,
+    }
+
+
+def compare_results(
+    baseline: dict[str, Any],
+    current: dict[str, Any],
+    threshold: float = 0.2,
+    min_seconds: float = 0.005,
+    min_mb: float = 1.0,
+) -> pd.DataFrame:
+    """Line up ``current`` against ``baseline`` by case and scale, one row per metric.
+
+    A metric regresses when it grew by more than ``threshold`` (relative) and
+    by more than ``min_seconds``/``min_mb`` (absolute), so millisecond-scale
+    jitter on small inputs is not reported. Cases missing from either side
+    are skipped.
+    """
+
+    keys = ["case", "scale"]
+    merged = pd.DataFrame(baseline["results"]).merge(
+        pd.DataFrame(current["results"]), on=keys, suffixes=("_baseline", "_current")
+    )
+    rows = []
+    for metric, floor in (("seconds", min_seconds), ("peak_mb", min_mb)):
+        before = pd.to_numeric(merged[f"{metric}_baseline"], errors="coerce")
+        after = pd.to_numeric(merged[f"{metric}_current"], errors="coerce")
+        valid = before.notna() & after.notna()
+        frame = merged.loc[valid, keys].assign(
+            metric=metric, baseline=before[valid], current=after[valid]
+        )
+        frame["ratio"] = frame["current"] / frame["baseline"].where(frame["baseline"] > 0)
+        growth = frame["current"] - frame["baseline"]
+        frame["regression"] = (growth > threshold * frame["baseline"]) & (growth > floor)
+        rows.append(frame)
+    return pd.concat(rows, ignore_index=True)
+
+
+def _load(path: Path) -> dict[str, Any]:
+    return json.loads(Path(path).read_text())
+
+
+def _write(document: dict[str, Any], path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(document, indent=2) + "\n")
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the research pipeline on synthetic XAUUSD data")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="run the suite and write a results file")
+    run.add_argument("--scales", default=",".join(DEFAULT_SCALES), help="comma-separated sizes (10k,1m,50m)")
+    run.add_argument("--repeats", type=int, default=3, help="timed runs per case; the best is reported")
+    run.add_argument("--seed", type=int, default=0)
+    run.add_argument("--no-memory", action="store_true", help="skip the tracemalloc peak-memory pass")
+    run.add_argument("--no-startup", action="store_true", help="skip the import/start-up timings")
+    run.add_argument("--output", type=Path, default=Path("benchmarks/results.json"))
+
+    compare = commands.add_parser("compare", help="compare results against the stored baseline")
+    compare.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    compare.add_argument("--current", type=Path, default=None, help="results file; runs the suite when omitted")
+    compare.add_argument("--threshold", type=float, default=0.2, help="relative growth that counts as a regression")
+    compare.add_argument("--min-seconds", type=float, default=0.005)
+    compare.add_argument("--min-mb", type=float, default=1.0)
+    compare.add_argument("--repeats", type=int, default=3)
+
+    startup = commands.add_parser("startup", help="check import/start-up time against STARTUP_BUDGETS")
+    startup.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    configure_logging()
+    if args.command == "run":
+        scales = [scale for scale in args.scales.split(",") if scale]
+        document = run_suite(scales, args.repeats, not args.no_memory, args.seed, not args.no_startup)
+        _write(document, args.output)
+        print("Results written to", args.output)
+        return 0
+    if args.command == "startup":
+        results = run_startup(args.repeats)
+        for result in results:
+            print(f"{result.case:>16}: {result.seconds:.4f}s (budget {STARTUP_BUDGETS[result.case]:.2f}s)")
+        return 1 if startup_over_budget(results) else 0
+
+    baseline = _load(args.baseline)
+    if args.current is not None:
+        current = _load(args.current)
+    else:
+        scales = list(dict.fromkeys(row["scale"] for row in baseline["results"]))
+        meta = baseline["meta"]
+        current = run_suite(
+            [scale for scale in scales if scale != STARTUP_SCALE],
+            args.repeats,
+            bool(meta.get("memory", True)),
+            int(meta.get("seed", 0)),
+            STARTUP_SCALE in scales,
+        )
+    table = compare_results(baseline, current, args.threshold, args.min_seconds, args.min_mb)
+    print(table.to_string(index=False, float_format=lambda v: f"{v:.4f}"))
+    regressions = table[table["regression"]]
+    if regressions.empty:
+        print("No regressions beyond", f"{args.threshold:.0%}")
+        return 0
+    print(f"{len(regressions)} regression(s) beyond {args.threshold:.0%}")
+    return 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
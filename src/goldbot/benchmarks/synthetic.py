@@ -0,0 +1,142 @@
+"""Reproducible synthetic XAUUSD bars and ticks for benchmarks and tests."""
+
+from __future__ import annotations
+
+import re
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from goldbot.data.sessions import NS_PER_MINUTE, SessionCalendar
+
+SCALES = {"10k": 10_000, "1m": 1_000_000, "50m": 50_000_000}
+# Relative volatility by UTC hour: quiet Asia, busier London, busiest London/New York overlap.
+_HOURLY_VOL = np.array([0.7] * 7 + [1.0] * 5 + [1.5] * 5 + [1.0] * 3 + [0.7] * 4)
+
+
+def parse_scale(scale: str | int) -> int:
+    """Row count for ``"10k"``/``"1m"``/``"50m"``-style labels (or a plain integer)."""
+
+    if isinstance(scale, int):
+        return scale
+    label = scale.strip().lower()
+    if label in SCALES:
+        return SCALES[label]
+    match = re.fullmatch(r"(\d+(?:\.\d+)?)([km]?)", label)
+    if match is None:
+        raise ValueError(f"Unrecognised scale {scale!r}")
+    return int(float(match.group(1)) * {"": 1, "k": 1_000, "m": 1_000_000}[match.group(2)])
+
+
+def _open_minutes(
+    n_rows: int, start: pd.Timestamp, step_ns: int, calendar: SessionCalendar, outages: int, rng
+) -> np.ndarray:
+    """``n_rows`` in-session bar timestamps from ``start`` with ``outages`` random feed gaps removed."""
+
+    stamps = np.empty(0, dtype=np.int64)
+    span = int(n_rows * 1.6) + 10_000
+    begin = start.value
+    while stamps.size < n_rows:
+        grid = np.arange(begin, begin + span * step_ns, step_ns, dtype=np.int64)
+        stamps = np.concatenate([stamps, grid[calendar.bar_closure(grid, step_ns) == 0]])
+        begin = int(grid[-1]) + step_ns
+    if outages and stamps.size > n_rows + 1:
+        # Each outage drops a short run (1-30 bars) at a random in-session position.
+        lengths = rng.integers(1, 31, size=outages)
+        starts = rng.integers(1, n_rows, size=outages)
+        drop = np.zeros(stamps.size, dtype=bool)
+        for pos, length in zip(starts, lengths):
+            drop[pos : pos + length] = True
+        stamps = stamps[~drop]
+    return stamps[:n_rows]
+
+
+def _volatility(stamps: np.ndarray, base_vol: float, rng) -> np.ndarray:
+    """Per-bar volatility with clustered regimes and intraday seasonality."""
+
+    n = stamps.size
+    # Regimes last ~500 bars on average; their levels are log-normal around ``base_vol``.
+    lengths = rng.geometric(1 / 500, size=n // 100 + 2)
+    regime = np.repeat(np.arange(lengths.size), lengths)[:n]
+    if regime.size < n:
+        regime = np.pad(regime, (0, n - regime.size), mode="edge")
+    levels = base_vol * np.exp(rng.normal(0.0, 0.5, size=lengths.size))
+    hours = (stamps // (60 * NS_PER_MINUTE)) % 24
+    return levels[regime] * _HOURLY_VOL[hours]
+
+
+def synthetic_bars(
+    n_rows: int | str,
+    freq: str = "1min",
+    seed: int = 0,
+    start: str = "2015-01-05",
+    start_price: float = 1_250.0,
+    base_vol: float = 2.5e-4,
+    outages: Optional[int] = None,
+    calendar: Optional[SessionCalendar] = None,
+) -> pd.DataFrame:
+    """OHLCV bars that look like XAUUSD: only in-session timestamps, feed gaps, fat tails, clustered volatility.
+
+    Returns are Student-t (4 degrees of freedom) scaled by a regime-switching
+    volatility with intraday seasonality. ``outages`` random feed gaps
+    (default: one per ~20k bars) are cut out of the session grid so the
+    quality scanner has something to find. The same ``seed`` always gives
+    the same frame.
+    """
+
+    n = parse_scale(n_rows)
+    rng = np.random.default_rng(seed)
+    calendar = calendar or SessionCalendar()
+    step = int(pd.Timedelta(freq).value)
+    outages = n // 20_000 if outages is None else outages
+    stamps = _open_minutes(n, pd.Timestamp(start, tz="UTC"), step, calendar, outages, rng)
+
+    vol = _volatility(stamps, base_vol, rng)
+    shocks = rng.standard_t(4, size=n) / np.sqrt(2.0)  # unit variance
+    log_close = np.log(start_price) + np.cumsum(vol * shocks)
+    close = np.exp(log_close)
+    open_ = np.empty(n)
+    open_[0] = start_price
+    open_[1:] = close[:-1] * np.exp(vol[1:] * 0.1 * rng.standard_normal(n - 1))
+    wick = close * vol * np.abs(rng.standard_normal((2, n)))
+    high = np.maximum(open_, close) + wick[0]
+    low = np.minimum(open_, close) - wick[1]
+    volume = np.round(rng.lognormal(3.0, 0.5, size=n) * vol / base_vol)
+
+    index = pd.DatetimeIndex(stamps.view("datetime64[ns]")).tz_localize("UTC").rename("datetime")
+    return pd.DataFrame({"open": open_, "high": high, "low": low, "close": close, "volume": volume}, index=index)
+
+
+def synthetic_ticks(
+    n_ticks: int | str,
+    seed: int = 0,
+    start: str = "2015-01-05",
+    start_price: float = 1_250.0,
+    mean_interval: float = 0.5,
+    calendar: Optional[SessionCalendar] = None,
+) -> pd.DataFrame:
+    """Bid/ask ticks (``TICK_COLUMNS`` layout) with exponential arrival times inside sessions."""
+
+    n = parse_scale(n_ticks)
+    rng = np.random.default_rng(seed)
+    calendar = calendar or SessionCalendar()
+    gaps = rng.exponential(mean_interval * 1e9, size=int(n * 1.6) + 1_000).astype(np.int64) + 1
+    stamps = pd.Timestamp(start, tz="UTC").value + np.cumsum(gaps)
+    stamps = stamps[calendar.closure(stamps) == 0]
+    while stamps.size < n:
+        more = stamps[-1] + np.cumsum(rng.exponential(mean_interval * 1e9, size=n).astype(np.int64) + 1)
+        stamps = np.concatenate([stamps, more[calendar.closure(more) == 0]])
+    stamps = stamps[:n]
+
+    vol = _volatility(stamps, 2e-5, rng)
+    mid = start_price * np.exp(np.cumsum(vol * rng.standard_t(4, size=n) / np.sqrt(2.0)))
+    half_spread = 0.1 + 0.05 * rng.random(n) * vol / 2e-5
+    return pd.DataFrame(
+        {
+            "ts": stamps,  # epoch nanoseconds, as produced by ``read_ticks``
+            "bid": mid - half_spread,
+            "ask": mid + half_spread,
+            "volume": rng.integers(1, 10, size=n).astype(np.float64),
+        }
+    )
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from functools import lru_cache
 from pathlib import Path
-from typing import Literal, Optional
+from typing import Any, Literal, Optional
 
 from pydantic import BaseModel, Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -34,6 +34,8 @@ class DataProviderSettings(BaseModel):
     default_symbol: str = "XAU/USD"
     default_interval: str = "1h"
     outputsize: int = 5000
+    requests_per_minute: int = 8  # Twelve Data basic plan
+    max_concurrency: int = 8
 
 
 class MT5Credentials(BaseModel):
@@ -58,14 +60,30 @@ class Settings(BaseSettings):
 
 @lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Return cached settings instance."""
+    """Return cached settings instance.
 
-    settings = Settings()
-    settings.data.raw_dir.mkdir(parents=True, exist_ok=True)
-    settings.data.processed_dir.mkdir(parents=True, exist_ok=True)
-    settings.data.cache_dir.mkdir(parents=True, exist_ok=True)
-    return settings
+    Nothing is created on disk here; code that writes under ``data`` paths
+    creates the directories it needs, so read-only deployments can import
+    and read settings.
+    """
 
+    return Settings()
 
-settings = get_settings()
+
+class _LazySettings:
+    """Stand-in for the ``Settings`` instance that reads the environment on first attribute access."""
+
+    __slots__ = ()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(get_settings(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(get_settings(), name, value)
+
+    def __repr__(self) -> str:
+        return repr(get_settings())
+
+
+settings: Settings = _LazySettings()  # type: ignore[assignment]
 
@@ -1,16 +1,26 @@
-"""Data layer exports."""
+"""Data layer exports, imported on first use (``requests``/``pyarrow`` load only when needed)."""
 
-from .loaders import PriceDataLoader, resample_bars, save_price_data
-from .quality import DataQualityReport, compute_quality_report, load_cached_prices
-from .twelvedata_client import TwelveDataClient
+from goldbot.utils.lazy import lazy_exports
 
-__all__ = [
-    "PriceDataLoader",
-    "resample_bars",
-    "save_price_data",
-    "load_cached_prices",
-    "compute_quality_report",
-    "DataQualityReport",
-    "TwelveDataClient",
-]
+_EXPORTS = {
+    "PriceDataLoader": ".loaders",
+    "resample_bars": ".loaders",
+    "save_price_data": ".loaders",
+    "load_cached_prices": ".quality",
+    "compute_quality_report": ".quality",
+    "DataQualityReport": ".quality",
+    "QualityScan": ".quality",
+    "scan_prices": ".quality",
+    "SessionCalendar": ".sessions",
+    "PartitionedPriceStore": ".store",
+    "TwelveDataClient": ".twelvedata_client",
+    "BulkFetcher": ".bulk",
+    "FetchRequest": ".bulk",
+    "TickBarAggregator": ".ticks",
+    "ReplayFeed": ".replay",
+    "ReplayServer": ".replay",
+    "read_ticks": ".ticks",
+}
 
+__all__ = list(_EXPORTS)
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -0,0 +1,142 @@
+"""Concurrent multi-symbol / multi-interval Twelve Data fetches."""
+
+from __future__ import annotations
+
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from datetime import date
+from itertools import product
+from typing import Iterable, Optional
+
+import pandas as pd
+import requests
+from loguru import logger
+from requests.adapters import HTTPAdapter
+
+from goldbot.config import settings
+from goldbot.data.loaders import save_price_data
+from goldbot.data.twelvedata_client import TwelveDataClient
+from goldbot.utils.latency import LatencyRecorder
+from goldbot.utils.logging import configure_logging
+from goldbot.utils.rate_limit import TokenBucket
+
+
+@dataclass(frozen=True, slots=True)
+class FetchRequest:
+    symbol: str
+    interval: str
+    outputsize: Optional[int] = None
+    start_date: Optional[date] = None
+    end_date: Optional[date] = None
+
+    @property
+    def key(self) -> tuple[str, str]:
+        return (self.symbol, self.interval)
+
+
+@dataclass(slots=True)
+class BulkFetchResult:
+    frames: dict[tuple[str, str], pd.DataFrame] = field(default_factory=dict)
+    errors: dict[tuple[str, str], Exception] = field(default_factory=dict)
+    latency: dict[str, dict[str, float]] = field(default_factory=dict)
+    elapsed: float = 0.0
+
+
+def pooled_session(pool_size: int) -> requests.Session:
+    """Session whose HTTPS/HTTP adapters keep ``pool_size`` keep-alive connections."""
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+class BulkFetcher:
+    """Fan a list of symbol/interval pulls over a thread pool sharing one session.
+
+    Every HTTP call (including pagination and retries) draws from a single
+    token bucket sized to the Twelve Data plan, so concurrency never exceeds
+    the credit budget.
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        max_workers: Optional[int] = None,
+        requests_per_minute: Optional[float] = None,
+        burst: Optional[float] = None,
+        base_url: Optional[str] = None,
+        rate_limiter: Optional[TokenBucket] = None,
+    ) -> None:
+        providers = settings.providers
+        self.max_workers = max_workers or providers.max_concurrency
+        rpm = requests_per_minute or providers.requests_per_minute
+        self.latency = LatencyRecorder()
+        self.rate_limiter = rate_limiter or TokenBucket.per_minute(rpm, burst=burst)
+        self.client = TwelveDataClient(
+            api_key=api_key,
+            session=pooled_session(self.max_workers),
+            base_url=base_url,
+            rate_limiter=self.rate_limiter,
+            latency=self.latency,
+        )
+
+    def fetch_many(self, jobs: Iterable[FetchRequest]) -> BulkFetchResult:
+        """Run every request concurrently; failures are collected, not raised."""
+
+        result = BulkFetchResult()
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="twelvedata") as pool:
+            futures = {pool.submit(self._fetch_one, req): req for req in jobs}
+            for future in as_completed(futures):
+                req = futures[future]
+                try:
+                    result.frames[req.key] = future.result()
+                except Exception as exc:  # noqa: BLE001 - surface per-request failures to caller
+                    logger.warning("Fetch failed for {} {}: {}", req.symbol, req.interval, exc)
+                    result.errors[req.key] = exc
+        result.elapsed = time.perf_counter() - start
+        result.latency = self.latency.summaries()
+        return result
+
+    def _fetch_one(self, req: FetchRequest) -> pd.DataFrame:
+        with self.latency.time("fetch_time_series"):
+            return self.client.fetch_time_series(
+                symbol=req.symbol,
+                interval=req.interval,
+                outputsize=req.outputsize,
+                start_date=req.start_date,
+                end_date=req.end_date,
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Concurrently fetch several symbols/intervals from Twelve Data")
+    parser.add_argument("--symbols", default="XAU/USD,XAG/USD", help="comma-separated symbols")
+    parser.add_argument("--intervals", default="1min,5min,1h,1day", help="comma-separated intervals")
+    parser.add_argument("--outputsize", type=int, default=settings.providers.outputsize)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--rpm", type=float, default=None, help="requests per minute allowed by the plan")
+    parser.add_argument("--format", choices=["parquet", "csv"], default="parquet")
+    args = parser.parse_args()
+
+    configure_logging()
+    fetcher = BulkFetcher(max_workers=args.workers, requests_per_minute=args.rpm)
+    jobs = [
+        FetchRequest(symbol=symbol, interval=interval, outputsize=args.outputsize)
+        for symbol, interval in product(args.symbols.split(","), args.intervals.split(","))
+    ]
+    result = fetcher.fetch_many(jobs)
+    for (symbol, interval), df in sorted(result.frames.items()):
+        path = save_price_data(df, symbol=symbol, timeframe=interval, fmt=args.format)
+        print(f"Saved {len(df)} rows to {path}")
+    for key, exc in result.errors.items():
+        print(f"FAILED {key}: {exc}")
+    print(f"Elapsed {result.elapsed:.2f}s; latency: {result.latency}")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,11 +3,58 @@
 from __future__ import annotations
 
 import argparse
+from pathlib import Path
+
+from loguru import logger
 
 from goldbot.config import settings
 from goldbot.data import TwelveDataClient, save_price_data
+from goldbot.data.loaders import merge_price_data
+from goldbot.data.quality import last_cached_timestamp, load_cached_prices
 from goldbot.utils.logging import configure_logging
 
+NO_DATA_MESSAGE = "No data is available"
+
+
+def sync_prices(
+    client: TwelveDataClient,
+    symbol: str,
+    interval: str,
+    outputsize: int | None = None,
+    fmt: str = "parquet",
+    provider: str = "twelvedata",
+) -> tuple[Path | None, int]:
+    """Fetch only bars newer than the cache and append them atomically.
+
+    Returns the cache path (``None`` when nothing changed) and the number of new rows.
+    """
+
+    last = last_cached_timestamp(symbol=symbol, timeframe=interval, provider=provider, fmt=fmt)
+    if last is None:
+        logger.info("No cache for {} {}; running full pull", symbol, interval)
+        df = client.fetch_time_series(symbol=symbol, interval=interval, outputsize=outputsize)
+        return save_price_data(df, symbol=symbol, timeframe=interval, provider=provider, fmt=fmt), len(df)
+
+    try:
+        # start_date is inclusive, so the last cached bar comes back and is deduplicated.
+        fresh = client.fetch_time_series(
+            symbol=symbol, interval=interval, outputsize=outputsize, start_date=last.to_pydatetime()
+        )
+    except RuntimeError as exc:
+        if NO_DATA_MESSAGE not in str(exc):
+            raise
+        logger.info("{} {} already up to date at {}", symbol, interval, last)
+        return None, 0
+
+    new_rows = fresh[fresh.index > last]
+    if new_rows.empty:
+        logger.info("{} {} already up to date at {}", symbol, interval, last)
+        return None, 0
+    existing = load_cached_prices(symbol=symbol, timeframe=interval, provider=provider, fmt=fmt)
+    merged = merge_price_data(existing, fresh)
+    path = save_price_data(merged, symbol=symbol, timeframe=interval, provider=provider, fmt=fmt)
+    return path, len(new_rows)
+
 
 def pull_prices() -> None:
     parser = argparse.ArgumentParser(description="Fetch and cache XAU/USD prices from Twelve Data")
@@ -15,10 +62,22 @@ def pull_prices() -> None:
     parser.add_argument("--interval", default=settings.providers.default_interval)
     parser.add_argument("--outputsize", type=int, default=settings.providers.outputsize)
     parser.add_argument("--format", choices=["parquet", "csv"], default="parquet")
+    parser.add_argument(
+        "--sync",
+        action="store_true",
+        help="Only request bars newer than the cached file and append them.",
+    )
     args = parser.parse_args()
 
     configure_logging()
     client = TwelveDataClient()
+    if args.sync:
+        path, n_new = sync_prices(
+            client, symbol=args.symbol, interval=args.interval, outputsize=args.outputsize, fmt=args.format
+        )
+        print(f"Appended {n_new} new rows to {path}" if path else "Cache already up to date")
+        return
+
     df = client.fetch_time_series(symbol=args.symbol, interval=args.interval, outputsize=args.outputsize)
     path = save_price_data(
         df=df,
@@ -32,4 +91,3 @@ def pull_prices() -> None:
 
 if __name__ == "__main__":
     pull_prices()
-
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
@@ -10,6 +11,7 @@ import pandas as pd
 from loguru import logger
 
 from goldbot.config import settings
+from goldbot.utils.tracing import traced
 
 
 @dataclass(slots=True)
@@ -62,6 +64,15 @@ def resample_bars(df: pd.DataFrame, rule: str, ohlc_cols: Optional[list[str]] =
     return agg.dropna(how="any")
 
 
+def merge_price_data(existing: pd.DataFrame, new: pd.DataFrame) -> pd.DataFrame:
+    """Combine two bar frames, keeping the newest copy of any repeated timestamp."""
+
+    merged = pd.concat([existing, new])
+    merged = merged[~merged.index.duplicated(keep="last")]
+    return merged.sort_index()
+
+
+@traced(rows_arg="df")
 def save_price_data(
     df: pd.DataFrame,
     symbol: str,
@@ -69,18 +80,29 @@ def save_price_data(
     provider: str = "twelvedata",
     fmt: str = "parquet",
 ) -> Path:
-    """Persist dataframe to canonical path in data/raw."""
+    """Persist dataframe to canonical path in data/raw.
 
-    sanitized_symbol = symbol.lower().replace("/", "")
-    filename = f"{sanitized_symbol}_{timeframe.lower()}_{provider}.{fmt}"
-    target = settings.data.raw_dir / filename
+    The file is written next to the target and swapped in with ``os.replace`` so
+    readers never observe a half-written cache.
+    """
+
+    target = cached_price_path(symbol, timeframe, provider, fmt)
     target.parent.mkdir(parents=True, exist_ok=True)
+    tmp = target.with_name(f".{target.name}.tmp")
     if fmt == "parquet":
-        df.to_parquet(target)
+        df.to_parquet(tmp)
     elif fmt == "csv":
-        df.reset_index().to_csv(target, index=False)
+        df.reset_index().to_csv(tmp, index=False)
     else:
         raise ValueError(f"Unsupported format {fmt}")
-    logger.info("Saved %s rows to %s", len(df), target)
+    os.replace(tmp, target)
+    logger.info("Saved {} rows to {}", len(df), target)
     return target
 
+
+def cached_price_path(symbol: str, timeframe: str, provider: str = "twelvedata", fmt: str = "parquet") -> Path:
+    """Return the canonical data/raw location for a symbol/timeframe/provider."""
+
+    sanitized_symbol = symbol.lower().replace("/", "")
+    return settings.data.raw_dir / f"{sanitized_symbol}_{timeframe.lower()}_{provider}.{fmt}"
+
@@ -2,15 +2,21 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from pathlib import Path
-from typing import Optional
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, Iterable, Iterator, Optional
 
+import numpy as np
 import pandas as pd
 
-from goldbot.config import settings
+from goldbot.data.loaders import cached_price_path
+from goldbot.data.sessions import SessionCalendar
+from goldbot.utils.tracing import traced
 
+if TYPE_CHECKING:  # store imports this module for ``load_cached_prices``
+    from goldbot.data.store import PartitionedPriceStore, PricePartition
 
+
+@traced()
 def load_cached_prices(
     symbol: str = "XAUUSD",
     timeframe: str = "1h",
@@ -19,8 +25,7 @@ def load_cached_prices(
 ) -> pd.DataFrame:
     """Load cached OHLCV data saved by the CLI."""
 
-    filename = f"{symbol.lower().replace('/', '')}_{timeframe.lower()}_{provider}.{fmt}"
-    path = settings.data.raw_dir / filename
+    path = cached_price_path(symbol, timeframe, provider, fmt)
     if not path.exists():
         raise FileNotFoundError(f"Cached file not found: {path}")
     if fmt == "parquet":
@@ -30,6 +35,37 @@ def load_cached_prices(
     raise ValueError(f"Unsupported format {fmt}")
 
 
+def last_cached_timestamp(
+    symbol: str = "XAUUSD",
+    timeframe: str = "1h",
+    provider: str = "twelvedata",
+    fmt: str = "parquet",
+) -> Optional[pd.Timestamp]:
+    """Return the newest cached bar time, or ``None`` when nothing is cached yet.
+
+    Parquet caches are read index-only so this stays cheap on long histories.
+    """
+
+    path = cached_price_path(symbol, timeframe, provider, fmt)
+    if not path.exists():
+        return None
+    if fmt == "parquet":
+        index = pd.read_parquet(path, columns=[]).index
+    else:
+        index = pd.read_csv(path, usecols=["datetime"], parse_dates=["datetime"])["datetime"]
+    return index.max() if len(index) else None
+
+
+GAP_KINDS = ("session", "holiday", "outage")
+OHLC = ["open", "high", "low", "close"]
+
+
+def _freq_ns(freq: str) -> int:
+    """Bar length in ns; accepts pandas (``1h``/``15min``), ``1H`` and ``1day`` spellings."""
+
+    return pd.Timedelta(freq.lower().replace("day", "d").replace("week", "w")).value
+
+
 @dataclass(slots=True)
 class DataQualityReport:
     n_rows: int
@@ -39,22 +75,186 @@ class DataQualityReport:
     missing_pct: float
     duplicate_rows: int
     timezone: str
+    expected_rows: int = 0
+    session_gap_rows: int = 0
+    holiday_gap_rows: int = 0
+    out_of_order_rows: int = 0
+    ohlc_violations: int = 0
+    spike_rows: int = 0
 
 
-def compute_quality_report(df: pd.DataFrame, freq: str = "1H") -> DataQualityReport:
-    """Generate quick diagnostics (gaps, duplicates, coverage)."""
+@dataclass(slots=True)
+class QualityScan:
+    """Full scanner output: summary, gap runs, per-bar flags, optional repair."""
 
-    df = df.sort_index()
-    expected = pd.date_range(df.index.min(), df.index.max(), freq=freq, tz=df.index.tz)
-    missing_idx = expected.difference(df.index)
-    duplicate_rows = int(df.index.duplicated().sum())
-    return DataQualityReport(
+    report: DataQualityReport
+    gaps: pd.DataFrame
+    flags: pd.DataFrame
+    repaired: Optional[pd.DataFrame] = None
+
+
+def _to_times(ns: np.ndarray, tz) -> pd.DatetimeIndex:
+    times = pd.to_datetime(ns, utc=True)
+    return times.tz_convert(tz) if tz is not None else times.tz_localize(None)
+
+
+def _gap_runs(missing: np.ndarray, kinds: np.ndarray, step: int, tz) -> pd.DataFrame:
+    if missing.size == 0:
+        return pd.DataFrame(columns=["start", "end", "bars", "kind"])
+    breaks = np.flatnonzero((np.diff(missing) != step) | (np.diff(kinds) != 0)) + 1
+    starts = np.concatenate(([0], breaks))
+    ends = np.append(breaks, missing.size) - 1
+    return pd.DataFrame(
+        {
+            "start": _to_times(missing[starts], tz),
+            "end": _to_times(missing[ends], tz),
+            "bars": ends - starts + 1,
+            "kind": np.asarray(GAP_KINDS, dtype=object)[kinds[starts]],
+        }
+    )
+
+
+def _spike_mask(close: np.ndarray, history: np.ndarray, window: int, threshold: float) -> np.ndarray:
+    """Flag bars whose log return is ``threshold`` rolling std-devs from the trailing mean."""
+
+    series = np.log(np.concatenate((history, close)))
+    returns = pd.Series(np.diff(series, prepend=np.nan))
+    # Statistics come from the previous ``window`` bars so a spike cannot mask itself.
+    rolling = returns.shift(1).rolling(window, min_periods=max(10, window // 4))
+    z = (returns - rolling.mean()).abs() / rolling.std()
+    return (z > threshold).to_numpy()[history.size :]
+
+
+@traced(rows_arg="df")
+def scan_prices(
+    df: pd.DataFrame,
+    freq: str = "1min",
+    calendar: Optional[SessionCalendar] = None,
+    history: Optional[pd.DataFrame] = None,
+    spike_window: int = 200,
+    spike_z: float = 10.0,
+    repair: bool = False,
+) -> QualityScan:
+    """Vectorized scan for gaps, duplicates, ordering, OHLC consistency, and spikes.
+
+    Missing bars are split into session closes, holidays, and feed outages
+    using ``calendar``; only outages count toward ``missing_rows``/``missing_pct``.
+    ``history`` (earlier bars, e.g. the previous partition) seeds the spike
+    statistics and the gap check at the boundary without being reported.
+    With ``repair=True`` the result carries a sorted, de-duplicated frame with
+    spikes replaced by the previous close and OHLC bounds made consistent.
+    """
+
+    calendar = calendar or SessionCalendar()
+    step = _freq_ns(freq)
+    raw = df.index.asi8
+    steps = np.diff(raw)
+    if (steps > 0).all():
+        frame, out_of_order, duplicates = df, 0, 0
+    else:
+        # Sort-based de-duplication avoids hashing tens of millions of timestamps.
+        out_of_order = int((raw[1:] < np.maximum.accumulate(raw)[:-1]).sum())
+        order = np.argsort(raw, kind="stable")
+        ordered = raw[order]
+        keep = np.append(ordered[1:] != ordered[:-1], True)
+        frame = df.iloc[order[keep]]
+        duplicates = int((~keep).sum())
+    ts = frame.index.asi8
+    tz = frame.index.tz
+
+    prior = history.index.asi8 if history is not None and len(history) else np.empty(0, dtype=np.int64)
+    if ts.size:
+        first = prior[-1] + step if prior.size else ts[0]
+        grid = np.arange(first, ts[-1] + 1, step, dtype=np.int64)
+    else:
+        grid = np.empty(0, dtype=np.int64)
+    pos = np.minimum(np.searchsorted(ts, grid), max(ts.size - 1, 0))
+    present = ts[pos] == grid if ts.size else np.zeros(0, dtype=bool)
+    missing = grid[~present]
+    closure = calendar.bar_closure(missing, step)
+    kinds = np.where(closure == 0, 2, closure - 1).astype(np.int8)
+    expected = int((calendar.bar_closure(grid, step) == 0).sum())
+    outages = int((kinds == 2).sum())
+
+    flags = pd.DataFrame(index=frame.index)
+    has_ohlc = set(OHLC) <= set(frame.columns)
+    if has_ohlc:
+        open_, high, low, close = (frame[col].to_numpy(dtype=np.float64) for col in OHLC)
+        flags["ohlc_invalid"] = (
+            (high < low)
+            | (high < np.maximum(open_, close))
+            | (low > np.minimum(open_, close))
+            | (np.minimum(open_, low) <= 0)
+        )
+    if "close" in frame:
+        past = history["close"].to_numpy(dtype=np.float64)[-spike_window:] if history is not None else np.empty(0)
+        flags["spike"] = _spike_mask(frame["close"].to_numpy(dtype=np.float64), past, spike_window, spike_z)
+
+    report = DataQualityReport(
         n_rows=len(df),
-        start=df.index.min(),
-        end=df.index.max(),
-        missing_rows=len(missing_idx),
-        missing_pct=(len(missing_idx) / len(expected)) * 100 if expected.size else 0.0,
-        duplicate_rows=duplicate_rows,
-        timezone=str(df.index.tz),
+        start=frame.index.min(),
+        end=frame.index.max(),
+        missing_rows=outages,
+        missing_pct=outages / expected * 100 if expected else 0.0,
+        duplicate_rows=duplicates,
+        timezone=str(tz),
+        expected_rows=expected,
+        session_gap_rows=int((kinds == 0).sum()),
+        holiday_gap_rows=int((kinds == 1).sum()),
+        out_of_order_rows=out_of_order,
+        ohlc_violations=int(flags["ohlc_invalid"].sum()) if has_ohlc else 0,
+        spike_rows=int(flags["spike"].sum()) if "spike" in flags else 0,
     )
+    repaired = _repair(frame, flags) if repair else None
+    return QualityScan(report=report, gaps=_gap_runs(missing, kinds, step, tz), flags=flags, repaired=repaired)
+
+
+def _repair(frame: pd.DataFrame, flags: pd.DataFrame) -> pd.DataFrame:
+    fixed = frame.copy()
+    if "spike" in flags and flags["spike"].any():
+        spikes = flags["spike"].to_numpy()
+        prev_close = fixed["close"].mask(spikes).ffill().shift(1).to_numpy()
+        for col in [c for c in OHLC if c in fixed]:
+            fixed.loc[spikes, col] = prev_close[spikes]
+    if set(OHLC) <= set(fixed.columns):
+        values = fixed[OHLC].to_numpy(dtype=np.float64)
+        fixed["high"] = values.max(axis=1)
+        fixed["low"] = values.min(axis=1)
+    return fixed
+
+
+def compute_quality_report(
+    df: pd.DataFrame, freq: str = "1H", calendar: Optional[SessionCalendar] = None
+) -> DataQualityReport:
+    """Generate quick diagnostics (gaps, duplicates, coverage) against the session calendar."""
+
+    return scan_prices(df, freq=freq, calendar=calendar).report
+
+
+def scan_partitions(
+    store: PartitionedPriceStore,
+    symbol: str,
+    timeframe: str,
+    freq: Optional[str] = None,
+    **scan_kwargs,
+) -> Iterator[tuple[PricePartition, QualityScan]]:
+    """Scan a partitioned history one month at a time in bounded memory.
+
+    The tail of each month is passed as ``history`` to the next, so boundary
+    gaps and spikes are still caught.
+    """
+
+    history: Optional[pd.DataFrame] = None
+    window = scan_kwargs.get("spike_window", 200)
+    for part in store.partitions(symbol, timeframe):
+        frame = store.read_partition(part)
+        scan = scan_prices(frame, freq=freq or timeframe, history=history, **scan_kwargs)
+        history = frame.tail(window)
+        yield part, scan
+
+
+def summarize_scans(scans: Iterable[tuple[PricePartition, QualityScan]]) -> pd.DataFrame:
+    """One row per partition with the report fields."""
 
+    rows = [{"year": part.year, "month": part.month, **asdict(scan.report)} for part, scan in scans]
+    return pd.DataFrame(rows)
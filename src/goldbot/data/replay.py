@@ -0,0 +1,277 @@
+"""Replay cached bars or ticks as a Twelve Data-style price stream.
+
+The same feed runs in-process (``async for event in feed.stream()``) or behind
+a local TCP server speaking newline-delimited JSON: clients send Twelve Data's
+``{"action": "subscribe", ...}`` message and receive ``subscribe-status``
+followed by ``price`` events.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, AsyncIterator, Callable, Iterable, Iterator, Optional
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+from goldbot.config import settings
+from goldbot.data.quality import load_cached_prices
+from goldbot.data.ticks import read_ticks
+from goldbot.utils.logging import configure_logging
+
+BAR_EVENT_FIELDS = ("open", "high", "low", "close", "volume")
+
+
+@dataclass(slots=True)
+class ReplayStats:
+    events: int = 0
+    elapsed: float = 0.0
+    throughput: float = 0.0  # events per second
+    max_lag: float = 0.0  # seconds behind the replay schedule
+    mean_lag: float = 0.0
+    max_backlog_bytes: int = 0  # socket write buffer high-water mark
+
+
+def _bar_events(df: pd.DataFrame, symbol: str) -> list[dict[str, Any]]:
+    frame = pd.DataFrame(
+        {
+            "timestamp": df.index.asi8 // 1_000_000_000,
+            "price": df["close"].to_numpy(dtype=np.float64),
+            **{col: df[col].to_numpy(dtype=np.float64) for col in BAR_EVENT_FIELDS if col in df},
+        }
+    )
+    frame.insert(0, "symbol", symbol)
+    frame.insert(0, "event", "price")
+    return frame.to_dict("records")
+
+
+def _tick_events(ticks: pd.DataFrame, symbol: str) -> list[dict[str, Any]]:
+    bid = ticks["bid"].to_numpy(dtype=np.float64)
+    ask = ticks["ask"].to_numpy(dtype=np.float64)
+    frame = pd.DataFrame(
+        {
+            "event": "price",
+            "symbol": symbol,
+            "timestamp": ticks["ts"].to_numpy(dtype=np.int64) / 1e9,
+            "price": (bid + ask) * 0.5,
+            "bid": bid,
+            "ask": ask,
+            "day_volume": ticks["volume"].to_numpy(dtype=np.float64),
+        }
+    )
+    return frame.to_dict("records")
+
+
+class ReplayFeed:
+    """Stream pre-recorded events at real time, ``speed``x, or as fast as possible.
+
+    Events are built chunk by chunk, so tick files larger than memory replay
+    in constant space. ``speed=None`` (or 0) never sleeps; otherwise event
+    ``timestamp`` spacing is divided by ``speed``. Each run leaves its
+    throughput and schedule lag in ``stats``.
+    """
+
+    def __init__(
+        self,
+        chunks: Callable[[], Iterable[list[dict[str, Any]]]],
+        speed: Optional[float] = None,
+        yield_every: int = 1_024,
+    ) -> None:
+        self._chunks = chunks
+        self.speed = speed or None
+        self.yield_every = yield_every
+        self.stats = ReplayStats()
+
+    @classmethod
+    def from_bars(cls, df: pd.DataFrame, symbol: str = "XAU/USD", **kwargs) -> ReplayFeed:
+        frame = df.sort_index()
+        return cls(lambda: [_bar_events(frame, symbol)], **kwargs)
+
+    @classmethod
+    def from_cache(
+        cls, symbol: str = "XAU/USD", timeframe: str = "1h", provider: str = "twelvedata", **kwargs
+    ) -> ReplayFeed:
+        """Replay a bar file cached under ``settings.data.raw_dir``."""
+
+        prices = load_cached_prices(symbol=symbol, timeframe=timeframe, provider=provider)
+        return cls.from_bars(prices, symbol, **kwargs)
+
+    @classmethod
+    def from_ticks(
+        cls, path: Path | str, symbol: str = "XAU/USD", chunk_rows: int = 250_000, **kwargs
+    ) -> ReplayFeed:
+        def chunks() -> Iterator[list[dict[str, Any]]]:
+            for ticks in read_ticks(path, chunk_rows=chunk_rows):
+                yield _tick_events(ticks, symbol)
+
+        return cls(chunks, **kwargs)
+
+    async def stream(
+        self,
+        backlog: Optional[Callable[[], int]] = None,
+        stats: Optional[ReplayStats] = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Yield price events.
+
+        ``backlog`` reports a consumer buffer size to track. ``stats`` receives
+        this run's numbers; by default a fresh object replaces ``self.stats``.
+        """
+
+        loop = asyncio.get_running_loop()
+        if stats is None:
+            stats = self.stats = ReplayStats()
+        start = time.perf_counter()
+        wall_start = loop.time()
+        first_ts: Optional[float] = None
+        lag_total = 0.0
+        count = 0
+        for chunk in self._chunks():
+            for event in chunk:
+                if self.speed:
+                    if first_ts is None:
+                        first_ts = event["timestamp"]
+                    due = wall_start + (event["timestamp"] - first_ts) / self.speed
+                    delay = due - loop.time()
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                    else:
+                        lag_total -= delay
+                        stats.max_lag = max(stats.max_lag, -delay)
+                elif count % self.yield_every == 0:
+                    await asyncio.sleep(0)
+                if backlog is not None:
+                    stats.max_backlog_bytes = max(stats.max_backlog_bytes, backlog())
+                count += 1
+                yield event
+
+        stats.events = count
+        stats.elapsed = time.perf_counter() - start
+        stats.throughput = count / stats.elapsed if stats.elapsed else 0.0
+        stats.mean_lag = lag_total / count if count else 0.0
+
+
+def event_to_bar(event: dict[str, Any]) -> dict[str, Any]:
+    """Convert a price event into the bar mapping ``LiveRunner`` consumes."""
+
+    price = event["price"]
+    return {
+        "datetime": pd.Timestamp(event["timestamp"], unit="s", tz="UTC"),
+        "open": event.get("open", price),
+        "high": event.get("high", price),
+        "low": event.get("low", price),
+        "close": event.get("close", price),
+        "volume": event.get("volume", event.get("day_volume", 0.0)),
+    }
+
+
+async def as_bars(events: AsyncIterator[dict[str, Any]]) -> AsyncIterator[dict[str, Any]]:
+    async for event in events:
+        if event.get("event") == "price":
+            yield event_to_bar(event)
+
+
+class ReplayServer:
+    """Serve a fresh replay of ``feed`` to each TCP client as NDJSON."""
+
+    def __init__(self, feed: ReplayFeed, host: str = "127.0.0.1", port: int = 0) -> None:
+        self.feed = feed
+        self.host = host
+        self.port = port
+        self.runs: list[ReplayStats] = []
+        self._server: Optional[asyncio.Server] = None
+
+    async def start(self) -> int:
+        """Bind and return the listening port (useful with ``port=0``)."""
+
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        logger.info("Replay server listening on {}:{}", self.host, self.port)
+        return self.port
+
+    async def serve_forever(self) -> None:
+        if self._server is None:
+            await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            request = json.loads(await reader.readline() or b"{}")
+            symbols = request.get("params", {}).get("symbols", "")
+            status = {
+                "event": "subscribe-status",
+                "status": "ok",
+                "success": [{"symbol": s} for s in symbols.split(",") if s],
+            }
+            writer.write((json.dumps(status) + "\n").encode())
+            transport = writer.transport
+            stats = ReplayStats()
+            async for event in self.feed.stream(backlog=transport.get_write_buffer_size, stats=stats):
+                writer.write((json.dumps(event) + "\n").encode())
+                if transport.get_write_buffer_size() > 1 << 20:
+                    await writer.drain()
+            await writer.drain()
+            self.runs.append(stats)
+        except (ConnectionResetError, BrokenPipeError):  # pragma: no cover - client went away
+            logger.warning("Replay client disconnected early")
+        finally:
+            writer.close()
+
+
+async def replay_client(host: str, port: int, symbols: str = "XAU/USD") -> AsyncIterator[dict[str, Any]]:
+    """Subscribe to a ``ReplayServer`` and yield its price events."""
+
+    reader, writer = await asyncio.open_connection(host, port, limit=1 << 20)
+    try:
+        writer.write((json.dumps({"action": "subscribe", "params": {"symbols": symbols}}) + "\n").encode())
+        await writer.drain()
+        while line := await reader.readline():
+            event = json.loads(line)
+            if event.get("event") == "price":
+                yield event
+    finally:
+        writer.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Replay cached bars/ticks in-process or over a local socket")
+    parser.add_argument("--symbol", default=settings.providers.default_symbol)
+    parser.add_argument("--timeframe", default=settings.providers.default_interval)
+    parser.add_argument("--ticks", type=Path, default=None, help="tick file to replay instead of cached bars")
+    parser.add_argument("--speed", type=float, default=0.0, help="0 = as fast as possible, 1 = real time, N = N x")
+    parser.add_argument("--serve", action="store_true", help="serve over TCP instead of benchmarking in-process")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    configure_logging()
+    if args.ticks is not None:
+        feed = ReplayFeed.from_ticks(args.ticks, symbol=args.symbol, speed=args.speed)
+    else:
+        feed = ReplayFeed.from_cache(args.symbol, args.timeframe, speed=args.speed)
+
+    if args.serve:
+        asyncio.run(ReplayServer(feed, args.host, args.port).serve_forever())
+        return
+
+    async def drain() -> None:
+        async for _ in feed.stream():
+            pass
+
+    asyncio.run(drain())
+    print(json.dumps(asdict(feed.stats), indent=2))
+
+
+if __name__ == "__main__":
+    main()
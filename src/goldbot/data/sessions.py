@@ -0,0 +1,97 @@
+"""Trading-session calendar used to tell market closures from feed gaps."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Iterable
+
+import numpy as np
+import pandas as pd
+
+NS_PER_MINUTE = 60_000_000_000
+MINUTES_PER_DAY = 1_440
+MINUTES_PER_WEEK = 7 * MINUTES_PER_DAY
+# 1970-01-01 was a Thursday; shift so minute 0 of the week is Monday 00:00.
+_EPOCH_WEEKDAY = 3
+
+
+def _minute_of_week(weekday: int, hour: int, minute: int = 0) -> int:
+    return weekday * MINUTES_PER_DAY + hour * 60 + minute
+
+
+@dataclass(slots=True)
+class SessionCalendar:
+    """Trading hours for spot gold, defined in ``tz`` wall-clock time.
+
+    Defaults follow the XAUUSD schedule in New York time: the market trades
+    Sunday 18:00 (``weekly_open``) through Friday 17:00 (``weekly_close``) with
+    a daily break ``[daily_break_start, daily_break_end)`` of 17:00-18:00.
+    Timestamps are UTC and are converted per bar, so the break falls at
+    22:00 UTC in winter and 21:00 UTC in summer. ``holidays`` are full local
+    days with no session; brokers differ here, so none are assumed by default.
+    """
+
+    weekly_close: tuple[int, int] = (4, 17)  # Friday 17:00
+    weekly_open: tuple[int, int] = (6, 18)  # Sunday 18:00
+    daily_break_start: int = 17 * 60
+    daily_break_end: int = 18 * 60
+    holidays: tuple[date, ...] = field(default_factory=tuple)
+    tz: str = "America/New_York"
+
+    @classmethod
+    def with_holidays(cls, holidays: Iterable[date | str], **kwargs) -> SessionCalendar:
+        return cls(holidays=tuple(pd.Timestamp(d).date() for d in holidays), **kwargs)
+
+    def local_ns(self, ns: np.ndarray) -> np.ndarray:
+        """UTC epoch nanoseconds as ``tz`` wall-clock nanoseconds."""
+
+        ns = np.asarray(ns, dtype=np.int64)
+        if self.tz == "UTC" or ns.size == 0:
+            return ns
+        utc = pd.DatetimeIndex(ns.view("datetime64[ns]")).tz_localize("UTC")
+        return utc.tz_convert(self.tz).tz_localize(None).asi8
+
+    def closure(self, ns: np.ndarray) -> np.ndarray:
+        """Per-timestamp code: 0 open, 1 session close (break/weekend), 2 holiday."""
+
+        return self._local_closure(self.local_ns(ns))
+
+    def bar_closure(self, ns: np.ndarray, step_ns: int) -> np.ndarray:
+        """Closure code for bars ``[t, t + step)``.
+
+        Intraday bars are open if any hour of the span trades. Daily and coarser
+        bars are sampled at noon UTC of each day they cover, so a Sunday daily
+        bin (which only holds the first hours of Monday's session) is not an
+        expected bar.
+        """
+
+        ns = np.asarray(ns, dtype=np.int64)
+        hour = 60 * NS_PER_MINUTE
+        day = MINUTES_PER_DAY * NS_PER_MINUTE
+        if step_ns >= day:
+            local = self.local_ns(ns - ns % day + 12 * hour)
+            offsets = range(0, step_ns, day)
+        else:
+            local = self.local_ns(ns)
+            offsets = range(0, step_ns, hour)
+        codes = self._local_closure(local)
+        for offset in offsets[1:]:
+            codes = np.minimum(codes, self._local_closure(local + offset))
+        return codes
+
+    def is_open(self, index: pd.DatetimeIndex) -> np.ndarray:
+        return self.closure(index.asi8) == 0
+
+    def _local_closure(self, local: np.ndarray) -> np.ndarray:
+        minutes = local // NS_PER_MINUTE
+        of_week = (minutes + _EPOCH_WEEKDAY * MINUTES_PER_DAY) % MINUTES_PER_WEEK
+        of_day = minutes % MINUTES_PER_DAY
+        weekend = (of_week >= _minute_of_week(*self.weekly_close)) & (of_week < _minute_of_week(*self.weekly_open))
+        daily_break = (of_day >= self.daily_break_start) & (of_day < self.daily_break_end)
+        codes = np.where(weekend | daily_break, 1, 0).astype(np.int8)
+        if self.holidays:
+            days = minutes // MINUTES_PER_DAY
+            holiday_days = np.array([pd.Timestamp(d).value // (NS_PER_MINUTE * MINUTES_PER_DAY) for d in self.holidays])
+            codes[np.isin(days, holiday_days)] = 2
+        return codes
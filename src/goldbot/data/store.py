@@ -0,0 +1,200 @@
+"""Partitioned Parquet price store with date-range and column pushdown."""
+
+from __future__ import annotations
+
+import argparse
+import os
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator, Optional, Sequence
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+from loguru import logger
+
+from goldbot.config import settings
+from goldbot.data.quality import load_cached_prices
+from goldbot.utils.logging import configure_logging
+from goldbot.utils.tracing import traced
+
+INDEX_NAME = "datetime"
+_PARTITION_RE = re.compile(r"year=(\d{4})[\\/]month=(\d{2})")
+
+
+def _sanitize(symbol: str) -> str:
+    return symbol.lower().replace("/", "")
+
+
+@dataclass(slots=True)
+class PricePartition:
+    year: int
+    month: int
+    path: Path
+
+    @property
+    def start(self) -> pd.Timestamp:
+        return pd.Timestamp(year=self.year, month=self.month, day=1)
+
+    @property
+    def end(self) -> pd.Timestamp:
+        return self.start + pd.offsets.MonthBegin(1)
+
+
+@dataclass(slots=True)
+class PartitionedPriceStore:
+    """Hive-style ``symbol=/timeframe=/year=/month=`` layout under ``processed_dir``.
+
+    Each month lives in one Parquet file split into small row groups, so a
+    date-range read only opens the overlapping months and the row groups whose
+    min/max statistics intersect the requested window.
+    """
+
+    root: Optional[Path] = None
+    row_group_size: int = 10_000
+    compression: str = "zstd"
+
+    def __post_init__(self) -> None:
+        self.root = Path(self.root or settings.data.processed_dir / "prices")
+
+    def dataset_dir(self, symbol: str, timeframe: str) -> Path:
+        return self.root / f"symbol={_sanitize(symbol)}" / f"timeframe={timeframe.lower()}"
+
+    def partition_path(self, symbol: str, timeframe: str, year: int, month: int) -> Path:
+        return self.dataset_dir(symbol, timeframe) / f"year={year:04d}" / f"month={month:02d}" / "part.parquet"
+
+    def partitions(self, symbol: str, timeframe: str) -> list[PricePartition]:
+        """Return stored partitions ordered by time."""
+
+        found = []
+        for path in self.dataset_dir(symbol, timeframe).glob("year=*/month=*/part.parquet"):
+            match = _PARTITION_RE.search(str(path))
+            if match:
+                found.append(PricePartition(int(match.group(1)), int(match.group(2)), path))
+        return sorted(found, key=lambda part: (part.year, part.month))
+
+    @traced(rows_arg="df")
+    def write(self, df: pd.DataFrame, symbol: str, timeframe: str) -> list[Path]:
+        """Upsert rows, rewriting only the month partitions they fall into."""
+
+        if df.empty:
+            return []
+        frame = df.sort_index()
+        frame.index.name = INDEX_NAME
+        written = []
+        for (year, month), chunk in frame.groupby([frame.index.year, frame.index.month], sort=True):
+            path = self.partition_path(symbol, timeframe, int(year), int(month))
+            if path.exists():
+                existing = self._read_files([path])
+                chunk = pd.concat([existing, chunk])
+                chunk = chunk[~chunk.index.duplicated(keep="last")].sort_index()
+            self._write_partition(chunk, path)
+            written.append(path)
+        logger.info("Wrote {} rows across {} partitions for {} {}", len(frame), len(written), symbol, timeframe)
+        return written
+
+    @traced()
+    def read(
+        self,
+        symbol: str,
+        timeframe: str,
+        start: Optional[pd.Timestamp | str] = None,
+        end: Optional[pd.Timestamp | str] = None,
+        columns: Optional[Sequence[str]] = None,
+    ) -> pd.DataFrame:
+        """Load ``[start, end)`` for the requested columns only."""
+
+        start_ts = pd.Timestamp(start) if start is not None else None
+        end_ts = pd.Timestamp(end) if end is not None else None
+        paths = [
+            part.path
+            for part in self.partitions(symbol, timeframe)
+            if (start_ts is None or part.end > _naive(start_ts)) and (end_ts is None or part.start < _naive(end_ts))
+        ]
+        if not paths:
+            raise FileNotFoundError(f"No stored partitions for {symbol} {timeframe} in range {start}..{end}")
+        return self._read_files(paths, start_ts, end_ts, columns)
+
+    def iter_partitions(
+        self,
+        symbol: str,
+        timeframe: str,
+        columns: Optional[Sequence[str]] = None,
+    ) -> Iterator[pd.DataFrame]:
+        """Yield one frame per month so callers can scan history in bounded memory."""
+
+        for part in self.partitions(symbol, timeframe):
+            yield self.read_partition(part, columns=columns)
+
+    def read_partition(self, part: PricePartition, columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        return self._read_files([part.path], columns=columns)
+
+    def _read_files(
+        self,
+        paths: Sequence[Path],
+        start: Optional[pd.Timestamp] = None,
+        end: Optional[pd.Timestamp] = None,
+        columns: Optional[Sequence[str]] = None,
+    ) -> pd.DataFrame:
+        dataset = ds.dataset([str(p) for p in paths], format="parquet")
+        field_type = dataset.schema.field(INDEX_NAME).type
+        expr = None
+        if start is not None:
+            expr = ds.field(INDEX_NAME) >= pa.scalar(_align(start, field_type), type=field_type)
+        if end is not None:
+            upper = ds.field(INDEX_NAME) < pa.scalar(_align(end, field_type), type=field_type)
+            expr = upper if expr is None else expr & upper
+        wanted = None if columns is None else [INDEX_NAME, *[c for c in columns if c != INDEX_NAME]]
+        table = dataset.to_table(columns=wanted, filter=expr)
+        return table.to_pandas().set_index(INDEX_NAME).sort_index()
+
+    def _write_partition(self, frame: pd.DataFrame, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        table = pa.Table.from_pandas(frame.reset_index(), preserve_index=False)
+        tmp = path.with_suffix(".parquet.tmp")
+        pq.write_table(table, tmp, row_group_size=self.row_group_size, compression=self.compression)
+        os.replace(tmp, path)
+
+
+def _naive(ts: pd.Timestamp) -> pd.Timestamp:
+    return ts.tz_localize(None) if ts.tzinfo is not None else ts
+
+
+def _align(ts: pd.Timestamp, field_type: pa.DataType) -> pd.Timestamp:
+    tz = getattr(field_type, "tz", None)
+    if tz and ts.tzinfo is None:
+        return ts.tz_localize(tz)
+    if not tz and ts.tzinfo is not None:
+        return ts.tz_localize(None)
+    return ts
+
+
+def ingest_cached_prices(
+    symbol: str,
+    timeframe: str,
+    provider: str = "twelvedata",
+    store: Optional[PartitionedPriceStore] = None,
+) -> list[Path]:
+    """Copy a monolithic cached file from ``raw_dir`` into the partitioned store."""
+
+    store = store or PartitionedPriceStore()
+    df = load_cached_prices(symbol=symbol, timeframe=timeframe, provider=provider)
+    return store.write(df, symbol=symbol, timeframe=timeframe)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Import cached raw prices into the partitioned store")
+    parser.add_argument("--symbol", default=settings.providers.default_symbol)
+    parser.add_argument("--timeframe", default=settings.providers.default_interval)
+    parser.add_argument("--provider", default="twelvedata")
+    args = parser.parse_args()
+
+    configure_logging()
+    paths = ingest_cached_prices(args.symbol, args.timeframe, provider=args.provider)
+    print(f"Wrote {len(paths)} partitions")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,312 @@
+"""Chunked bid/ask tick ingestion and streaming bar aggregation."""
+
+from __future__ import annotations
+
+import argparse
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
+from loguru import logger
+
+from goldbot.data.loaders import save_price_data
+from goldbot.utils.logging import configure_logging
+from goldbot.utils.tracing import traced
+
+TICK_COLUMNS = ["ts", "bid", "ask", "volume"]
+BAR_COLUMNS = [
+    "open",
+    "high",
+    "low",
+    "close",
+    "volume",
+    "tick_count",
+    "spread_mean",
+    "spread_min",
+    "spread_max",
+]
+BAR_KINDS = ("time", "ticks", "volume")
+
+
+def _iter_batches(path: Path, chunk_rows: int) -> Iterator[pa.RecordBatch]:
+    if path.suffix.lower() == ".parquet":
+        yield from pq.ParquetFile(path).iter_batches(batch_size=chunk_rows)
+        return
+    with path.open("r") as fh:
+        header = fh.readline()
+    delimiter = "\t" if "\t" in header else ";" if ";" in header else ","
+    # MT5 terminal exports leave bid/ask blank when only the other side moved.
+    convert = pacsv.ConvertOptions(strings_can_be_null=True)
+    # ~64 bytes per tick row keeps each block close to ``chunk_rows`` rows.
+    reader = pacsv.open_csv(
+        path,
+        read_options=pacsv.ReadOptions(block_size=max(1 << 20, chunk_rows * 64)),
+        parse_options=pacsv.ParseOptions(delimiter=delimiter),
+        convert_options=convert,
+    )
+    yield from reader
+
+
+def _timestamps(frame: pd.DataFrame) -> np.ndarray:
+    """Epoch nanoseconds from MT5 (``time_msc``/``time``) or ``date``+``time`` columns."""
+
+    if "time_msc" in frame:
+        return frame["time_msc"].to_numpy(dtype=np.int64) * 1_000_000
+    if "date" in frame and "time" in frame:
+        text = frame["date"].astype(str) + " " + frame["time"].astype(str)
+        stamps = pd.to_datetime(text.str.replace(".", "-", n=2), utc=True)
+        return stamps.to_numpy(dtype="datetime64[ns]").view(np.int64)
+    for column in ("time", "datetime", "timestamp"):
+        if column in frame:
+            values = frame[column]
+            if pd.api.types.is_numeric_dtype(values):
+                return values.to_numpy(dtype=np.int64) * 1_000_000_000
+            stamps = pd.to_datetime(values, utc=True)
+            return stamps.to_numpy(dtype="datetime64[ns]").view(np.int64)
+    raise ValueError(f"No timestamp column among {list(frame.columns)}")
+
+
+def read_ticks(path: Path | str, chunk_rows: int = 1_000_000) -> Iterator[pd.DataFrame]:
+    """Yield ``ts/bid/ask/volume`` frames from a CSV or Parquet tick export.
+
+    Only one block is held in memory at a time. Column names are normalized
+    (MT5's ``<BID>`` style headers included), missing quotes are carried
+    forward across chunk boundaries, and ``ts`` is epoch nanoseconds (UTC).
+    """
+
+    path = Path(path)
+    last_bid = last_ask = np.nan
+    for batch in _iter_batches(path, chunk_rows):
+        frame = batch.to_pandas()
+        frame.columns = [str(c).strip().strip("<>").lower() for c in frame.columns]
+        if "bid" not in frame or "ask" not in frame:
+            raise ValueError(f"{path} needs bid and ask columns, found {list(frame.columns)}")
+        bid = frame["bid"].astype(np.float64).replace(0.0, np.nan)
+        ask = frame["ask"].astype(np.float64).replace(0.0, np.nan)
+        if np.isnan(bid.iloc[0]):
+            bid.iloc[0] = last_bid
+        if np.isnan(ask.iloc[0]):
+            ask.iloc[0] = last_ask
+        bid = bid.ffill()
+        ask = ask.ffill()
+        last_bid, last_ask = bid.iloc[-1], ask.iloc[-1]
+        volume_col = next((c for c in ("volume_real", "volume") if c in frame), None)
+        volume = frame[volume_col].fillna(0.0).to_numpy(dtype=np.float64) if volume_col else np.zeros(len(frame))
+        yield pd.DataFrame(
+            {"ts": _timestamps(frame), "bid": bid.to_numpy(), "ask": ask.to_numpy(), "volume": volume}
+        ).dropna(subset=["bid", "ask"])
+
+
+@dataclass(slots=True)
+class _OpenBar:
+    bar_id: int
+    label: int
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: float
+    tick_count: int
+    spread_sum: float
+    spread_min: float
+    spread_max: float
+
+
+class TickBarAggregator:
+    """Constant-memory tick-to-bar aggregator.
+
+    ``kind="time"`` buckets by a fixed ``resample_bars``-style rule (``"1min"``,
+    ``"15min"``, ``"1h"``), labelled by bucket start like ``DataFrame.resample``.
+    ``kind="ticks"`` closes a bar every ``size`` ticks and ``kind="volume"``
+    on the tick that carries cumulative volume past the next multiple of
+    ``size`` (so overshoot is not re-counted); both are labelled by their first
+    tick. Prices are the bid/ask mid unless ``price="bid"`` or ``"ask"``. Each
+    chunk is reduced with ``ufunc.reduceat``; only the still-open bar is carried
+    over.
+    """
+
+    def __init__(self, kind: str = "time", size: str | float = "1min", price: str = "mid") -> None:
+        if kind not in BAR_KINDS:
+            raise ValueError(f"Unknown bar kind {kind!r}; expected one of {BAR_KINDS}")
+        if price not in {"mid", "bid", "ask"}:
+            raise ValueError(f"Unknown price {price!r}")
+        self.kind = kind
+        self.price = price
+        if kind == "time":
+            self._step = pd.Timedelta(size).value
+        else:
+            self._step = float(size)
+            if self._step <= 0:
+                raise ValueError("Bar size must be positive")
+        self._open: Optional[_OpenBar] = None
+        self._ticks_seen = 0
+        self._volume_seen = 0.0
+        self.ticks_processed = 0
+
+    @traced(rows_arg="ticks")
+    def update(self, ticks: pd.DataFrame) -> pd.DataFrame:
+        """Consume a chunk of ticks and return the bars it completed."""
+
+        if ticks.empty:
+            return self._frame(*([np.empty(0)] * (len(BAR_COLUMNS) + 1)))
+        ts = ticks["ts"].to_numpy(dtype=np.int64)
+        bid = ticks["bid"].to_numpy(dtype=np.float64)
+        ask = ticks["ask"].to_numpy(dtype=np.float64)
+        volume = ticks["volume"].to_numpy(dtype=np.float64)
+        price = (bid + ask) * 0.5 if self.price == "mid" else (bid if self.price == "bid" else ask)
+        spread = ask - bid
+        n = ts.size
+        self.ticks_processed += n
+
+        bar_ids = self._bar_ids(ts, volume)
+        starts = np.concatenate(([0], np.flatnonzero(bar_ids[1:] != bar_ids[:-1]) + 1))
+        ends = np.append(starts[1:], n)
+        ids = bar_ids[starts]
+        labels = ids * self._step if self.kind == "time" else ts[starts]
+        opens = price[starts]
+        highs = np.maximum.reduceat(price, starts)
+        lows = np.minimum.reduceat(price, starts)
+        closes = price[ends - 1]
+        volumes = np.add.reduceat(volume, starts)
+        counts = ends - starts
+        spread_sum = np.add.reduceat(spread, starts)
+        spread_min = np.minimum.reduceat(spread, starts)
+        spread_max = np.maximum.reduceat(spread, starts)
+
+        carried = self._open
+        if carried is not None and carried.bar_id == ids[0]:
+            labels[0] = carried.label
+            opens[0] = carried.open
+            highs[0] = max(highs[0], carried.high)
+            lows[0] = min(lows[0], carried.low)
+            volumes[0] += carried.volume
+            counts[0] += carried.tick_count
+            spread_sum[0] += carried.spread_sum
+            spread_min[0] = min(spread_min[0], carried.spread_min)
+            spread_max[0] = max(spread_max[0], carried.spread_max)
+            carried = None
+
+        self._open = _OpenBar(
+            int(ids[-1]),
+            int(labels[-1]),
+            float(opens[-1]),
+            float(highs[-1]),
+            float(lows[-1]),
+            float(closes[-1]),
+            float(volumes[-1]),
+            int(counts[-1]),
+            float(spread_sum[-1]),
+            float(spread_min[-1]),
+            float(spread_max[-1]),
+        )
+        done = slice(0, len(ids) - 1)
+        columns = [
+            labels[done],
+            opens[done],
+            highs[done],
+            lows[done],
+            closes[done],
+            volumes[done],
+            counts[done],
+            spread_sum[done] / counts[done],
+            spread_min[done],
+            spread_max[done],
+        ]
+        if carried is not None:
+            columns = [np.concatenate(([value], col)) for value, col in zip(self._row(carried), columns)]
+        return self._frame(*columns)
+
+    def flush(self) -> pd.DataFrame:
+        """Emit the bar still being built (end of stream)."""
+
+        if self._open is None:
+            return self.update(pd.DataFrame(columns=TICK_COLUMNS))
+        row = self._row(self._open)
+        self._open = None
+        return self._frame(*([value] for value in row))
+
+    def _bar_ids(self, ts: np.ndarray, volume: np.ndarray) -> np.ndarray:
+        if self.kind == "time":
+            return ts // self._step
+        if self.kind == "ticks":
+            ids = (self._ticks_seen + np.arange(ts.size)) // int(self._step)
+            self._ticks_seen += ts.size
+            return ids
+        # A tick belongs to the bar that was open before its volume traded.
+        before = self._volume_seen + np.cumsum(volume) - volume
+        self._volume_seen = float(before[-1] + volume[-1])
+        return np.floor(before / self._step).astype(np.int64)
+
+    @staticmethod
+    def _row(bar: _OpenBar) -> tuple:
+        return (
+            bar.label,
+            bar.open,
+            bar.high,
+            bar.low,
+            bar.close,
+            bar.volume,
+            bar.tick_count,
+            bar.spread_sum / bar.tick_count,
+            bar.spread_min,
+            bar.spread_max,
+        )
+
+    @staticmethod
+    def _frame(labels, *values) -> pd.DataFrame:
+        index = pd.DatetimeIndex(np.asarray(labels, dtype=np.int64).view("datetime64[ns]"), name="datetime")
+        frame = pd.DataFrame(dict(zip(BAR_COLUMNS, values)), index=index.tz_localize("UTC"))
+        return frame.astype({"tick_count": np.int64})
+
+
+def aggregate_ticks(
+    chunks: Iterable[pd.DataFrame],
+    kind: str = "time",
+    size: str | float = "1min",
+    price: str = "mid",
+) -> pd.DataFrame:
+    """Stream tick chunks through a ``TickBarAggregator`` and collect every bar."""
+
+    aggregator = TickBarAggregator(kind=kind, size=size, price=price)
+    bars = [aggregator.update(chunk) for chunk in chunks]
+    bars.append(aggregator.flush())
+    return pd.concat(bars)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Aggregate a bid/ask tick export into spread-aware bars")
+    parser.add_argument("path", type=Path, help="CSV or Parquet tick file (e.g. MT5 copy_ticks_range export)")
+    parser.add_argument("--symbol", default="XAUUSD")
+    parser.add_argument("--kind", choices=BAR_KINDS, default="time")
+    parser.add_argument("--size", default="1min", help="time rule, ticks per bar, or volume per bar")
+    parser.add_argument("--price", choices=["mid", "bid", "ask"], default="mid")
+    parser.add_argument("--chunk-rows", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    configure_logging()
+    size = args.size if args.kind == "time" else float(args.size)
+    aggregator = TickBarAggregator(kind=args.kind, size=size, price=args.price)
+    start = time.perf_counter()
+    bars = [aggregator.update(chunk) for chunk in read_ticks(args.path, chunk_rows=args.chunk_rows)]
+    bars.append(aggregator.flush())
+    elapsed = time.perf_counter() - start
+    result = pd.concat(bars)
+    logger.info(
+        "Aggregated {} ticks into {} bars in {:.2f}s ({:,.0f} ticks/s)",
+        aggregator.ticks_processed,
+        len(result),
+        elapsed,
+        aggregator.ticks_processed / max(elapsed, 1e-9),
+    )
+    path = save_price_data(result, symbol=args.symbol, timeframe=f"{args.kind}_{args.size}", provider="ticks")
+    print(f"Saved {len(result)} bars to {path}")
+
+
+if __name__ == "__main__":
+    main()
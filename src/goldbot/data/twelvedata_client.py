@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 import logging
-from datetime import date
+import time
+from datetime import date, datetime
 from typing import Any, Iterable, Optional
 
 import pandas as pd
@@ -11,6 +12,8 @@ import requests
 from tenacity import retry, stop_after_attempt, wait_exponential
 
 from goldbot.config import settings
+from goldbot.utils.latency import LatencyRecorder
+from goldbot.utils.rate_limit import TokenBucket
 
 LOGGER = logging.getLogger(__name__)
 
@@ -24,11 +27,17 @@ class TwelveDataClient:
         self,
         api_key: Optional[str] = None,
         session: Optional[requests.Session] = None,
+        base_url: Optional[str] = None,
+        rate_limiter: Optional[TokenBucket] = None,
+        latency: Optional[LatencyRecorder] = None,
     ) -> None:
         self.api_key = api_key or settings.providers.twelvedata_api_key
         if not self.api_key:
             raise ValueError("Twelve Data API key missing. Set GOLD_PROVIDERS__TWELVEDATA_API_KEY.")
         self.session = session or requests.Session()
+        self.base_url = (base_url or self.BASE_URL).rstrip("/")
+        self.rate_limiter = rate_limiter
+        self.latency = latency
 
     def fetch_time_series(
         self,
@@ -51,9 +60,9 @@ class TwelveDataClient:
             "format": "JSON",
         }
         if start_date:
-            params["start_date"] = start_date.isoformat()
+            params["start_date"] = _format_date(start_date)
         if end_date:
-            params["end_date"] = end_date.isoformat()
+            params["end_date"] = _format_date(end_date)
 
         values = list(self._paginate("time_series", params))
         if not values:
@@ -88,9 +97,26 @@ class TwelveDataClient:
 
     @retry(wait=wait_exponential(multiplier=1, min=2, max=10), stop=stop_after_attempt(3))
     def _get(self, endpoint: str, params: dict[str, Any]) -> dict[str, Any]:
-        url = f"{self.BASE_URL}/{endpoint}"
+        url = f"{self.base_url}/{endpoint}"
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
         LOGGER.debug("Requesting Twelve Data endpoint %s with params %s", endpoint, params)
+        start = time.perf_counter()
         response = self.session.get(url, params=params, timeout=30)
+        if self.latency is not None:
+            self.latency.record(endpoint, time.perf_counter() - start)
         response.raise_for_status()
         return response.json()
 
+
+def _format_date(value: date) -> str:
+    """Render dates as ``YYYY-MM-DD`` and datetimes as ``YYYY-MM-DD HH:MM:SS``.
+
+    Aware datetimes are converted to UTC, matching the ``timezone`` we request.
+    """
+
+    if isinstance(value, datetime):
+        if value.tzinfo is not None:
+            value = pd.Timestamp(value).tz_convert("UTC").to_pydatetime()
+        return value.strftime("%Y-%m-%d %H:%M:%S")
+    return value.isoformat()
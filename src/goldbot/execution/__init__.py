@@ -1,8 +1,20 @@
-"""Execution layer exports."""
+"""Execution layer exports, imported on first use."""
 
-from .broker_stub import BrokerStub, Order
-from .mt5_adapter import MT5Adapter
-from .smoke import run_mt5_smoke_test
+from goldbot.utils.lazy import lazy_exports
 
-__all__ = ["BrokerStub", "Order", "MT5Adapter", "run_mt5_smoke_test"]
+_EXPORTS = {
+    "BrokerStub": ".broker_stub",
+    "Order": ".broker_stub",
+    "Broker": ".live",
+    "BarRingBuffer": ".live",
+    "LiveRunner": ".live",
+    "frame_feed": ".live",
+    "MT5Adapter": ".mt5_adapter",
+    "MT5Session": ".mt5_session",
+    "OrderDispatcher": ".mt5_session",
+    "PaperBroker": ".paper_broker",
+    "run_mt5_smoke_test": ".smoke",
+}
 
+__all__ = list(_EXPORTS)
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
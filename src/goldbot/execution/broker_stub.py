@@ -17,7 +17,7 @@ class Order:
     side: OrderSide
     quantity: float
     price: float | None = None
-    order_type: Literal["market", "limit"] = "market"
+    order_type: Literal["market", "limit", "stop"] = "market"
 
 
 class BrokerStub:
@@ -0,0 +1,282 @@
+"""Asyncio live loop: feed -> ring buffer -> streaming features -> strategy -> broker."""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import inspect
+import time
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterable, AsyncIterator, Mapping, Optional, Protocol, Sequence
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+from goldbot.config import settings
+from goldbot.data.quality import load_cached_prices
+from goldbot.execution.broker_stub import Order
+from goldbot.execution.paper_broker import PaperBroker
+from goldbot.features.streaming import IncrementalFeatureEngine
+from goldbot.strategies import DualMovingAverageStrategy
+from goldbot.utils.latency import LatencyRecorder
+from goldbot.utils.logging import configure_logging
+from goldbot.utils.tracing import span
+
+BAR_FIELDS = ("open", "high", "low", "close", "volume")
+_STOP = object()
+
+
+class Broker(Protocol):
+    """Anything that accepts orders; ``submit`` may be sync or a coroutine."""
+
+    def submit(self, order: Order) -> Any: ...
+
+    def cancel(self, order_id: str) -> Any: ...
+
+
+class LiveStrategy(Protocol):
+    name: str
+
+    def on_bar(self, features: Mapping[str, float]) -> float:
+        """Return the target position (sign = direction) after the latest bar."""
+        ...
+
+
+class BarRingBuffer:
+    """Fixed-capacity OHLCV history backed by pre-allocated numpy arrays."""
+
+    def __init__(self, capacity: int = 1_024, fields: Sequence[str] = BAR_FIELDS) -> None:
+        self.capacity = capacity
+        self.fields = tuple(fields)
+        self._times = np.zeros(capacity, dtype=np.int64)
+        self._values = np.full((capacity, len(self.fields)), np.nan)
+        self._next = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def append(self, timestamp_ns: int, bar: Mapping[str, float]) -> None:
+        slot = self._next
+        self._times[slot] = timestamp_ns
+        row = self._values[slot]
+        for i, name in enumerate(self.fields):
+            row[i] = bar.get(name, np.nan)
+        self._next = (slot + 1) % self.capacity
+        self._count = min(self._count + 1, self.capacity)
+
+    @property
+    def last_timestamp(self) -> Optional[int]:
+        return int(self._times[self._next - 1]) if self._count else None
+
+    def _order(self, n: Optional[int] = None) -> np.ndarray:
+        n = self._count if n is None else min(n, self._count)
+        return (np.arange(self._next - n, self._next)) % self.capacity
+
+    def latest(self, field_name: str, n: Optional[int] = None) -> np.ndarray:
+        """Oldest-to-newest values of one field for the last ``n`` bars."""
+
+        return self._values[self._order(n), self.fields.index(field_name)]
+
+    def to_frame(self, n: Optional[int] = None) -> pd.DataFrame:
+        order = self._order(n)
+        index = pd.to_datetime(self._times[order], utc=True)
+        return pd.DataFrame(self._values[order], index=index, columns=list(self.fields))
+
+
+@dataclass(slots=True)
+class LiveRunResult:
+    bars: int
+    position: float
+    orders: list[tuple[str, Order]] = field(default_factory=list)
+    latency: dict[str, dict[str, float]] = field(default_factory=dict)
+    elapsed: float = 0.0
+
+
+def _timestamp_ns(value: Any) -> int:
+    if isinstance(value, (int, np.integer)):
+        return int(value)
+    return pd.Timestamp(value).value
+
+
+async def frame_feed(df: pd.DataFrame, speed: Optional[float] = None) -> AsyncIterator[dict[str, Any]]:
+    """Replay a bar frame as an async feed.
+
+    ``speed=None`` emits as fast as possible (yielding to the loop every few
+    hundred bars); ``speed=N`` paces bars at ``N`` times their original spacing.
+    """
+
+    loop = asyncio.get_running_loop()
+    records = df.reset_index(names="datetime").to_dict("records")
+    if not records:
+        return
+    first = pd.Timestamp(records[0]["datetime"])
+    wall_start = loop.time()
+    for i, bar in enumerate(records):
+        if speed:
+            due = wall_start + (pd.Timestamp(bar["datetime"]) - first).total_seconds() / speed
+            delay = due - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+        elif i % 256 == 0:
+            await asyncio.sleep(0)
+        yield bar
+
+
+class LiveRunner:
+    """Consume a bar feed, update features incrementally, and route orders.
+
+    Bars are pulled off the feed by a producer task into a bounded queue so
+    feed stalls and processing backlog show up separately. Every bar records
+    ``queue_wait``, ``features`` and ``strategy`` timings; bars that change the
+    target position also record ``order`` (broker call) and ``bar_to_order``
+    (bar arrival to broker acknowledgement). Brokers exposing ``on_bar`` (such
+    as the default ``PaperBroker``) see each bar first so resting orders
+    match and positions are marked before the strategy runs.
+
+    Recent bars are kept in ``buffer``. Bars stamped at or before the newest
+    buffered bar (a feed replaying history after a reconnect) are skipped so
+    they do not advance the incremental features twice, and
+    ``rebuild_features`` restores feature state from the buffer after a restart.
+    """
+
+    def __init__(
+        self,
+        strategy: LiveStrategy,
+        broker: Optional[Broker] = None,
+        symbol: Optional[str] = None,
+        quantity: float = 1.0,
+        buffer_size: int = 1_024,
+        features: Optional[IncrementalFeatureEngine] = None,
+        queue_size: int = 1_024,
+        latency: Optional[LatencyRecorder] = None,
+    ) -> None:
+        self.strategy = strategy
+        self.broker = broker if broker is not None else PaperBroker()
+        self.symbol = symbol or settings.mt5.symbol
+        self.quantity = quantity
+        self.buffer = BarRingBuffer(buffer_size)
+        self.features = features or IncrementalFeatureEngine(
+            fast=getattr(strategy, "fast", 21), slow=getattr(strategy, "slow", 55)
+        )
+        self.queue_size = queue_size
+        self.latency = latency or LatencyRecorder()
+        self.position = 0.0
+        self.orders: list[tuple[str, Order]] = []
+        self.bars_processed = 0
+
+    async def run(self, feed: AsyncIterable[Mapping[str, Any]]) -> LiveRunResult:
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        start = time.perf_counter()
+        producer = asyncio.create_task(self._pump(feed, queue))
+        try:
+            while True:
+                item = await queue.get()
+                if item is _STOP:
+                    break
+                received, bar = item
+                await self.on_bar(bar, received)
+        finally:
+            if not producer.done():
+                producer.cancel()
+        await asyncio.gather(producer, return_exceptions=False)
+        return LiveRunResult(
+            bars=self.bars_processed,
+            position=self.position,
+            orders=list(self.orders),
+            latency=self.latency.summaries(),
+            elapsed=time.perf_counter() - start,
+        )
+
+    async def on_bar(self, bar: Mapping[str, Any], received: Optional[float] = None) -> Optional[str]:
+        """Process one bar; returns the broker order id when an order was sent."""
+
+        with span("execution.live.on_bar", rows=1):
+            return await self._process_bar(bar, received)
+
+    async def _process_bar(self, bar: Mapping[str, Any], received: Optional[float]) -> Optional[str]:
+        clock = time.perf_counter
+        t0 = clock()
+        received = received if received is not None else t0
+        record = self.latency.record
+        record("queue_wait", t0 - received)
+
+        if "datetime" in bar:
+            stamp = _timestamp_ns(bar["datetime"])
+            last = self.buffer.last_timestamp
+            if last is not None and stamp <= last:
+                logger.debug("Skipping stale bar {} (latest buffered {})", bar["datetime"], last)
+                return None
+        else:
+            stamp = 0
+        self.buffer.append(stamp, bar)
+        if hasattr(self.broker, "on_bar"):
+            self.broker.on_bar(bar, self.symbol)
+        features = self.features.update(bar)
+        t1 = clock()
+        record("features", t1 - t0)
+
+        target = float(self.strategy.on_bar(features))
+        t2 = clock()
+        record("strategy", t2 - t1)
+        self.bars_processed += 1
+        if target == self.position:
+            return None
+
+        delta = target - self.position
+        order = Order(
+            symbol=self.symbol,
+            side="buy" if delta > 0 else "sell",
+            quantity=abs(delta) * self.quantity,
+            price=float(bar["close"]),
+        )
+        with span("execution.live.order", side=order.side):
+            order_id = self.broker.submit(order)
+            if inspect.isawaitable(order_id):
+                order_id = await order_id
+        t3 = clock()
+        record("order", t3 - t2)
+        record("bar_to_order", t3 - received)
+        self.position = target
+        self.orders.append((order_id, order))
+        return order_id
+
+    def rebuild_features(self, engine: Optional[IncrementalFeatureEngine] = None) -> IncrementalFeatureEngine:
+        """Replay the buffered bars into a fresh feature engine and switch to it."""
+
+        engine = engine or IncrementalFeatureEngine(fast=self.features.fast, slow=self.features.slow)
+        if len(self.buffer):
+            engine.update_frame(self.buffer.to_frame())
+        self.features = engine
+        return engine
+
+    @staticmethod
+    async def _pump(feed: AsyncIterable[Mapping[str, Any]], queue: asyncio.Queue) -> None:
+        try:
+            async for bar in feed:
+                await queue.put((time.perf_counter(), bar))
+        finally:
+            await queue.put(_STOP)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run the live loop against a replay of cached bars")
+    parser.add_argument("--symbol", default="XAU/USD")
+    parser.add_argument("--timeframe", default="1h")
+    parser.add_argument("--bars", type=int, default=5_000, help="replay the most recent N cached bars")
+    parser.add_argument("--speed", type=float, default=0.0, help="replay speed multiple; 0 = as fast as possible")
+    parser.add_argument("--quantity", type=float, default=0.01)
+    args = parser.parse_args()
+
+    configure_logging()
+    prices = load_cached_prices(symbol=args.symbol, timeframe=args.timeframe).tail(args.bars)
+    runner = LiveRunner(DualMovingAverageStrategy(), quantity=args.quantity)
+    result = asyncio.run(runner.run(frame_feed(prices, speed=args.speed or None)))
+    logger.info("Processed {} bars in {:.2f}s, {} orders", result.bars, result.elapsed, len(result.orders))
+    for label, summary in result.latency.items():
+        print(f"{label:>13}: {summary}")
+
+
+if __name__ == "__main__":
+    main()
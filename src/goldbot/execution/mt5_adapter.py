@@ -40,7 +40,15 @@ class MT5Adapter:
         if not mt5.initialize(server=self.server, login=int(self.login), password=self.password):
             raise RuntimeError(f"MT5 initialize failed: {mt5.last_error()}")
         account_info = mt5.account_info()
-        logger.info("Connected to MT5 server %s as %s", self.server, account_info.name)
+        logger.info("Connected to MT5 server {} as {}", self.server, getattr(account_info, "name", self.login))
+
+    def is_connected(self) -> bool:
+        """Cheap liveness probe used by heartbeats."""
+
+        if mt5 is None:
+            return False
+        info = mt5.terminal_info()
+        return info is not None and bool(getattr(info, "connected", True))
 
     def shutdown(self) -> None:
         if mt5 is None:
@@ -48,34 +56,43 @@ class MT5Adapter:
         mt5.shutdown()
         logger.info("MT5 connection closed")
 
-    def place_market_order(
+    def market_request(
         self,
         side: OrderSide,
         volume: float,
+        tick,
         deviation: int = 20,
         comment: str | None = None,
     ) -> dict:
-        """Submit a market order and return MT5 result dictionary."""
+        """Build a TRADE_ACTION_DEAL request priced off an already-fetched tick."""
 
-        if mt5 is None:
-            raise ImportError("MetaTrader5 package not installed.")
-        order_type = mt5.ORDER_TYPE_BUY if side == "buy" else mt5.ORDER_TYPE_SELL
-        price = mt5.symbol_info_tick(self.symbol).ask if side == "buy" else mt5.symbol_info_tick(self.symbol).bid
-        request = {
+        return {
             "action": mt5.TRADE_ACTION_DEAL,
             "symbol": self.symbol,
             "volume": volume,
-            "type": order_type,
-            "price": price,
+            "type": mt5.ORDER_TYPE_BUY if side == "buy" else mt5.ORDER_TYPE_SELL,
+            "price": tick.ask if side == "buy" else tick.bid,
             "deviation": deviation,
             "magic": 4242,
             "comment": comment or "goldbot",
             "type_time": mt5.ORDER_TIME_GTC,
             "type_filling": mt5.ORDER_FILLING_IOC,
         }
-        logger.info("Sending MT5 order: %s", request)
+
+    def place_market_order(
+        self,
+        side: OrderSide,
+        volume: float,
+        deviation: int = 20,
+        comment: str | None = None,
+    ) -> dict:
+        """Submit a market order and return MT5 result dictionary."""
+
+        if mt5 is None:
+            raise ImportError("MetaTrader5 package not installed.")
+        request = self.market_request(side, volume, mt5.symbol_info_tick(self.symbol), deviation, comment)
+        logger.info("Sending MT5 order: {}", request)
         result = mt5.order_send(request)
         if result.retcode != mt5.TRADE_RETCODE_DONE:
             raise RuntimeError(f"Order failed: {result.retcode} ({result.comment})")
         return result._asdict()
-
@@ -0,0 +1,324 @@
+"""Persistent MT5 session: heartbeat, reconnect, cached quotes, coalesced orders."""
+
+from __future__ import annotations
+
+import queue
+import threading
+import time
+import uuid
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Callable, Optional
+
+from loguru import logger
+
+from goldbot.execution import mt5_adapter
+from goldbot.execution.mt5_adapter import MT5Adapter, OrderSide
+from goldbot.utils.latency import LatencyRecorder
+from goldbot.utils.tracing import traced
+
+
+def _api():
+    """The ``MetaTrader5`` module, resolved per call so tests can swap in a fake."""
+
+    if mt5_adapter.mt5 is None:
+        raise ImportError("MetaTrader5 package not installed. Run `pip install MetaTrader5`.")
+    return mt5_adapter.mt5
+
+
+def _order_tag(comment: Optional[str]) -> str:
+    """Unique order comment (MT5 keeps 31 characters) used to find the deal after a lost reply."""
+
+    return f"{(comment or 'goldbot')[:22]}-{uuid.uuid4().hex[:8]}"
+
+
+@dataclass(slots=True)
+class _CacheEntry:
+    value: Any
+    expires: float
+
+
+@dataclass(slots=True)
+class SessionHealth:
+    connected: bool = False
+    connects: int = 0
+    reconnects: int = 0
+    failed_heartbeats: int = 0
+    last_heartbeat: Optional[float] = None
+
+
+class MT5Session:
+    """Long-lived MT5 connection shared by the live loop, order flow, and smoke checks.
+
+    ``connect`` retries with exponential backoff. A background heartbeat
+    (``start``) probes ``terminal_info`` and reconnects when the terminal drops.
+    Ticks and symbol info are served from a short-TTL cache so bursts of
+    orders reuse one quote. All terminal calls hold one lock because the
+    ``MetaTrader5`` API is not thread-safe.
+    """
+
+    def __init__(
+        self,
+        adapter: Optional[MT5Adapter] = None,
+        heartbeat_interval: float = 5.0,
+        tick_ttl: float = 0.25,
+        symbol_info_ttl: float = 60.0,
+        backoff: float = 0.5,
+        max_backoff: float = 30.0,
+        max_attempts: int = 5,
+        latency: Optional[LatencyRecorder] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.adapter = adapter or MT5Adapter()
+        self.heartbeat_interval = heartbeat_interval
+        self.tick_ttl = tick_ttl
+        self.symbol_info_ttl = symbol_info_ttl
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.max_attempts = max_attempts
+        self.latency = latency or LatencyRecorder()
+        self.health = SessionHealth()
+        self._clock = clock
+        self._sleep = sleep
+        self._cache: dict[tuple[str, str], _CacheEntry] = {}
+        self._lock = threading.RLock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def symbol(self) -> str:
+        return self.adapter.symbol
+
+    def connect(self) -> None:
+        delay = self.backoff
+        for attempt in range(1, self.max_attempts + 1):
+            try:
+                with self._lock:
+                    self.adapter.connect()
+                self.health.connected = True
+                self.health.connects += 1
+                return
+            except RuntimeError as exc:
+                self.health.connected = False
+                if attempt == self.max_attempts:
+                    raise
+                logger.warning("MT5 connect attempt {} failed ({}); retrying in {:.1f}s", attempt, exc, delay)
+                self._sleep(delay)
+                delay = min(delay * 2, self.max_backoff)
+
+    def close(self) -> None:
+        self.stop()
+        with self._lock:
+            self.adapter.shutdown()
+        self.health.connected = False
+
+    def __enter__(self) -> MT5Session:
+        self.connect()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def heartbeat(self) -> bool:
+        """Probe the terminal once; reconnect (and drop cached quotes) if it is gone."""
+
+        with self._lock:
+            alive = self.adapter.is_connected()
+        self.health.last_heartbeat = self._clock()
+        if alive:
+            return True
+        self.health.failed_heartbeats += 1
+        self.health.connected = False
+        self._cache.clear()
+        logger.warning("MT5 heartbeat failed; reconnecting")
+        with self._lock:
+            self.adapter.shutdown()
+        self.connect()
+        self.health.reconnects += 1
+        return False
+
+    def start(self) -> None:
+        """Connect (if needed) and run the heartbeat on a daemon thread."""
+
+        if not self.health.connected:
+            self.connect()
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._heartbeat_loop, name="mt5-heartbeat", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.heartbeat_interval + 1)
+            self._thread = None
+
+    def tick(self, symbol: Optional[str] = None):
+        symbol = symbol or self.symbol
+        return self._cached("tick", symbol, self.tick_ttl, lambda: _api().symbol_info_tick(symbol))
+
+    def symbol_info(self, symbol: Optional[str] = None):
+        symbol = symbol or self.symbol
+        return self._cached("symbol_info", symbol, self.symbol_info_ttl, lambda: _api().symbol_info(symbol))
+
+    @traced()
+    def place_market_order(
+        self,
+        side: OrderSide,
+        volume: float,
+        deviation: int = 20,
+        comment: Optional[str] = None,
+    ) -> dict:
+        """Send one market order, tagged with a unique comment.
+
+        A ``None`` reply means the terminal went away mid-request and the order
+        may or may not have executed. The session reconnects and looks for deals
+        carrying the tag; only when the deal history confirms nothing filled is
+        the order sent again. If the history cannot be read, or the resend also
+        gets no reply, ``RuntimeError`` is raised and retrying is left to the caller.
+        """
+
+        mt5 = _api()
+        tag = _order_tag(comment)
+        sent_at = datetime.now()
+        for attempt in range(2):
+            request = self.adapter.market_request(side, volume, self.tick(), deviation, tag)
+            start = time.perf_counter()
+            with self._lock:
+                result = mt5.order_send(request)
+            self.latency.record("order_send", time.perf_counter() - start)
+            if result is not None or attempt == 1:
+                break
+            self.heartbeat()
+            deals = self._tagged_deals(tag, request["magic"], sent_at)
+            if deals is None:
+                raise RuntimeError(f"Order {tag} outcome unknown: no reply and deal history unavailable")
+            if deals:
+                logger.warning("MT5 reply lost but order {} filled; not resending", tag)
+                return {
+                    "retcode": mt5.TRADE_RETCODE_DONE,
+                    "comment": tag,
+                    "volume": sum(deal.volume for deal in deals),
+                    "price": deals[-1].price,
+                    "order": deals[-1].order,
+                    "recovered": True,
+                }
+        if result is None:
+            raise RuntimeError(f"Order {tag} outcome unknown: no reply from terminal ({mt5.last_error()})")
+        if result.retcode != mt5.TRADE_RETCODE_DONE:
+            raise RuntimeError(f"Order failed: {result.retcode} ({result.comment})")
+        return result._asdict()
+
+    def _tagged_deals(self, tag: str, magic: int, since: datetime) -> Optional[list]:
+        """Deals booked for ``tag`` since ``since``; ``None`` when the history cannot be read."""
+
+        # Terminal history is in server time; a day of slack either side covers any offset.
+        with self._lock:
+            deals = _api().history_deals_get(since - timedelta(days=1), datetime.now() + timedelta(days=1))
+        if deals is None:
+            return None
+        return [deal for deal in deals if deal.comment == tag and deal.magic == magic]
+
+    def latency_histogram(self) -> dict[str, int]:
+        return self.latency.histogram("order_send")
+
+    def _cached(self, kind: str, symbol: str, ttl: float, load: Callable[[], Any]) -> Any:
+        key = (kind, symbol)
+        now = self._clock()
+        entry = self._cache.get(key)
+        if entry is not None and entry.expires > now:
+            return entry.value
+        with self._lock:
+            value = load()
+        if value is None:
+            raise RuntimeError(f"MT5 returned no {kind} for {symbol}")
+        self._cache[key] = _CacheEntry(value, now + ttl)
+        return value
+
+    def _heartbeat_loop(self) -> None:
+        while not self._stop.wait(self.heartbeat_interval):
+            try:
+                self.heartbeat()
+            except Exception as exc:  # noqa: BLE001 - keep the heartbeat thread alive
+                logger.error("MT5 heartbeat error: {}", exc)
+
+
+@dataclass(slots=True)
+class _QueuedOrder:
+    side: OrderSide
+    volume: float
+    comment: Optional[str]
+    future: Future = field(default_factory=Future)
+    queued_at: float = field(default_factory=time.perf_counter)
+
+
+class OrderDispatcher:
+    """Queue market orders and net bursts into a single terminal request.
+
+    Orders arriving within ``coalesce_window`` seconds of the first queued one
+    (up to ``max_batch``) are summed by signed volume and sent as one order;
+    every caller's future resolves to that shared result with a ``coalesced``
+    count. Bursts that net to zero resolve without touching the terminal.
+    Submit-to-fill round trips are recorded under ``order_round_trip``.
+    """
+
+    def __init__(self, session: MT5Session, coalesce_window: float = 0.005, max_batch: int = 100) -> None:
+        self.session = session
+        self.coalesce_window = coalesce_window
+        self.max_batch = max_batch
+        self.batches_sent = 0
+        self._queue: queue.Queue[Optional[_QueuedOrder]] = queue.Queue()
+        self._worker = threading.Thread(target=self._run, name="mt5-orders", daemon=True)
+        self._worker.start()
+
+    def submit(self, side: OrderSide, volume: float, comment: Optional[str] = None) -> Future:
+        order = _QueuedOrder(side, volume, comment)
+        self._queue.put(order)
+        return order.future
+
+    def close(self) -> None:
+        self._queue.put(None)
+        self._worker.join()
+
+    def _collect(self, first: _QueuedOrder) -> tuple[list[_QueuedOrder], bool]:
+        batch = [first]
+        deadline = time.perf_counter() + self.coalesce_window
+        while len(batch) < self.max_batch:
+            remaining = deadline - time.perf_counter()
+            try:
+                item = self._queue.get(timeout=max(remaining, 0)) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is None:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            first = self._queue.get()
+            if first is None:
+                break
+            batch, stopping = self._collect(first)
+            net = round(sum(o.volume if o.side == "buy" else -o.volume for o in batch), 8)
+            try:
+                if net == 0:
+                    result: dict = {"netted": True}
+                else:
+                    side: OrderSide = "buy" if net > 0 else "sell"
+                    comments = {o.comment for o in batch if o.comment}
+                    comment = comments.pop() if len(comments) == 1 else None
+                    result = self.session.place_market_order(side, abs(net), comment=comment)
+                    self.batches_sent += 1
+            except Exception as exc:  # noqa: BLE001 - delivered to every waiting caller
+                for order in batch:
+                    order.future.set_exception(exc)
+                continue
+            done = time.perf_counter()
+            for order in batch:
+                self.session.latency.record("order_round_trip", done - order.queued_at)
+                order.future.set_result({**result, "coalesced": len(batch)})
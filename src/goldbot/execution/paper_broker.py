@@ -0,0 +1,355 @@
+"""In-process paper-trading broker with a pending-order book, partial fills, and margin."""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import math
+import uuid
+from collections import deque
+from dataclasses import asdict, dataclass, field, fields
+from typing import Any, Callable, Mapping, Optional
+
+import pandas as pd
+from loguru import logger
+
+from goldbot.config import settings
+from goldbot.execution.broker_stub import Order
+
+OPEN_STATUSES = ("pending", "partially_filled")
+
+
+@dataclass(slots=True)
+class Fill:
+    order_id: str
+    symbol: str
+    side: str
+    quantity: float
+    price: float
+    fee: float
+    timestamp: int
+
+
+@dataclass(slots=True)
+class OrderState:
+    order_id: str
+    order: Order
+    remaining: float
+    active_from: int
+    status: str = "pending"
+    filled: float = 0.0
+    avg_price: float = 0.0
+
+
+@dataclass(slots=True)
+class Position:
+    symbol: str
+    quantity: float = 0.0  # signed lots
+    avg_price: float = 0.0
+    realized_pnl: float = 0.0
+
+
+@dataclass(slots=True)
+class _Quote:
+    """Mid-price OHLC of the latest update plus half the bid/ask spread."""
+
+    timestamp: int
+    open: float
+    high: float
+    low: float
+    close: float
+    half_spread: float
+
+    @property
+    def bid(self) -> float:
+        return self.close - self.half_spread
+
+    @property
+    def ask(self) -> float:
+        return self.close + self.half_spread
+
+
+@dataclass(slots=True)
+class _Book:
+    """Trigger heaps per order kind; cancelled/filled entries are skipped lazily."""
+
+    buy_limits: list = field(default_factory=list)  # max-heap on price (stored negated)
+    sell_limits: list = field(default_factory=list)  # min-heap
+    buy_stops: list = field(default_factory=list)  # min-heap
+    sell_stops: list = field(default_factory=list)  # max-heap (negated)
+
+
+class PaperBroker:
+    """Simulated broker matching orders against the bars/ticks it is fed.
+
+    Quantities are lots of ``contract_size`` units. Market orders fill at the
+    current quote (ask for buys, bid for sells) plus ``slippage_bps``; limit
+    and stop orders rest in the book and trigger on bar ranges or tick quotes
+    with the same gap rules as ``EventDrivenBacktester``. ``latency`` (seconds
+    of market time) delays when an order becomes eligible to fill, and
+    ``max_fill_per_update`` caps how much of one order can fill per update,
+    producing partial fills. Orders that would push used margin past equity
+    are rejected. Positions are netted per symbol.
+    """
+
+    def __init__(
+        self,
+        initial_balance: Optional[float] = None,
+        leverage: float = 100.0,
+        contract_size: float = 100.0,
+        slippage_bps: Optional[float] = None,
+        commission_perc: Optional[float] = None,
+        latency: float = 0.0,
+        max_fill_per_update: Optional[float] = None,
+        spread: float = 0.0,
+    ) -> None:
+        cfg = settings.backtest
+        self.balance = float(initial_balance if initial_balance is not None else cfg.initial_capital)
+        self.leverage = leverage
+        self.contract_size = contract_size
+        self.slippage = (cfg.slippage_bps if slippage_bps is None else slippage_bps) / 10_000
+        self.commission = cfg.commission_perc if commission_perc is None else commission_perc
+        self.latency_ns = int(latency * 1e9)
+        self.max_fill_per_update = max_fill_per_update
+        self.spread = spread
+        self.orders: dict[str, OrderState] = {}
+        self.positions: dict[str, Position] = {}
+        self.fills: list[Fill] = []
+        self._quotes: dict[str, _Quote] = {}
+        self._books: dict[str, _Book] = {}
+        self._waiting: deque[OrderState] = deque()
+        self._market: deque[OrderState] = deque()
+        self._prefix = uuid.uuid4().hex[:8]
+        self._ids = itertools.count(1)
+        self._seq = itertools.count()
+
+    # -- order entry -----------------------------------------------------
+
+    def submit(self, order: Order) -> str:
+        order_id = f"paper-{self._prefix}-{next(self._ids)}"
+        quote = self._quotes.get(order.symbol)
+        now = quote.timestamp if quote is not None else 0
+        state = OrderState(order_id, order, float(order.quantity), now + self.latency_ns)
+        self.orders[order_id] = state
+        if order.quantity <= 0 or (order.order_type != "market" and order.price is None):
+            return self._reject(state, "invalid quantity or missing price")
+        reference = order.price if order.price is not None else self._mark(order.symbol)
+        if reference is not None and not self._margin_ok(order, reference):
+            return self._reject(state, "insufficient margin")
+
+        if self.latency_ns or quote is None:
+            self._waiting.append(state)
+        elif order.order_type == "market":
+            self._fill_market(state, quote)
+        else:
+            self._rest(state)
+        return order_id
+
+    def cancel(self, order_id: str) -> None:
+        state = self.orders.get(order_id)
+        if state is not None and state.status in OPEN_STATUSES:
+            state.status = "cancelled"
+
+    # -- market data -----------------------------------------------------
+
+    def on_bar(self, bar: Mapping[str, Any], symbol: Optional[str] = None) -> list[Fill]:
+        """Match the book against an OHLC bar (quoted at ``close`` +/- half spread)."""
+
+        close = float(bar["close"])
+        quote = _Quote(
+            timestamp=_ns(bar.get("datetime", 0)),
+            open=float(bar.get("open", close)),
+            high=float(bar.get("high", close)),
+            low=float(bar.get("low", close)),
+            close=close,
+            half_spread=float(bar.get("spread", self.spread)) / 2,
+        )
+        return self._on_quote(symbol or settings.mt5.symbol, quote)
+
+    def on_tick(self, tick: Mapping[str, Any], symbol: Optional[str] = None) -> list[Fill]:
+        bid, ask = float(tick["bid"]), float(tick["ask"])
+        mid = (bid + ask) / 2
+        stamp = _ns(tick.get("ts", tick.get("datetime", 0)))
+        quote = _Quote(timestamp=stamp, open=mid, high=mid, low=mid, close=mid, half_spread=(ask - bid) / 2)
+        return self._on_quote(symbol or settings.mt5.symbol, quote)
+
+    # -- account ---------------------------------------------------------
+
+    def equity(self) -> float:
+        return self.balance + sum(self._unrealized(pos) for pos in self.positions.values())
+
+    def margin_used(self) -> float:
+        return sum(
+            abs(pos.quantity) * self.contract_size * (self._mark(sym) or pos.avg_price) / self.leverage
+            for sym, pos in self.positions.items()
+        )
+
+    def account(self) -> dict[str, float]:
+        equity = self.equity()
+        used = self.margin_used()
+        return {
+            "balance": self.balance,
+            "equity": equity,
+            "margin": used,
+            "free_margin": equity - used,
+            "margin_level": equity / used * 100 if used else math.inf,
+        }
+
+    def open_orders(self) -> list[OrderState]:
+        return [state for state in self.orders.values() if state.status in OPEN_STATUSES]
+
+    def fills_frame(self) -> pd.DataFrame:
+        frame = pd.DataFrame([asdict(fill) for fill in self.fills], columns=[f.name for f in fields(Fill)])
+        if not frame.empty:
+            frame["timestamp"] = pd.to_datetime(frame["timestamp"], utc=True)
+        return frame
+
+    # -- internals -------------------------------------------------------
+
+    def _on_quote(self, symbol: str, quote: _Quote) -> list[Fill]:
+        self._quotes[symbol] = quote
+        start = len(self.fills)
+
+        # Orders whose simulated latency has elapsed join the book (or fill, if market).
+        # Margin is checked again on activation: orders sent before the first quote
+        # had no price to check against, and equity may have moved in the meantime.
+        waiting, self._waiting = self._waiting, deque()
+        for state in waiting:
+            if state.status not in OPEN_STATUSES:
+                continue
+            if state.order.symbol != symbol or state.active_from > quote.timestamp:
+                self._waiting.append(state)
+            elif not self._margin_ok(state.order, state.order.price or quote.close):
+                self._reject(state, "insufficient margin")
+            elif state.order.order_type == "market":
+                self._market.append(state)
+            else:
+                self._rest(state)
+
+        market, self._market = self._market, deque()
+        for state in market:
+            if state.status in OPEN_STATUSES:
+                self._fill_market(state, quote, at_open=True)
+
+        book = self._books.get(symbol)
+        if book is not None:
+            # Buys trade at the ask side of the bar's range, sells at the bid side.
+            h = quote.half_spread
+            buy_open, sell_open = quote.open + h, quote.open - h
+            ts = quote.timestamp
+            self._match(book.buy_limits, -1, lambda p: quote.low + h <= p, lambda p: min(buy_open, p), ts)
+            self._match(book.sell_limits, 1, lambda p: quote.high - h >= p, lambda p: max(sell_open, p), ts)
+            self._match(book.buy_stops, 1, lambda p: quote.high + h >= p, lambda p: max(buy_open, p), ts)
+            self._match(book.sell_stops, -1, lambda p: quote.low - h <= p, lambda p: min(sell_open, p), ts)
+        return self.fills[start:]
+
+    def _match(
+        self,
+        heap: list,
+        sign: int,
+        triggered: Callable[[float], bool],
+        fill_price: Callable[[float], float],
+        timestamp: int,
+    ) -> None:
+        requeue = []
+        while heap:
+            key, _, state = heap[0]
+            price = key * sign
+            if state.status not in OPEN_STATUSES:
+                heapq.heappop(heap)
+                continue
+            if not triggered(price):
+                break
+            heapq.heappop(heap)
+            slip = self.slippage if state.order.order_type == "stop" else 0.0
+            self._execute(state, fill_price(price), slip, timestamp)
+            if state.status in OPEN_STATUSES:
+                requeue.append((key, next(self._seq), state))
+        for entry in requeue:
+            heapq.heappush(heap, entry)
+
+    def _rest(self, state: OrderState) -> None:
+        book = self._books.setdefault(state.order.symbol, _Book())
+        price = float(state.order.price)
+        buy = state.order.side == "buy"
+        if state.order.order_type == "limit":
+            heap, key = (book.buy_limits, -price) if buy else (book.sell_limits, price)
+        else:
+            heap, key = (book.buy_stops, price) if buy else (book.sell_stops, -price)
+        heapq.heappush(heap, (key, next(self._seq), state))
+
+    def _fill_market(self, state: OrderState, quote: _Quote, at_open: bool = False) -> None:
+        buy = state.order.side == "buy"
+        if at_open:
+            raw = quote.open + quote.half_spread if buy else quote.open - quote.half_spread
+        else:
+            raw = quote.ask if buy else quote.bid
+        self._execute(state, raw, self.slippage, quote.timestamp)
+        if state.status in OPEN_STATUSES:
+            self._market.append(state)  # remainder fills on the next update
+
+    def _execute(self, state: OrderState, raw_price: float, slip: float, timestamp: int) -> None:
+        order = state.order
+        direction = 1.0 if order.side == "buy" else -1.0
+        price = raw_price * (1 + direction * slip)
+        qty = state.remaining
+        if self.max_fill_per_update is not None:
+            qty = min(qty, self.max_fill_per_update)
+        fee = self.commission * qty * self.contract_size * price
+        self._apply(order.symbol, direction * qty, price, fee)
+
+        state.avg_price = (state.avg_price * state.filled + price * qty) / (state.filled + qty)
+        state.filled += qty
+        state.remaining -= qty
+        state.status = "filled" if state.remaining <= 1e-12 else "partially_filled"
+        self.fills.append(Fill(state.order_id, order.symbol, order.side, qty, price, fee, timestamp))
+
+    def _apply(self, symbol: str, signed_qty: float, price: float, fee: float) -> None:
+        pos = self.positions.setdefault(symbol, Position(symbol))
+        self.balance -= fee
+        if pos.quantity == 0 or math.copysign(1, pos.quantity) == math.copysign(1, signed_qty):
+            total = pos.quantity + signed_qty
+            pos.avg_price = (pos.avg_price * pos.quantity + price * signed_qty) / total
+            pos.quantity = total
+            return
+        closing = min(abs(signed_qty), abs(pos.quantity))
+        pnl = closing * self.contract_size * (price - pos.avg_price) * math.copysign(1, pos.quantity)
+        pos.realized_pnl += pnl
+        self.balance += pnl
+        remainder = pos.quantity + signed_qty
+        if abs(remainder) <= 1e-12:
+            pos.quantity, pos.avg_price = 0.0, 0.0
+        elif math.copysign(1, remainder) == math.copysign(1, pos.quantity):
+            pos.quantity = remainder
+        else:  # reversal: the excess opens a new position at the fill price
+            pos.quantity, pos.avg_price = remainder, price
+
+    def _unrealized(self, pos: Position) -> float:
+        mark = self._mark(pos.symbol)
+        if not pos.quantity or mark is None:
+            return 0.0
+        return pos.quantity * self.contract_size * (mark - pos.avg_price)
+
+    def _mark(self, symbol: str) -> Optional[float]:
+        quote = self._quotes.get(symbol)
+        if quote is None:
+            return None
+        return quote.close
+
+    def _margin_ok(self, order: Order, price: float) -> bool:
+        pos = self.positions.get(order.symbol)
+        current = pos.quantity if pos is not None else 0.0
+        signed = order.quantity if order.side == "buy" else -order.quantity
+        added = max(abs(current + signed) - abs(current), 0.0) * self.contract_size * price / self.leverage
+        return added == 0 or self.margin_used() + added <= self.equity()
+
+    def _reject(self, state: OrderState, reason: str) -> str:
+        state.status = "rejected"
+        logger.warning("Paper order {} rejected: {}", state.order_id, reason)
+        return state.order_id
+
+
+def _ns(value: Any) -> int:
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return int(value)
+    return pd.Timestamp(value).value
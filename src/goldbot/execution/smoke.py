@@ -9,6 +9,7 @@ from typing import Literal, Optional
 from loguru import logger
 
 from goldbot.execution.mt5_adapter import MT5Adapter
+from goldbot.execution.mt5_session import MT5Session
 from goldbot.utils.logging import configure_logging
 
 try:  # pragma: no cover - runtime dependency
@@ -31,20 +32,28 @@ def run_mt5_smoke_test(
     place_order: bool = False,
     side: Literal["buy", "sell"] = "buy",
     volume: float = 0.01,
+    session: Optional[MT5Session] = None,
 ) -> MT5SmokeResult:
-    """Connect to MT5, fetch account info, optionally send a small market order."""
+    """Connect to MT5, fetch account info, optionally send a small market order.
+
+    Pass a live ``session`` to reuse its connection instead of a one-off
+    initialize/shutdown cycle.
+    """
 
     if mt5 is None:
         raise ImportError("MetaTrader5 package missing. Install on Windows with Python <=3.12.")
 
-    adapter = MT5Adapter()
-    adapter.connect()
+    adapter = session.adapter if session is not None else MT5Adapter()
+    if session is None:
+        adapter.connect()
     info = mt5.account_info()._asdict()
     order = None
     if place_order:
-        logger.info("Placing MT5 %s order for %.2f lots", side, volume)
-        order = adapter.place_market_order(side=side, volume=volume, comment="goldbot-smoke")
-    adapter.shutdown()
+        logger.info("Placing MT5 {} order for {:.2f} lots", side, volume)
+        sender = session if session is not None else adapter
+        order = sender.place_market_order(side=side, volume=volume, comment="goldbot-smoke")
+    if session is None:
+        adapter.shutdown()
     return MT5SmokeResult(
         balance=info.get("balance", 0.0),
         equity=info.get("equity", 0.0),
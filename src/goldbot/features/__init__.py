@@ -1,16 +1,16 @@
-"""Feature engineering exports."""
+"""Feature engineering exports, imported on first use."""
 
-from .technicals import (
-    add_momentum_indicators,
-    add_trend_indicators,
-    add_volatility_indicators,
-    engineer_feature_set,
-)
+from goldbot.utils.lazy import lazy_exports
 
-__all__ = [
-    "add_trend_indicators",
-    "add_momentum_indicators",
-    "add_volatility_indicators",
-    "engineer_feature_set",
-]
+_EXPORTS = {
+    "add_trend_indicators": ".technicals",
+    "add_momentum_indicators": ".technicals",
+    "add_volatility_indicators": ".technicals",
+    "engineer_feature_set": ".technicals",
+    "IncrementalFeatureEngine": ".streaming",
+    "FeatureCache": ".cache",
+    "MultiTimeframeEngine": ".multi_timeframe",
+}
 
+__all__ = list(_EXPORTS)
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -0,0 +1,249 @@
+"""Content-addressed cache for engineered feature frames."""
+
+from __future__ import annotations
+
+import hashlib
+import importlib.util
+import inspect
+import json
+import os
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+from goldbot.config import settings
+from goldbot.features.technicals import engineer_feature_set
+from goldbot.utils.tracing import traced
+
+FeatureBuilder = Callable[..., pd.DataFrame]
+
+# Recursive indicators (EMA/ATR/ADX/RSI) need roughly ten of their window for a
+# re-seeded tail to converge to float precision; the longest default window is 55.
+WARMUP_WINDOWS = 10
+DEFAULT_WARMUP_BARS = 600
+# Overlapping rows compared against the cache before a tail extension is trusted.
+OVERLAP_CHECK_ROWS = 20
+# Modules a builder hands off to for a given ``backend`` parameter.
+BACKEND_MODULES = {"polars": "goldbot.features.polars_backend"}
+
+
+@dataclass(slots=True)
+class CacheStats:
+    hits: int = 0
+    partial_hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    rebuilds: int = 0  # tail extensions that diverged from the cache and were rebuilt
+
+
+def fingerprint_frame(df: pd.DataFrame) -> str:
+    """Stable hash of a frame's index, columns, and values."""
+
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(json.dumps([str(c) for c in df.columns]).encode())
+    digest.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def fingerprint_builder(builder: FeatureBuilder, params: dict[str, Any]) -> str:
+    """Hash the builder identity, the source of its module, and its parameters.
+
+    Hashing the whole module picks up edits to helpers such as ``add_*``
+    functions that ``engineer_feature_set`` calls indirectly. When ``params``
+    select a ``backend``, the module it dispatches to is hashed as well.
+    """
+
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{builder.__module__}.{builder.__qualname__}".encode())
+    module = inspect.getmodule(builder)
+    try:
+        digest.update(inspect.getsource(module or builder).encode())
+    except (OSError, TypeError):  # pragma: no cover - builtins / REPL definitions
+        pass
+    backend = BACKEND_MODULES.get(str(params.get("backend")))
+    if backend is not None:
+        # Read the source without importing it, so the optional backend stays unloaded.
+        spec = importlib.util.find_spec(backend)
+        if spec is not None and spec.origin:
+            digest.update(Path(spec.origin).read_bytes())
+    digest.update(json.dumps(params, sort_keys=True, default=str).encode())
+    return digest.hexdigest()
+
+
+def warmup_bars(params: dict[str, Any]) -> int:
+    """History to rebuild ahead of new bars: ten times the longest integer window in ``params``."""
+
+    windows = [v for v in params.values() if isinstance(v, int) and not isinstance(v, bool)]
+    return max([DEFAULT_WARMUP_BARS, *(WARMUP_WINDOWS * w for w in windows)])
+
+
+class FeatureCache:
+    """Parquet-backed feature cache with LRU eviction under ``cache_dir/features``.
+
+    Entries are keyed by ``(builder fingerprint, price fingerprint)``. When the
+    price frame only grew at the tail, the cached prefix is reused and the
+    builder runs on the new bars plus ``warmup`` bars of history (derived from
+    the builder parameters by ``warmup_bars`` when not given). The recomputed
+    rows that overlap the cache must match it; otherwise the warm-up was too
+    short for the indicators and the whole frame is rebuilt.
+    """
+
+    def __init__(
+        self,
+        root: Optional[Path] = None,
+        max_bytes: int = 2 * 1024**3,
+        warmup: Optional[int] = None,
+    ) -> None:
+        self.root = Path(root or settings.data.cache_dir / "features")
+        self.max_bytes = max_bytes
+        self.warmup = warmup
+        self.stats = CacheStats()
+        self._index_path = self.root / "index.json"
+
+    @traced(rows_arg="prices")
+    def get_or_compute(
+        self,
+        prices: pd.DataFrame,
+        builder: FeatureBuilder = engineer_feature_set,
+        **params: Any,
+    ) -> pd.DataFrame:
+        """Return ``builder(prices, **params)``, reusing cached work where possible."""
+
+        spec = fingerprint_builder(builder, params)
+        data = fingerprint_frame(prices)
+        key = f"{spec[:16]}-{data}"
+        index = self._load_index()
+
+        if key in index and self._path(key).exists():
+            self.stats.hits += 1
+            index[key]["last_access"] = time.time()
+            self._save_index(index)
+            return pd.read_parquet(self._path(key))
+
+        base_key = self._find_prefix(index, spec, prices)
+        if base_key is not None:
+            self.stats.partial_hits += 1
+            features = self._extend(index[base_key], base_key, prices, builder, params)
+            self._drop(index, base_key)
+        else:
+            self.stats.misses += 1
+            features = builder(prices, **params)
+
+        self._store(index, key, spec, data, prices, features)
+        return features
+
+    def stats_dict(self) -> dict[str, int]:
+        return asdict(self.stats)
+
+    def clear(self) -> None:
+        index = self._load_index()
+        for key in list(index):
+            self._drop(index, key)
+        self._save_index(index)
+
+    def _find_prefix(self, index: dict[str, dict], spec: str, prices: pd.DataFrame) -> Optional[str]:
+        if prices.empty:
+            return None
+        first = str(prices.index[0])
+        candidates = sorted(
+            (
+                (meta["n_rows"], key)
+                for key, meta in index.items()
+                if meta["spec"] == spec and meta["first"] == first and meta["n_rows"] < len(prices)
+            ),
+            reverse=True,
+        )
+        for n_rows, key in candidates:
+            if self._path(key).exists() and fingerprint_frame(prices.iloc[:n_rows]) == index[key]["data"]:
+                return key
+        return None
+
+    def _extend(
+        self,
+        meta: dict[str, Any],
+        base_key: str,
+        prices: pd.DataFrame,
+        builder: FeatureBuilder,
+        params: dict[str, Any],
+    ) -> pd.DataFrame:
+        cached = pd.read_parquet(self._path(base_key))
+        n_cached = meta["n_rows"]
+        last_input = prices.index[n_cached - 1]
+        warmup = self.warmup if self.warmup is not None else warmup_bars(params)
+        tail = builder(prices.iloc[max(0, n_cached - warmup) :], **params)
+        if not _overlap_matches(cached, tail[tail.index <= last_input].tail(OVERLAP_CHECK_ROWS)):
+            self.stats.rebuilds += 1
+            logger.info("Feature cache tail diverged after {} warm-up bars; rebuilding all rows", warmup)
+            return builder(prices, **params)
+        fresh = tail[tail.index > last_input]
+        logger.debug("Feature cache extended {} cached rows with {} new rows", len(cached), len(fresh))
+        return pd.concat([cached, fresh])
+
+    def _store(
+        self,
+        index: dict[str, dict],
+        key: str,
+        spec: str,
+        data: str,
+        prices: pd.DataFrame,
+        features: pd.DataFrame,
+    ) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        path = self._path(key)
+        tmp = path.with_suffix(".parquet.tmp")
+        features.to_parquet(tmp)
+        os.replace(tmp, path)
+        index[key] = {
+            "spec": spec,
+            "data": data,
+            "n_rows": len(prices),
+            "first": str(prices.index[0]) if len(prices) else "",
+            "size": path.stat().st_size,
+            "last_access": time.time(),
+        }
+        self._evict(index, keep=key)
+        self._save_index(index)
+
+    def _evict(self, index: dict[str, dict], keep: str) -> None:
+        total = sum(meta["size"] for meta in index.values())
+        for key in sorted(index, key=lambda k: index[k]["last_access"]):
+            if total <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            total -= index[key]["size"]
+            self._drop(index, key)
+            self.stats.evictions += 1
+
+    def _drop(self, index: dict[str, dict], key: str) -> None:
+        index.pop(key, None)
+        self._path(key).unlink(missing_ok=True)
+
+    def _path(self, key: str) -> Path:
+        return self.root / f"{key}.parquet"
+
+    def _load_index(self) -> dict[str, dict]:
+        if not self._index_path.exists():
+            return {}
+        return json.loads(self._index_path.read_text())
+
+    def _save_index(self, index: dict[str, dict]) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp = self._index_path.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps(index))
+        os.replace(tmp, self._index_path)
+
+
+def _overlap_matches(cached: pd.DataFrame, overlap: pd.DataFrame) -> bool:
+    if overlap.empty or not overlap.index.isin(cached.index).all():
+        return False
+    expected = cached.loc[overlap.index, overlap.columns].select_dtypes("number")
+    actual = overlap[expected.columns]
+    return bool(
+        np.allclose(actual.to_numpy(np.float64), expected.to_numpy(np.float64), rtol=1e-9, atol=1e-8, equal_nan=True)
+    )
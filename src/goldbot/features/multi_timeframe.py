@@ -0,0 +1,136 @@
+"""Higher-timeframe features aligned onto execution bars without lookahead."""
+
+from __future__ import annotations
+
+import re
+from typing import Callable, Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+from goldbot.config import settings
+from goldbot.data.loaders import merge_price_data, resample_bars
+from goldbot.features.cache import DEFAULT_WARMUP_BARS
+from goldbot.features.technicals import engineer_feature_set
+
+FeatureBuilder = Callable[[pd.DataFrame], pd.DataFrame]
+
+_TIMEFRAME = re.compile(r"^(\d+)\s*(M|MIN|H|D)$", re.IGNORECASE)
+_UNITS = {"M": "min", "MIN": "min", "H": "h", "D": "D"}
+
+
+def timeframe_rule(timeframe: str) -> str:
+    """Translate universe notation (``15M``, ``4H``, ``1D``) to a pandas offset alias."""
+
+    match = _TIMEFRAME.match(timeframe.strip())
+    if match is None:
+        raise ValueError(f"Unsupported timeframe {timeframe!r}")
+    return f"{int(match.group(1))}{_UNITS[match.group(2).upper()]}"
+
+
+def timeframe_delta(timeframe: str) -> pd.Timedelta:
+    return pd.Timedelta(timeframe_rule(timeframe))
+
+
+class MultiTimeframeEngine:
+    """Derive higher timeframes from execution bars and join their features back.
+
+    Higher timeframes are resampled in a cascade (``15M -> 1H -> 4H -> 1D``), so
+    each level only reads the one below it. A higher-timeframe bar labelled
+    ``t`` closes at ``t + duration``; an execution bar sees it only once its own
+    close is at or after that time, so the still-forming bar never leaks into
+    the join. Joined columns are prefixed with the lower-cased timeframe
+    (``4h_rsi``, ``1d_close``).
+
+    ``update`` appends new execution bars, rebuilds only the higher-timeframe
+    bars they touch, and recomputes features over those bars plus ``warmup``
+    rows of history.
+    """
+
+    def __init__(
+        self,
+        execution_timeframe: Optional[str] = None,
+        higher_timeframes: Optional[Iterable[str]] = None,
+        builder: FeatureBuilder = engineer_feature_set,
+        warmup: int = DEFAULT_WARMUP_BARS,
+    ) -> None:
+        universe = settings.universe
+        self.execution_timeframe = execution_timeframe or universe.execution_timeframe
+        timeframes = higher_timeframes if higher_timeframes is not None else universe.base_timeframes
+        self.higher_timeframes = tuple(sorted(timeframes, key=timeframe_delta))
+        self.builder = builder
+        self.warmup = warmup
+
+        previous = timeframe_delta(self.execution_timeframe)
+        for tf in self.higher_timeframes:
+            delta = timeframe_delta(tf)
+            if delta <= previous or delta % previous:
+                raise ValueError(f"{tf} is not a multiple of the next lower timeframe ({previous})")
+            previous = delta
+
+        self.bars = pd.DataFrame()
+        self.frames: dict[str, pd.DataFrame] = {}
+        self.features: dict[str, pd.DataFrame] = {}
+        self.aligned = pd.DataFrame()
+
+    def fit(self, bars: pd.DataFrame) -> pd.DataFrame:
+        """Build every timeframe from scratch and return the aligned frame."""
+
+        self.bars = bars.sort_index()
+        self.features[self.execution_timeframe] = self.builder(self.bars)
+        source = self.bars
+        for tf in self.higher_timeframes:
+            source = resample_bars(source, timeframe_rule(tf))
+            self.frames[tf] = source
+            self.features[tf] = self.builder(source)
+        self.aligned = self._align(self.features[self.execution_timeframe])
+        return self.aligned
+
+    def update(self, new_bars: pd.DataFrame) -> pd.DataFrame:
+        """Ingest new (or revised) execution bars; return their aligned rows."""
+
+        if new_bars.empty:
+            return self.aligned.iloc[:0]
+        if self.bars.empty:
+            return self.fit(new_bars)
+
+        cutoff = new_bars.index.min()
+        self.bars = merge_price_data(self.bars, new_bars)
+        exec_tf = self.execution_timeframe
+        self.features[exec_tf] = self._extend(self.bars, self.features[exec_tf], cutoff)
+
+        source, start = self.bars, cutoff
+        for tf in self.higher_timeframes:
+            rule = timeframe_rule(tf)
+            # The bin holding ``start`` may have been partial; rebuild from its label.
+            start = start.floor(rule)
+            fresh = resample_bars(source[source.index >= start], rule)
+            frame = self.frames[tf]
+            source = pd.concat([frame[frame.index < start], fresh])
+            self.frames[tf] = source
+            self.features[tf] = self._extend(source, self.features[tf], start)
+
+        exec_features = self.features[exec_tf]
+        fresh_rows = self._align(exec_features[exec_features.index >= cutoff])
+        self.aligned = pd.concat([self.aligned[self.aligned.index < cutoff], fresh_rows])
+        return fresh_rows
+
+    def _extend(self, bars: pd.DataFrame, features: pd.DataFrame, cutoff: pd.Timestamp) -> pd.DataFrame:
+        pos = int(bars.index.searchsorted(cutoff))
+        tail = self.builder(bars.iloc[max(0, pos - self.warmup) :])
+        return pd.concat([features[features.index < cutoff], tail[tail.index >= cutoff]])
+
+    def _align(self, exec_features: pd.DataFrame) -> pd.DataFrame:
+        bar_close = exec_features.index + timeframe_delta(self.execution_timeframe)
+        parts = [exec_features]
+        for tf in self.higher_timeframes:
+            htf = self.features[tf]
+            available = htf.index + timeframe_delta(tf)
+            pos = available.searchsorted(bar_close, side="right") - 1
+            if htf.empty:
+                joined = pd.DataFrame(np.nan, index=exec_features.index, columns=htf.columns)
+            else:
+                joined = htf.iloc[np.maximum(pos, 0)].set_axis(exec_features.index)
+                joined = joined.where(pd.Series(pos >= 0, index=exec_features.index), axis=0)
+            parts.append(joined.add_prefix(f"{tf.lower()}_"))
+        return pd.concat(parts, axis=1)
@@ -0,0 +1,376 @@
+"""Incremental (bar-by-bar) versions of the indicators in ``technicals``.
+
+Every indicator keeps O(1) state per update and reproduces the batch
+``pandas``/``ta`` output, including ``ta``'s zero-filled warm-up for ATR/ADX.
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import time
+from collections import deque
+from typing import Mapping
+
+import numpy as np
+import pandas as pd
+
+from goldbot.utils.tracing import traced
+
+NAN = float("nan")
+
+
+class RollingMean:
+    """Simple moving average; NaN while the window is short or holds a NaN."""
+
+    __slots__ = ("window", "_buf", "_pos", "_count", "_sum", "_nans")
+
+    def __init__(self, window: int) -> None:
+        self.window = window
+        self._buf = [0.0] * window
+        self._pos = 0
+        self._count = 0
+        self._sum = 0.0
+        self._nans = 0
+
+    def update(self, value: float) -> float:
+        old = self._buf[self._pos]
+        if self._count == self.window:
+            if old != old:
+                self._nans -= 1
+            else:
+                self._sum -= old
+        else:
+            self._count += 1
+        if value != value:
+            self._nans += 1
+        else:
+            self._sum += value
+        self._buf[self._pos] = value
+        self._pos += 1
+        if self._pos == self.window:
+            self._pos = 0
+            # Re-anchor the running sum once per cycle so float drift stays bounded.
+            self._sum = math.fsum(v for v in self._buf if v == v)
+        if self._count < self.window or self._nans:
+            return NAN
+        return self._sum / self.window
+
+
+class RollingStd:
+    """Population (ddof=0) rolling standard deviation paired with its mean."""
+
+    __slots__ = ("window", "_buf", "_pos", "_count", "_sum", "_sumsq")
+
+    def __init__(self, window: int) -> None:
+        self.window = window
+        self._buf = [0.0] * window
+        self._pos = 0
+        self._count = 0
+        self._sum = 0.0
+        self._sumsq = 0.0
+
+    def update(self, value: float) -> tuple[float, float]:
+        if self._count == self.window:
+            old = self._buf[self._pos]
+            self._sum -= old
+            self._sumsq -= old * old
+        else:
+            self._count += 1
+        self._sum += value
+        self._sumsq += value * value
+        self._buf[self._pos] = value
+        self._pos += 1
+        if self._pos == self.window:
+            self._pos = 0
+            self._sum = math.fsum(self._buf)
+            self._sumsq = math.fsum(v * v for v in self._buf)
+        if self._count < self.window:
+            return NAN, NAN
+        mean = self._sum / self.window
+        var = max(self._sumsq / self.window - mean * mean, 0.0)
+        return mean, math.sqrt(var)
+
+
+class RollingExtreme:
+    """Rolling max (or min) via a monotonic deque, amortized O(1)."""
+
+    __slots__ = ("window", "_sign", "_deque", "_index")
+
+    def __init__(self, window: int, mode: str = "max") -> None:
+        self.window = window
+        self._sign = 1.0 if mode == "max" else -1.0
+        self._deque: deque[tuple[int, float]] = deque()
+        self._index = 0
+
+    def update(self, value: float) -> float:
+        key = self._sign * value
+        dq = self._deque
+        while dq and dq[-1][1] <= key:
+            dq.pop()
+        dq.append((self._index, key))
+        if dq[0][0] <= self._index - self.window:
+            dq.popleft()
+        self._index += 1
+        if self._index < self.window:
+            return NAN
+        return self._sign * dq[0][1]
+
+
+class EMA:
+    """``Series.ewm(span=..., adjust=False).mean()`` or ``alpha=...`` with min periods."""
+
+    __slots__ = ("alpha", "min_periods", "_value", "_count")
+
+    def __init__(self, span: float | None = None, alpha: float | None = None, min_periods: int = 0) -> None:
+        if alpha is None:
+            if span is None:
+                raise ValueError("EMA needs either span or alpha.")
+            alpha = 2.0 / (span + 1.0)
+        self.alpha = alpha
+        self.min_periods = min_periods
+        self._value = NAN
+        self._count = 0
+
+    def update(self, value: float) -> float:
+        self._count += 1
+        if self._count == 1:
+            self._value = value
+        else:
+            self._value += self.alpha * (value - self._value)
+        return self._value if self._count >= self.min_periods else NAN
+
+
+class RSI:
+    """Wilder RSI matching ``ta.momentum.rsi``."""
+
+    __slots__ = ("_up", "_down", "_prev")
+
+    def __init__(self, window: int = 14) -> None:
+        self._up = EMA(alpha=1.0 / window, min_periods=window)
+        self._down = EMA(alpha=1.0 / window, min_periods=window)
+        self._prev = NAN
+
+    def update(self, close: float) -> float:
+        diff = close - self._prev
+        self._prev = close
+        up = self._up.update(diff if diff > 0 else 0.0)
+        down = self._down.update(-diff if diff < 0 else 0.0)
+        if down == 0:
+            return 100.0
+        return 100.0 - 100.0 / (1.0 + up / down)
+
+
+class ATR:
+    """Average true range with ``ta``'s mean-seeded Wilder smoothing (0 during warm-up)."""
+
+    __slots__ = ("window", "_prev_close", "_count", "_seed", "_value")
+
+    def __init__(self, window: int = 14) -> None:
+        self.window = window
+        self._prev_close = NAN
+        self._count = 0
+        self._seed = 0.0
+        self._value = 0.0
+
+    def update(self, high: float, low: float, close: float) -> float:
+        pc = self._prev_close
+        tr = high - low
+        if pc == pc:
+            tr = max(tr, abs(high - pc), abs(low - pc))
+        self._prev_close = close
+        self._count += 1
+        w = self.window
+        if self._count < w:
+            self._seed += tr
+            return 0.0
+        if self._count == w:
+            self._value = (self._seed + tr) / w
+        else:
+            self._value = (self._value * (w - 1) + tr) / w
+        return self._value
+
+
+class ADX:
+    """Average directional index replicating ``ta.trend.ADXIndicator`` bar by bar."""
+
+    __slots__ = ("window", "_count", "_prev_high", "_prev_low", "_prev_close", "_trs", "_dip", "_din", "_dx_sum", "_adx")
+
+    def __init__(self, window: int = 14) -> None:
+        self.window = window
+        self._count = 0
+        self._prev_high = NAN
+        self._prev_low = NAN
+        self._prev_close = NAN
+        self._trs = 0.0
+        self._dip = 0.0
+        self._din = 0.0
+        self._dx_sum = 0.0
+        self._adx = 0.0
+
+    def update(self, high: float, low: float, close: float) -> float:
+        t = self._count
+        self._count += 1
+        w = self.window
+        ph, pl, pc = self._prev_high, self._prev_low, self._prev_close
+        self._prev_high, self._prev_low, self._prev_close = high, low, close
+        if t == 0:
+            return 0.0
+
+        dm = max(high, pc) - min(low, pc)
+        diff_up = high - ph
+        diff_down = pl - low
+        pos = diff_up if diff_up > diff_down and diff_up > 0 else 0.0
+        neg = diff_down if diff_down > diff_up and diff_down > 0 else 0.0
+        if t <= w:
+            self._trs += dm
+            self._dip += pos
+            self._din += neg
+            if t < w:
+                return 0.0
+        else:
+            self._trs += dm - self._trs / w
+            self._dip += pos - self._dip / w
+            self._din += neg - self._din / w
+
+        trs = self._trs
+        dip = 100.0 * self._dip / trs if trs != 0 else 0.0
+        din = 100.0 * self._din / trs if trs != 0 else 0.0
+        dx = 100.0 * abs((dip - din) / (dip + din)) if dip + din != 0 else 0.0
+
+        if t < 2 * w - 1:
+            self._dx_sum += dx
+            return 0.0
+        if t == 2 * w - 1:
+            self._adx = (self._dx_sum + dx) / w
+        else:
+            self._adx = (self._adx * (w - 1) + dx) / w
+        return self._adx
+
+
+class IncrementalFeatureEngine:
+    """Stateful counterpart of ``engineer_feature_set`` that ingests one bar at a time."""
+
+    def __init__(
+        self,
+        fast: int = 21,
+        slow: int = 55,
+        rsi_period: int = 14,
+        atr_period: int = 14,
+        adx_period: int = 14,
+        stoch_period: int = 14,
+        bb_window: int = 20,
+        bb_dev: float = 2.0,
+    ) -> None:
+        self.fast = fast
+        self.slow = slow
+        self.bb_dev = bb_dev
+        self.columns: tuple[str, ...] = (
+            f"sma_{fast}",
+            f"sma_{slow}",
+            "ema_fast",
+            "ema_slow",
+            "adx",
+            "rsi",
+            "stoch_k",
+            "stoch_d",
+            "atr",
+            "bb_high",
+            "bb_low",
+            "bb_pct",
+        )
+        self._sma_fast = RollingMean(fast)
+        self._sma_slow = RollingMean(slow)
+        self._ema_fast = EMA(span=fast)
+        self._ema_slow = EMA(span=slow)
+        self._adx = ADX(adx_period)
+        self._rsi = RSI(rsi_period)
+        self._stoch_high = RollingExtreme(stoch_period, "max")
+        self._stoch_low = RollingExtreme(stoch_period, "min")
+        self._stoch_d = RollingMean(3)
+        self._atr = ATR(atr_period)
+        self._bb = RollingStd(bb_window)
+        self.bars_seen = 0
+
+    def update(self, bar: Mapping[str, float]) -> dict[str, float]:
+        """Consume one OHLC bar and return the latest value of every feature."""
+
+        high = float(bar["high"])
+        low = float(bar["low"])
+        close = float(bar["close"])
+        self.bars_seen += 1
+
+        smax = self._stoch_high.update(high)
+        smin = self._stoch_low.update(low)
+        rng = smax - smin
+        stoch_k = 100.0 * (close - smin) / rng if rng != 0 else NAN
+
+        mavg, mstd = self._bb.update(close)
+        bb_high = mavg + self.bb_dev * mstd
+        bb_low = mavg - self.bb_dev * mstd
+        width = bb_high - bb_low
+        bb_pct = (close - bb_low) / width if width != 0 else NAN
+
+        values = (
+            self._sma_fast.update(close),
+            self._sma_slow.update(close),
+            self._ema_fast.update(close),
+            self._ema_slow.update(close),
+            self._adx.update(high, low, close),
+            self._rsi.update(close),
+            stoch_k,
+            self._stoch_d.update(stoch_k),
+            self._atr.update(high, low, close),
+            bb_high,
+            bb_low,
+            bb_pct,
+        )
+        return dict(zip(self.columns, values))
+
+    @traced(rows_arg="df")
+    def update_frame(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Replay a frame through the engine and return the features it emitted."""
+
+        rows = [self.update(bar) for bar in df[["high", "low", "close"]].to_dict("records")]
+        return pd.DataFrame(rows, index=df.index, columns=list(self.columns))
+
+
+def benchmark_update_latency(n_bars: int = 50_000, warmup: int = 1_000, seed: int = 0) -> dict[str, float]:
+    """Time ``IncrementalFeatureEngine.update`` per bar on a synthetic random walk."""
+
+    rng = np.random.default_rng(seed)
+    close = 1900 + np.cumsum(rng.normal(0, 1.5, n_bars + warmup))
+    spread = np.abs(rng.normal(0, 1.0, close.size))
+    bars = [{"high": c + s, "low": c - s, "close": c} for c, s in zip(close.tolist(), spread.tolist())]
+
+    engine = IncrementalFeatureEngine()
+    for bar in bars[:warmup]:
+        engine.update(bar)
+    timings = np.empty(n_bars, dtype=np.int64)
+    clock = time.perf_counter_ns
+    for i, bar in enumerate(bars[warmup:]):
+        start = clock()
+        engine.update(bar)
+        timings[i] = clock() - start
+
+    micros = timings / 1_000
+    return {
+        "bars": float(n_bars),
+        "mean_us": float(micros.mean()),
+        "p50_us": float(np.percentile(micros, 50)),
+        "p99_us": float(np.percentile(micros, 99)),
+        "max_us": float(micros.max()),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark per-bar latency of the incremental feature engine")
+    parser.add_argument("--bars", type=int, default=50_000)
+    args = parser.parse_args()
+
+    stats = benchmark_update_latency(n_bars=args.bars)
+    print(", ".join(f"{key}={value:.2f}" for key, value in stats.items()))
+
+
+if __name__ == "__main__":
+    main()
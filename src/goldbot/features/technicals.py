@@ -5,6 +5,11 @@ from __future__ import annotations
 import pandas as pd
 import ta
 
+from goldbot.utils.tracing import traced
+
+BB_WINDOW = 20
+BB_DEV = 2
+
 
 def add_trend_indicators(df: pd.DataFrame, fast: int = 21, slow: int = 55) -> pd.DataFrame:
     df = df.copy()
@@ -27,15 +32,27 @@ def add_momentum_indicators(df: pd.DataFrame, rsi_period: int = 14) -> pd.DataFr
 def add_volatility_indicators(df: pd.DataFrame, atr_period: int = 14) -> pd.DataFrame:
     df = df.copy()
     df["atr"] = ta.volatility.average_true_range(df["high"], df["low"], df["close"], window=atr_period)
-    bb = ta.volatility.BollingerBands(close=df["close"], window=20, window_dev=2)
+    bb = ta.volatility.BollingerBands(close=df["close"], window=BB_WINDOW, window_dev=BB_DEV)
     df["bb_high"] = bb.bollinger_hband()
     df["bb_low"] = bb.bollinger_lband()
     df["bb_pct"] = bb.bollinger_pband()
     return df
 
 
-def engineer_feature_set(df: pd.DataFrame) -> pd.DataFrame:
-    """Return dataframe with trend, momentum, and volatility features."""
+@traced(rows_arg="df")
+def engineer_feature_set(df: pd.DataFrame, backend: str = "pandas") -> pd.DataFrame:
+    """Return dataframe with trend, momentum, and volatility features.
+
+    ``backend="polars"`` evaluates the same indicators as a single lazy Polars
+    query and converts back to pandas only for the result.
+    """
+
+    if backend == "polars":
+        from goldbot.features.polars_backend import engineer_feature_set_polars
+
+        return engineer_feature_set_polars(df)
+    if backend != "pandas":
+        raise ValueError(f"Unknown feature backend {backend!r}")
 
     engineered = add_trend_indicators(df)
     engineered = add_momentum_indicators(engineered)
@@ -1,6 +1,8 @@
-"""Pipeline utilities for research workflows."""
+"""Pipeline utilities for research workflows, imported on first use."""
 
-from .baseline import BaselineResult, run_baseline_backtest
+from goldbot.utils.lazy import lazy_exports
 
-__all__ = ["run_baseline_backtest", "BaselineResult"]
+_EXPORTS = {"run_baseline_backtest": ".baseline", "BaselineResult": ".baseline"}
 
+__all__ = list(_EXPORTS)
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
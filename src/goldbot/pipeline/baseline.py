@@ -3,13 +3,17 @@
 from __future__ import annotations
 
 import argparse
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
 
-from goldbot.backtest import BacktestResult, VectorizedBacktester
-from goldbot.data import compute_quality_report, load_cached_prices
-from goldbot.features import engineer_feature_set
-from goldbot.strategies import DualMovingAverageStrategy
-from goldbot.utils.logging import configure_logging
+from goldbot.strategies.registry import available_strategies, parse_strategy_spec
+from goldbot.utils.tracing import disable_tracing, enable_tracing, span
+
+if TYPE_CHECKING:
+    from goldbot.backtest import BacktestResult
+    from goldbot.features import FeatureCache
+    from goldbot.strategies.base import BaseStrategy
 
 
 @dataclass(slots=True)
@@ -19,29 +23,90 @@ class BaselineResult:
     backtest: BacktestResult
 
 
-def run_baseline_backtest(symbol: str = "XAUUSD", timeframe: str = "1h") -> BaselineResult:
-    """Load cached data, engineer features, run dual-MA backtest."""
+def run_baseline_backtest(
+    symbol: str = "XAUUSD",
+    timeframe: str = "1h",
+    feature_cache: FeatureCache | None = None,
+    strategy: str | BaseStrategy = "dual_ma_trend",
+) -> BaselineResult:
+    """Load cached data, engineer features, run a strategy backtest (dual-MA by default).
+
+    ``strategy`` is a strategy instance or a registry spec such as
+    ``"donchian_breakout:window=20"``. Pass a ``FeatureCache`` to reuse
+    indicator frames across runs. With tracing enabled the run is one
+    ``pipeline.baseline`` span whose children are the loading, quality,
+    feature, signal and backtest spans.
+    """
 
-    prices = load_cached_prices(symbol=symbol, timeframe=timeframe)
-    quality = compute_quality_report(prices, freq=timeframe.upper())
-    features = engineer_feature_set(prices)
-    strategy = DualMovingAverageStrategy()
-    signals = strategy.generate_signals(features)
-    backtester = VectorizedBacktester()
-    result = backtester.run(signals)
-    return BaselineResult(stats=result.stats, quality=quality.__dict__, backtest=result)
+    # The data/feature/backtest stack is imported here rather than at module
+    # level so ``--help`` and short-lived workers do not pay for pandas et al.
+    from goldbot.backtest.engine import VectorizedBacktester
+    from goldbot.data.quality import compute_quality_report, load_cached_prices
+    from goldbot.features.technicals import engineer_feature_set
+
+    with span("pipeline.baseline", symbol=symbol, timeframe=timeframe):
+        prices = load_cached_prices(symbol=symbol, timeframe=timeframe)
+        quality = compute_quality_report(prices, freq=timeframe.upper())
+        if feature_cache is not None:
+            features = feature_cache.get_or_compute(prices, engineer_feature_set)
+        else:
+            features = engineer_feature_set(prices)
+        if isinstance(strategy, str):
+            strategy = parse_strategy_spec(strategy)
+        result = VectorizedBacktester().run_strategy(strategy, features)
+    return BaselineResult(stats=result.stats, quality=asdict(quality), backtest=result)
 
 
 def main() -> None:
     parser = argparse.ArgumentParser(description="Run baseline XAUUSD backtest on cached data")
     parser.add_argument("--symbol", default="XAUUSD")
     parser.add_argument("--timeframe", default="1h")
+    parser.add_argument("--feature-cache", action="store_true", help="Reuse engineered features from data/cache.")
+    parser.add_argument(
+        "--strategy",
+        default="dual_ma_trend",
+        help=f"name[:key=value,...] of a registered strategy ({', '.join(available_strategies())})",
+    )
+    parser.add_argument(
+        "--trace",
+        type=Path,
+        default=None,
+        help="write span timings to this JSON file (plus a .prom Prometheus text file next to it)",
+    )
+    parser.add_argument("--trace-memory", action="store_true", help="record tracemalloc memory deltas per span")
+    parser.add_argument(
+        "--profile", action="store_true", help="sample the Python stack during the run (.folded next to --trace)"
+    )
     args = parser.parse_args()
+    if args.trace is None and (args.trace_memory or args.profile):
+        parser.error("--trace-memory and --profile need --trace")
+
+    from goldbot.features.cache import FeatureCache
+    from goldbot.utils.logging import configure_logging
 
     configure_logging()
-    outcome = run_baseline_backtest(symbol=args.symbol, timeframe=args.timeframe)
+    tracer = None
+    if args.trace is not None:
+        tracer = enable_tracing(
+            memory=args.trace_memory, profile_spans=("pipeline.baseline",) if args.profile else ()
+        )
+    cache = FeatureCache() if args.feature_cache else None
+    try:
+        outcome = run_baseline_backtest(
+            symbol=args.symbol, timeframe=args.timeframe, feature_cache=cache, strategy=args.strategy
+        )
+    finally:
+        if tracer is not None:
+            disable_tracing()
     print("Quality:", outcome.quality)
     print("Stats:", outcome.stats)
+    if tracer is not None:
+        tracer.export_json(args.trace)
+        tracer.export_prometheus(args.trace.with_suffix(".prom"))
+        if args.profile:
+            tracer.export_profiles(args.trace.with_suffix(".folded"))
+        for name, stats in tracer.summary().items():
+            print(f"{name:>40}: {stats['wall_s']:.4f}s wall, {stats['cpu_s']:.4f}s cpu, {stats['rows']} rows")
 
 
 if __name__ == "__main__":
@@ -1,6 +1,19 @@
-"""Reporting utilities."""
+"""Reporting utilities, imported on first use (Plotly loads only when a figure is built)."""
 
-from .baseline_report import generate_baseline_report
+from goldbot.utils.lazy import lazy_exports
 
-__all__ = ["generate_baseline_report"]
+# ``downsample`` shares its name with its module, which would shadow a lazy export once the
+# module is imported, so these (NumPy/pandas only) are bound eagerly.
+from .downsample import downsample, lttb_indices, minmax_indices
 
+_EXPORTS = {
+    "generate_baseline_report": ".baseline_report",
+    "ReportRun": ".batch",
+    "BatchReport": ".batch",
+    "build_report_figure": ".batch",
+    "render_report": ".batch",
+    "render_batch": ".batch",
+}
+
+__all__ = [*_EXPORTS, "downsample", "lttb_indices", "minmax_indices"]
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -7,9 +7,8 @@ import json
 from dataclasses import dataclass
 from pathlib import Path
 
-import plotly.graph_objs as go
-
 from goldbot.pipeline.baseline import BaselineResult, run_baseline_backtest
+from goldbot.reporting.batch import ReportRun, build_report_figure
 from goldbot.utils.logging import configure_logging
 
 
@@ -24,15 +23,19 @@ def generate_baseline_report(
     symbol: str = "XAUUSD",
     timeframe: str = "1h",
     output_dir: Path | None = None,
+    max_points: int | None = 2_000,
 ) -> ReportArtifacts:
-    """Run baseline pipeline and persist stats + equity curve figure."""
+    """Run baseline pipeline and persist stats + report figure.
+
+    Curves in the figure are downsampled to ``max_points`` (``None`` keeps every bar).
+    """
 
     outcome = run_baseline_backtest(symbol=symbol, timeframe=timeframe)
-    stats_path, quality_path, equity_path = _write_artifacts(outcome, output_dir)
+    stats_path, quality_path, equity_path = _write_artifacts(outcome, output_dir, max_points)
     return ReportArtifacts(stats_path=stats_path, quality_path=quality_path, equity_plot_path=equity_path)
 
 
-def _write_artifacts(outcome: BaselineResult, output_dir: Path | None):
+def _write_artifacts(outcome: BaselineResult, output_dir: Path | None, max_points: int | None = 2_000):
     out_dir = output_dir or Path("reports")
     out_dir.mkdir(parents=True, exist_ok=True)
     stats_path = out_dir / "baseline_stats.json"
@@ -42,17 +45,8 @@ def _write_artifacts(outcome: BaselineResult, output_dir: Path | None):
     stats_path.write_text(json.dumps(outcome.stats, indent=2))
     quality_path.write_text(json.dumps(outcome.quality, indent=2, default=str))
 
-    figure = go.Figure()
-    figure.add_trace(
-        go.Scatter(
-            x=outcome.backtest.equity_curve.index,
-            y=outcome.backtest.equity_curve.values,
-            mode="lines",
-            name="Equity",
-        )
-    )
-    figure.update_layout(title="Baseline Equity Curve", xaxis_title="Date", yaxis_title="Equity (USD)")
-    figure.write_html(equity_path)
+    run = ReportRun.from_result("Baseline Equity Curve", outcome.backtest)
+    build_report_figure(run, max_points).write_html(equity_path, include_plotlyjs="directory")
     return stats_path, quality_path, equity_path
 
 
@@ -61,6 +55,7 @@ def main() -> None:
     parser.add_argument("--symbol", default="XAUUSD")
     parser.add_argument("--timeframe", default="1h")
     parser.add_argument("--output-dir", default="reports")
+    parser.add_argument("--max-points", type=int, default=2_000, help="points per plotted curve; 0 keeps every bar")
     args = parser.parse_args()
 
     configure_logging()
@@ -68,6 +63,7 @@ def main() -> None:
         symbol=args.symbol,
         timeframe=args.timeframe,
         output_dir=Path(args.output_dir),
+        max_points=args.max_points or None,
     )
     print("Report artifacts saved:", artifacts)
 
@@ -0,0 +1,241 @@
+"""Bounded-size HTML reports for single runs and parallel batches of runs."""
+
+from __future__ import annotations
+
+import argparse
+import html
+import json
+import re
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from goldbot.reporting.downsample import downsample
+
+if TYPE_CHECKING:
+    import plotly.graph_objs as go
+
+INDEX_COLUMNS = ("total_return", "cagr", "sharpe", "sortino", "max_drawdown", "calmar", "hit_rate", "exposure")
+TRADE_BINS = 50
+PLOTLY_BUNDLE = "plotly.min.js"
+
+
+@dataclass(slots=True)
+class ReportRun:
+    name: str
+    equity_curve: pd.Series
+    trades: pd.DataFrame = field(default_factory=pd.DataFrame)
+    stats: dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_result(cls, name: str, result: Any) -> ReportRun:
+        """Wrap anything with ``equity_curve``/``stats`` (and optionally ``trades``), e.g. a ``BacktestResult``."""
+
+        trades = getattr(result, "trades", None)
+        return cls(name, result.equity_curve, trades if trades is not None else pd.DataFrame(), dict(result.stats))
+
+
+@dataclass(slots=True)
+class BatchReport:
+    index_path: Path
+    report_paths: list[Path]
+
+
+def monthly_returns(equity: pd.Series) -> pd.DataFrame:
+    """Year x month table of compounded returns from an equity curve with a datetime index."""
+
+    month_end = equity.resample("ME").last().dropna()
+    returns = month_end.pct_change()
+    returns.iloc[0] = month_end.iloc[0] / equity.iloc[0] - 1
+    table = pd.DataFrame({"year": returns.index.year, "month": returns.index.month, "ret": returns.to_numpy()})
+    return table.pivot(index="year", columns="month", values="ret").reindex(columns=range(1, 13))
+
+
+def build_report_figure(run: ReportRun, max_points: Optional[int] = 2_000, method: str = "lttb") -> go.Figure:
+    """Equity, drawdown, trade-return distribution and monthly-return panels for one run.
+
+    Curves are downsampled to ``max_points`` (drawdown always with min/max
+    buckets so the deepest trough survives), trades are pre-binned into
+    ``TRADE_BINS`` bars and monthly returns are one cell per month, so the
+    figure size does not grow with the number of bars or trades.
+    """
+
+    import plotly.graph_objs as go
+    from plotly.subplots import make_subplots
+
+    equity = run.equity_curve
+    drawdown = equity / equity.cummax() - 1
+    equity_points = downsample(equity, max_points, method)
+    drawdown_points = downsample(drawdown, max_points, "minmax")
+
+    figure = make_subplots(
+        rows=3,
+        cols=2,
+        specs=[[{"colspan": 2}, None], [{"colspan": 2}, None], [{}, {}]],
+        row_heights=[0.45, 0.2, 0.35],
+        vertical_spacing=0.08,
+        subplot_titles=("Equity", "Drawdown", "Trade returns", "Monthly returns"),
+    )
+    figure.add_trace(
+        go.Scatter(x=equity_points.index, y=equity_points.to_numpy(), mode="lines", name="Equity"), row=1, col=1
+    )
+    figure.add_trace(
+        go.Scatter(
+            x=drawdown_points.index,
+            y=drawdown_points.to_numpy(),
+            mode="lines",
+            fill="tozeroy",
+            name="Drawdown",
+        ),
+        row=2,
+        col=1,
+    )
+
+    column = next((c for c in ("net_return", "pnl") if c in run.trades), None)
+    trade_values = run.trades[column].to_numpy(dtype=np.float64) if column else np.empty(0)
+    trade_values = trade_values[np.isfinite(trade_values)]
+    if trade_values.size:
+        counts, edges = np.histogram(trade_values, bins=TRADE_BINS)
+        figure.add_trace(
+            go.Bar(x=(edges[:-1] + edges[1:]) / 2, y=counts, width=np.diff(edges), name=f"Trades ({column})"),
+            row=3,
+            col=1,
+        )
+
+    if isinstance(equity.index, pd.DatetimeIndex) and len(equity):
+        table = monthly_returns(equity)
+        figure.add_trace(
+            go.Heatmap(
+                z=table.to_numpy(),
+                x=[pd.Timestamp(2000, m, 1).strftime("%b") for m in table.columns],
+                y=[str(year) for year in table.index],
+                colorscale="RdYlGn",
+                zmid=0,
+                showscale=False,
+                name="Monthly",
+            ),
+            row=3,
+            col=2,
+        )
+
+    figure.update_layout(title=run.name, height=900, showlegend=False)
+    return figure
+
+
+def render_report(
+    run: ReportRun,
+    output_dir: Path,
+    max_points: Optional[int] = 2_000,
+    method: str = "lttb",
+    include_plotlyjs: str | bool = "directory",
+) -> Path:
+    """Write ``<slug>.html`` and ``<slug>.json`` for ``run``; returns the HTML path.
+
+    ``include_plotlyjs="directory"`` references one shared ``plotly.min.js``
+    next to the report instead of embedding ~3.5 MB of JavaScript in every file.
+    """
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    slug = _slug(run.name)
+    html_path = output_dir / f"{slug}.html"
+    (output_dir / f"{slug}.json").write_text(json.dumps(run.stats, indent=2, default=str))
+    build_report_figure(run, max_points, method).write_html(html_path, include_plotlyjs=include_plotlyjs)
+    return html_path
+
+
+def _render_one(args: tuple[ReportRun, Path, Optional[int], str]) -> Path:
+    return render_report(*args)
+
+
+def render_batch(
+    runs: Sequence[ReportRun],
+    output_dir: Path,
+    max_points: Optional[int] = 2_000,
+    method: str = "lttb",
+    max_workers: Optional[int] = None,
+    sort_by: Optional[str] = "sharpe",
+) -> BatchReport:
+    """Render every run in worker processes and link them from ``index.html``.
+
+    The Plotly bundle is written once before the workers start, so each
+    report only references it. The index is a table of ``INDEX_COLUMNS``
+    stats (sorted by ``sort_by`` when present) with one link per run.
+    """
+
+    names = [run.name for run in runs]
+    if len(set(map(_slug, names))) != len(names):
+        raise ValueError("Report run names must be unique.")
+    output_dir.mkdir(parents=True, exist_ok=True)
+    bundle = output_dir / PLOTLY_BUNDLE
+    if not bundle.exists():
+        from plotly.offline import get_plotlyjs
+
+        bundle.write_text(get_plotlyjs(), encoding="utf-8")
+
+    jobs = [(run, output_dir, max_points, method) for run in runs]
+    if max_workers == 1 or len(runs) <= 1:
+        paths = [_render_one(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            paths = list(pool.map(_render_one, jobs, chunksize=max(1, len(jobs) // 64)))
+
+    index_path = output_dir / "index.html"
+    index_path.write_text(_index_html(runs, paths, sort_by), encoding="utf-8")
+    return BatchReport(index_path=index_path, report_paths=paths)
+
+
+def _index_html(runs: Sequence[ReportRun], paths: Sequence[Path], sort_by: Optional[str]) -> str:
+    table = pd.DataFrame([{key: run.stats.get(key, np.nan) for key in INDEX_COLUMNS} for run in runs])
+    table.insert(0, "run", [f'<a href="{p.name}">{html.escape(run.name)}</a>' for run, p in zip(runs, paths)])
+    if sort_by in table:
+        table = table.sort_values(sort_by, ascending=False, na_position="last")
+    body = table.to_html(index=False, escape=False, float_format=lambda v: f"{v:.4f}", na_rep="")
+    return (
+        "<!DOCTYPE html>\n<html><head><meta charset='utf-8'><title>goldbot reports</title>"
+        "<style>body{font-family:sans-serif}td,th{padding:2px 8px;text-align:right}</style></head>"
+        f"<body><h1>{len(runs)} runs</h1>{body}</body></html>\n"
+    )
+
+
+def _slug(name: str) -> str:
+    return re.sub(r"[^A-Za-z0-9_.-]+", "_", name).strip("_") or "run"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Render reports for the best moving-average sweep combos")
+    parser.add_argument("--symbol", default="XAUUSD")
+    parser.add_argument("--timeframe", default="1h")
+    parser.add_argument("--fast", type=int, nargs=3, default=(5, 50, 5), metavar=("START", "STOP", "STEP"))
+    parser.add_argument("--slow", type=int, nargs=3, default=(20, 200, 10), metavar=("START", "STOP", "STEP"))
+    parser.add_argument("--top", type=int, default=100, help="render the N combos with the best Sharpe")
+    parser.add_argument("--max-points", type=int, default=2_000)
+    parser.add_argument("--method", choices=("lttb", "minmax"), default="lttb")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--output-dir", default="reports/batch")
+    args = parser.parse_args()
+
+    # Imported here so render workers, which only import this module, skip the backtest stack.
+    from goldbot.backtest import MovingAverageSweep, VectorizedBacktester
+    from goldbot.data import load_cached_prices
+    from goldbot.strategies import DualMovingAverageStrategy
+    from goldbot.utils.logging import configure_logging
+
+    configure_logging()
+    prices = load_cached_prices(symbol=args.symbol, timeframe=args.timeframe)
+    sweep = MovingAverageSweep().run(prices, range(*args.fast), range(*args.slow))
+    best = sweep.nlargest(args.top, "sharpe")
+    backtester = VectorizedBacktester()
+    runs = []
+    for fast, slow in best[["fast", "slow"]].itertuples(index=False):
+        strategy = DualMovingAverageStrategy(fast=int(fast), slow=int(slow))
+        runs.append(ReportRun.from_result(f"dual_ma_{fast}_{slow}", backtester.run_strategy(strategy, prices)))
+    batch = render_batch(runs, Path(args.output_dir), args.max_points, args.method, args.workers)
+    print("Index written to", batch.index_path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Shape-preserving downsampling of long curves for plotting."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+DOWNSAMPLE_METHODS = ("lttb", "minmax")
+
+
+def lttb_indices(y: np.ndarray, n_out: int, x: np.ndarray | None = None) -> np.ndarray:
+    """Indices kept by Largest-Triangle-Three-Buckets.
+
+    The first and last points are always kept; every bucket in between keeps
+    the point forming the largest triangle with the previously kept point and
+    the mean of the next bucket. The loop runs once per bucket (not per
+    point), so the cost is one pass over ``y`` plus ``n_out`` small slices.
+    """
+
+    y = np.asarray(y, dtype=np.float64)
+    n = y.size
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    x = np.arange(n, dtype=np.float64) if x is None else np.asarray(x, dtype=np.float64)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    edges = np.append(edges, n)
+    out = np.empty(n_out, dtype=np.int64)
+    out[0], out[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi, next_hi = edges[i], edges[i + 1], edges[i + 2]
+        avg_x = x[hi:next_hi].mean()
+        avg_y = y[hi:next_hi].mean()
+        area = np.abs((x[a] - avg_x) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (avg_y - y[a]))
+        a = lo + int(np.argmax(area))
+        out[i + 1] = a
+    return out
+
+
+def minmax_indices(y: np.ndarray, n_out: int) -> np.ndarray:
+    """Indices of the minimum and maximum of ``n_out // 2`` equal-width buckets, plus both ends."""
+
+    y = np.asarray(y, dtype=np.float64)
+    n = y.size
+    if n_out >= n or n_out < 4:
+        return np.arange(n)
+    width = -(-n // (n_out // 2))
+    buckets = -(-n // width)
+    padded = np.full(buckets * width, np.nan)
+    padded[:n] = y
+    padded = padded.reshape(buckets, width)
+    offsets = np.arange(buckets) * width
+    filled = np.isfinite(padded).any(axis=1)
+    lows = np.where(filled, np.nanargmin(np.where(filled[:, None], padded, 0.0), axis=1), 0) + offsets
+    highs = np.where(filled, np.nanargmax(np.where(filled[:, None], padded, 0.0), axis=1), 0) + offsets
+    return np.unique(np.concatenate(([0, n - 1], lows[filled], highs[filled])))
+
+
+def downsample(series: pd.Series, max_points: int | None = 2_000, method: str = "lttb") -> pd.Series:
+    """Return at most about ``max_points`` points of ``series`` keeping its visual shape.
+
+    ``lttb`` keeps the overall shape with exactly ``max_points`` points (x is
+    the timestamp, so weekend gaps are honoured); ``minmax`` keeps every
+    bucket's extreme values, so no drawdown trough or spike is lost.
+    ``max_points=None`` returns the series unchanged.
+    """
+
+    if method not in DOWNSAMPLE_METHODS:
+        raise ValueError(f"Unknown downsampling method {method!r}; choose from {DOWNSAMPLE_METHODS}")
+    if max_points is None or len(series) <= max_points:
+        return series
+    values = series.to_numpy(dtype=np.float64)
+    if method == "minmax":
+        keep = minmax_indices(values, max_points)
+    else:
+        x = series.index.asi8 if isinstance(series.index, pd.DatetimeIndex) else None
+        keep = lttb_indices(values, max_points, x)
+    return series.iloc[keep]
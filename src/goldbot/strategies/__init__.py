@@ -1,6 +1,25 @@
-"""Strategies registry."""
+"""Strategies registry.
 
-from .trend_following import DualMovingAverageStrategy
+Exports are imported on first use. Built-in strategies register themselves
+when their module is imported, which the registry does on first lookup; new
+strategies decorate their class with ``register_strategy`` and are added to
+``BUILTIN_STRATEGIES``.
+"""
 
-__all__ = ["DualMovingAverageStrategy"]
+from goldbot.utils.lazy import lazy_exports
 
+_EXPORTS = {
+    "DualMovingAverageStrategy": ".trend_following",
+    "DonchianBreakoutStrategy": ".breakout",
+    "BollingerMeanReversionStrategy": ".mean_reversion",
+    "BUILTIN_STRATEGIES": ".registry",
+    "STRATEGY_REGISTRY": ".registry",
+    "available_strategies": ".registry",
+    "create_strategy": ".registry",
+    "parse_strategy_spec": ".registry",
+    "register_strategy": ".registry",
+    "strategy_label": ".registry",
+}
+
+__all__ = list(_EXPORTS)
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -5,8 +5,13 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Protocol
 
+import numpy as np
 import pandas as pd
 
+from goldbot.utils.tracing import span
+
+PRICE_COLUMNS = ("open", "high", "low", "close")
+
 
 class Signal(Protocol):
     entry: float
@@ -22,10 +27,57 @@ class StrategyContext:
     risk_per_trade: float = 0.01
 
 
+def lag_signal(signal: np.ndarray) -> np.ndarray:
+    """Position held on each bar: the previous bar's signal, flat on the first bar."""
+
+    position = np.empty_like(signal)
+    position[:1] = 0
+    position[1:] = signal[:-1]
+    return position
+
+
+def hold_signal(raw: np.ndarray) -> np.ndarray:
+    """Carry the last non-NaN entry of ``raw`` forward (flat before the first) as int8."""
+
+    valid = ~np.isnan(raw)
+    last = np.maximum.accumulate(np.where(valid, np.arange(raw.size), -1))
+    held = np.where(last >= 0, raw[np.maximum(last, 0)], 0.0)
+    return held.astype(np.int8)
+
+
+def signal_frame(data: pd.DataFrame, signal: np.ndarray) -> pd.DataFrame:
+    """Narrow frame of the price columns plus ``signal``/``position`` for frame-based engines."""
+
+    frame = pd.DataFrame({col: data[col] for col in PRICE_COLUMNS if col in data}, index=data.index)
+    frame["signal"] = signal
+    frame["position"] = lag_signal(signal)
+    return frame
+
+
 class BaseStrategy(Protocol):
+    """Strategies implement ``signals``; ``positions`` and ``generate_signals`` derive from it.
+
+    ``signals`` returns one int8 entry (-1/0/1) per row of ``data``, aligned to
+    its index. Implementations read columns (reusing precomputed features when
+    present) and never copy or modify ``data``, so many strategies can share
+    one read-only feature frame.
+    """
+
     name: str
 
-    def generate_signals(self, data: pd.DataFrame) -> pd.DataFrame: ...
+    def signals(self, data: pd.DataFrame) -> np.ndarray: ...
+
+    def positions(self, data: pd.DataFrame) -> np.ndarray:
+        """int8 position held on each bar (the signal lagged by one bar)."""
+
+        with span("strategies.signals", rows=len(data), strategy=self.name):
+            signals = self.signals(data)
+        return lag_signal(signals)
+
+    def generate_signals(self, data: pd.DataFrame) -> pd.DataFrame:
+        with span("strategies.signals", rows=len(data), strategy=self.name):
+            signals = self.signals(data)
+        return signal_frame(data, signals)
 
     def position_size(self, context: StrategyContext) -> float:
         if context.data.empty:
@@ -36,4 +88,3 @@ class BaseStrategy(Protocol):
         dollar_risk = context.cash * context.risk_per_trade
         contracts = dollar_risk / atr
         return max(0.0, contracts)
-
@@ -0,0 +1,30 @@
+"""Donchian channel breakout strategy."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from goldbot.strategies.base import BaseStrategy, hold_signal
+from goldbot.strategies.registry import register_strategy
+
+
+@register_strategy
+class DonchianBreakoutStrategy(BaseStrategy):
+    """Go long on a close above the prior ``window``-bar high, short below the prior low.
+
+    The position is held until the opposite breakout. Only ``close`` (and
+    ``high``/``low`` when present) are read.
+    """
+
+    name = "donchian_breakout"
+
+    def __init__(self, window: int = 55) -> None:
+        self.window = window
+
+    def signals(self, data: pd.DataFrame) -> np.ndarray:
+        close = data["close"]
+        upper = data.get("high", close).rolling(self.window).max().shift(1).to_numpy()
+        lower = data.get("low", close).rolling(self.window).min().shift(1).to_numpy()
+        price = close.to_numpy()
+        return hold_signal(np.where(price > upper, 1.0, np.where(price < lower, -1.0, np.nan)))
@@ -0,0 +1,42 @@
+"""Bollinger-band mean-reversion strategy."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from goldbot.features.technicals import BB_DEV, BB_WINDOW
+from goldbot.strategies.base import BaseStrategy, hold_signal
+from goldbot.strategies.registry import register_strategy
+
+
+@register_strategy
+class BollingerMeanReversionStrategy(BaseStrategy):
+    """Fade moves beyond ``entry_z`` standard deviations and exit once back inside ``exit_z``.
+
+    With the default ``window`` the z-score comes from the ``bb_pct`` feature
+    column when present; otherwise it is computed from ``close``.
+    """
+
+    name = "bollinger_reversion"
+
+    def __init__(self, window: int = BB_WINDOW, entry_z: float = 2.0, exit_z: float = 0.5) -> None:
+        self.window = window
+        self.entry_z = entry_z
+        self.exit_z = exit_z
+
+    def zscore(self, data: pd.DataFrame) -> np.ndarray:
+        if self.window == BB_WINDOW and "bb_pct" in data:
+            # bb_pct maps mean - BB_DEV*std .. mean + BB_DEV*std onto 0..1.
+            return (data["bb_pct"].to_numpy() - 0.5) * (2 * BB_DEV)
+        rolling = data["close"].rolling(self.window)
+        return ((data["close"] - rolling.mean()) / rolling.std(ddof=0)).to_numpy()
+
+    def signals(self, data: pd.DataFrame) -> np.ndarray:
+        z = self.zscore(data)
+        raw = np.where(
+            z > self.entry_z,
+            -1.0,
+            np.where(z < -self.entry_z, 1.0, np.where(np.abs(z) < self.exit_z, 0.0, np.nan)),
+        )
+        return hold_signal(raw)
@@ -0,0 +1,77 @@
+"""Name -> class registry so strategies can be chosen by config or CLI flag."""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any, TypeVar
+
+if TYPE_CHECKING:
+    from goldbot.strategies.base import BaseStrategy
+
+StrategyType = TypeVar("StrategyType", bound=type)
+
+STRATEGY_REGISTRY: dict[str, type] = {}
+# Modules that register the built-in strategies; imported the first time one is looked up.
+BUILTIN_STRATEGIES = {
+    "dual_ma_trend": "goldbot.strategies.trend_following",
+    "donchian_breakout": "goldbot.strategies.breakout",
+    "bollinger_reversion": "goldbot.strategies.mean_reversion",
+}
+
+
+def register_strategy(cls: StrategyType) -> StrategyType:
+    """Class decorator: make ``cls`` available under its ``name`` attribute."""
+
+    name = getattr(cls, "name", None)
+    if not name:
+        raise ValueError(f"{cls.__name__} needs a class-level `name` to be registered")
+    existing = STRATEGY_REGISTRY.get(name)
+    if existing is not None and existing is not cls:
+        raise ValueError(f"Strategy name {name!r} already registered by {existing.__name__}")
+    STRATEGY_REGISTRY[name] = cls
+    return cls
+
+
+def available_strategies() -> list[str]:
+    return sorted(STRATEGY_REGISTRY.keys() | BUILTIN_STRATEGIES.keys())
+
+
+def create_strategy(name: str, **params: Any) -> BaseStrategy:
+    if name not in STRATEGY_REGISTRY and name in BUILTIN_STRATEGIES:
+        importlib.import_module(BUILTIN_STRATEGIES[name])
+    try:
+        cls = STRATEGY_REGISTRY[name]
+    except KeyError:
+        raise ValueError(f"Unknown strategy {name!r}; choose from {available_strategies()}") from None
+    return cls(**params)
+
+
+def _coerce(value: str) -> Any:
+    for cast in (int, float):
+        try:
+            return cast(value)
+        except ValueError:
+            pass
+    return value
+
+
+def parse_strategy_spec(spec: str) -> BaseStrategy:
+    """Build a strategy from ``name`` or ``name:key=value,key=value`` (e.g. ``dual_ma_trend:fast=10,slow=50``)."""
+
+    name, _, raw = spec.partition(":")
+    params = {}
+    for item in filter(None, raw.split(",")):
+        key, sep, value = item.partition("=")
+        if not sep:
+            raise ValueError(f"Malformed strategy parameter {item!r} in {spec!r}")
+        params[key.strip()] = _coerce(value.strip())
+    return create_strategy(name.strip(), **params)
+
+
+def strategy_label(strategy: BaseStrategy) -> str:
+    """Readable, unique-per-parameter-set label such as ``dual_ma_trend(fast=10,slow=50)``."""
+
+    params = getattr(strategy, "__dict__", {})
+    if not params:
+        return strategy.name
+    return f"{strategy.name}({','.join(f'{k}={v}' for k, v in params.items())})"
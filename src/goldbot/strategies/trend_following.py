@@ -2,11 +2,17 @@
 
 from __future__ import annotations
 
+import math
+from typing import Mapping
+
+import numpy as np
 import pandas as pd
 
 from goldbot.strategies.base import BaseStrategy
+from goldbot.strategies.registry import register_strategy
 
 
+@register_strategy
 class DualMovingAverageStrategy(BaseStrategy):
     name = "dual_ma_trend"
 
@@ -14,13 +20,29 @@ class DualMovingAverageStrategy(BaseStrategy):
         self.fast = fast
         self.slow = slow
 
-    def generate_signals(self, data: pd.DataFrame) -> pd.DataFrame:
-        df = data.copy()
-        df[f"sma_{self.fast}"] = df["close"].rolling(self.fast).mean()
-        df[f"sma_{self.slow}"] = df["close"].rolling(self.slow).mean()
-        df["signal"] = 0
-        df.loc[df[f"sma_{self.fast}"] > df[f"sma_{self.slow}"], "signal"] = 1
-        df.loc[df[f"sma_{self.fast}"] < df[f"sma_{self.slow}"], "signal"] = -1
-        df["position"] = df["signal"].shift(1).fillna(0)
-        return df
+    def _sma(self, data: pd.DataFrame, window: int) -> np.ndarray:
+        column = f"sma_{window}"
+        if column in data:
+            return data[column].to_numpy()
+        return data["close"].rolling(window).mean().to_numpy()
+
+    def signals(self, data: pd.DataFrame) -> np.ndarray:
+        """+1 while the fast SMA is above the slow one, -1 below, 0 during warm-up.
+
+        Reuses ``sma_{fast}``/``sma_{slow}`` feature columns when present.
+        """
+
+        fast = self._sma(data, self.fast)
+        slow = self._sma(data, self.slow)
+        return np.greater(fast, slow).astype(np.int8) - np.less(fast, slow)
+
+    def on_bar(self, features: Mapping[str, float]) -> int:
+        """Signal for the latest bar from streaming features (live counterpart of ``signals``)."""
 
+        fast = features.get(f"sma_{self.fast}", math.nan)
+        slow = features.get(f"sma_{self.slow}", math.nan)
+        if fast > slow:
+            return 1
+        if fast < slow:
+            return -1
+        return 0
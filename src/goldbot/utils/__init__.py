@@ -1,6 +1,19 @@
-"""Utility exports."""
+"""Utility exports, imported on first use."""
 
-from .logging import configure_logging
+from .lazy import lazy_exports
 
-__all__ = ["configure_logging"]
+_EXPORTS = {
+    "configure_logging": ".logging",
+    "LatencyRecorder": ".latency",
+    "TokenBucket": ".rate_limit",
+    "Tracer": ".tracing",
+    "SamplingProfiler": ".tracing",
+    "enable_tracing": ".tracing",
+    "disable_tracing": ".tracing",
+    "get_tracer": ".tracing",
+    "span": ".tracing",
+    "traced": ".tracing",
+}
 
+__all__ = list(_EXPORTS)
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -0,0 +1,70 @@
+"""Latency bookkeeping shared by data, backtest, and execution hot paths."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Iterator
+
+import numpy as np
+
+DEFAULT_HISTOGRAM_EDGES_MS = (0.1, 0.5, 1, 2, 5, 10, 25, 50, 100, 250, 500, 1_000)
+
+
+class LatencyRecorder:
+    """Thread-safe collection of per-label durations with percentile summaries."""
+
+    def __init__(self) -> None:
+        self._samples: dict[str, list[float]] = defaultdict(list)
+        self._lock = threading.Lock()
+
+    def record(self, label: str, seconds: float) -> None:
+        with self._lock:
+            self._samples[label].append(seconds)
+
+    @contextmanager
+    def time(self, label: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(label, time.perf_counter() - start)
+
+    def labels(self) -> list[str]:
+        with self._lock:
+            return sorted(self._samples)
+
+    def samples(self, label: str) -> np.ndarray:
+        with self._lock:
+            return np.asarray(self._samples.get(label, ()), dtype=np.float64)
+
+    def summary(self, label: str) -> dict[str, float]:
+        """Return count plus mean/p50/p95/p99/max in milliseconds."""
+
+        values = self.samples(label) * 1_000
+        if values.size == 0:
+            return {"count": 0.0}
+        p50, p95, p99 = np.percentile(values, [50, 95, 99])
+        return {
+            "count": float(values.size),
+            "mean_ms": float(values.mean()),
+            "p50_ms": float(p50),
+            "p95_ms": float(p95),
+            "p99_ms": float(p99),
+            "max_ms": float(values.max()),
+        }
+
+    def histogram(
+        self, label: str, edges_ms: tuple[float, ...] = DEFAULT_HISTOGRAM_EDGES_MS
+    ) -> dict[str, int]:
+        """Bucket counts keyed ``"<=edge"`` (ms) plus an overflow ``">last"`` bucket."""
+
+        values = self.samples(label) * 1_000
+        counts = np.bincount(np.searchsorted(edges_ms, values, side="left"), minlength=len(edges_ms) + 1)
+        keys = [f"<={edge:g}ms" for edge in edges_ms] + [f">{edges_ms[-1]:g}ms"]
+        return dict(zip(keys, (int(c) for c in counts)))
+
+    def summaries(self) -> dict[str, dict[str, float]]:
+        return {label: self.summary(label) for label in self.labels()}
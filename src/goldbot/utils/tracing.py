@@ -0,0 +1,371 @@
+"""Opt-in spans (wall/CPU time, rows, memory delta) with JSON and Prometheus export.
+
+Tracing is off by default: ``span`` then returns a shared no-op context
+manager and ``traced`` functions call straight through, so instrumented hot
+paths pay one global lookup. ``enable_tracing`` installs a ``Tracer`` that
+keeps per-span aggregates plus the most recent individual spans, optionally
+tracks allocations with ``tracemalloc`` and runs a ``SamplingProfiler`` inside
+selected spans.
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+import os
+import sys
+from contextvars import ContextVar
+import threading
+import time
+import tracemalloc
+from collections import Counter, deque
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Iterable, Optional, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+DEFAULT_MAX_SPANS = 100_000
+PROMETHEUS_PREFIX = "goldbot_span"
+# Path of the innermost open span; a context variable so asyncio tasks nest independently.
+_current_path: ContextVar[Optional[str]] = ContextVar("goldbot_span_path", default=None)
+
+
+@dataclass(slots=True)
+class SpanRecord:
+    name: str
+    path: str
+    started: float
+    wall_s: float
+    cpu_s: float
+    rows: Optional[int] = None
+    memory_delta_bytes: Optional[int] = None
+    thread: str = ""
+    error: Optional[str] = None
+    attributes: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass(slots=True)
+class SpanStats:
+    calls: int = 0
+    errors: int = 0
+    wall_s: float = 0.0
+    cpu_s: float = 0.0
+    max_wall_s: float = 0.0
+    rows: int = 0
+    memory_delta_bytes: int = 0
+
+    def add(self, record: SpanRecord) -> None:
+        self.calls += 1
+        self.errors += record.error is not None
+        self.wall_s += record.wall_s
+        self.cpu_s += record.cpu_s
+        self.max_wall_s = max(self.max_wall_s, record.wall_s)
+        self.rows += record.rows or 0
+        self.memory_delta_bytes += record.memory_delta_bytes or 0
+
+
+class SamplingProfiler:
+    """Statistical profiler that samples one thread's Python stack from a background thread.
+
+    Every ``interval`` seconds the target thread's current frame is walked
+    and the ``module:function`` stack is counted. ``collapsed`` renders the
+    counts in the folded format read by ``flamegraph.pl`` and speedscope.
+    """
+
+    def __init__(self, interval: float = 0.005, thread_id: Optional[int] = None) -> None:
+        self.interval = interval
+        self.thread_id = thread_id
+        self.stacks: Counter[str] = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> SamplingProfiler:
+        if self.thread_id is None:
+            self.thread_id = threading.get_ident()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="goldbot-sampler", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> Counter[str]:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        return self.stacks
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{frame.f_globals.get('__name__', '?')}:{code.co_name}")
+                frame = frame.f_back
+            self.stacks[";".join(reversed(stack))] += 1
+            self.samples += 1
+
+    def top(self, n: int = 20) -> list[tuple[str, int]]:
+        """Functions with the most samples at the top of the stack (self time)."""
+
+        leaves: Counter[str] = Counter()
+        for stack, count in self.stacks.items():
+            leaves[stack.rsplit(";", 1)[-1]] += count
+        return leaves.most_common(n)
+
+    def collapsed(self) -> str:
+        return "".join(f"{stack} {count}\n" for stack, count in sorted(self.stacks.items()))
+
+
+class Span:
+    """One in-flight span; ``add_rows`` counts rows once they are known."""
+
+    __slots__ = (
+        "tracer", "name", "rows", "attributes", "_path", "_token", "_started", "_wall", "_cpu", "_mem", "_profiler"
+    )
+
+    def __init__(self, tracer: Tracer, name: str, rows: Optional[int], attributes: dict[str, Any]) -> None:
+        self.tracer = tracer
+        self.name = name
+        self.rows = rows
+        self.attributes = attributes
+
+    def add_rows(self, rows: int) -> None:
+        self.rows = (self.rows or 0) + int(rows)
+
+    def __enter__(self) -> Span:
+        tracer = self.tracer
+        parent = _current_path.get()
+        self._path = f"{parent}/{self.name}" if parent else self.name
+        self._token = _current_path.set(self._path)
+        self._profiler = None
+        if self.name in tracer.profile_spans:
+            self._profiler = tracer.profiler_factory().start()
+        self._mem = tracemalloc.get_traced_memory()[0] if tracer.memory else None
+        self._started = time.time()
+        self._cpu = time.process_time()
+        self._wall = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        wall = time.perf_counter() - self._wall
+        cpu = time.process_time() - self._cpu
+        tracer = self.tracer
+        memory = tracemalloc.get_traced_memory()[0] - self._mem if self._mem is not None else None
+        if self._profiler is not None:
+            tracer._add_profile(self.name, self._profiler.stop())
+        _current_path.reset(self._token)
+        tracer.record(
+            SpanRecord(
+                name=self.name,
+                path=self._path,
+                started=self._started,
+                wall_s=wall,
+                cpu_s=cpu,
+                rows=self.rows,
+                memory_delta_bytes=memory,
+                thread=threading.current_thread().name,
+                error=exc_type.__name__ if exc_type is not None else None,
+                attributes=self.attributes,
+            )
+        )
+
+
+class _NoopSpan:
+    __slots__ = ()
+
+    def add_rows(self, rows: int) -> None:
+        pass
+
+    def __enter__(self) -> _NoopSpan:
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        pass
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+class Tracer:
+    """Collects spans: running aggregates per name plus the last ``max_spans`` records.
+
+    ``memory=True`` records the net change in ``tracemalloc``-traced memory
+    per span (starting ``tracemalloc`` if needed, which slows allocation-heavy
+    code noticeably). Spans named in ``profile_spans`` run under a profiler
+    built by ``profiler_factory`` (any object with ``start()`` and a
+    ``stop()`` returning stack counts); the counts are kept per span name.
+    """
+
+    def __init__(
+        self,
+        memory: bool = False,
+        profile_spans: Iterable[str] = (),
+        profiler_factory: Callable[[], Any] = SamplingProfiler,
+        max_spans: int = DEFAULT_MAX_SPANS,
+    ) -> None:
+        self.memory = memory
+        self.profile_spans = frozenset(profile_spans)
+        self.profiler_factory = profiler_factory
+        self.spans: deque[SpanRecord] = deque(maxlen=max_spans)
+        self.stats: dict[str, SpanStats] = {}
+        self.profiles: dict[str, Counter[str]] = {}
+        self._lock = threading.Lock()
+        self._started_tracemalloc = False
+
+    def span(self, name: str, rows: Optional[int] = None, **attributes: Any) -> Span:
+        return Span(self, name, rows, attributes)
+
+    def record(self, record: SpanRecord) -> None:
+        with self._lock:
+            self.spans.append(record)
+            self.stats.setdefault(record.name, SpanStats()).add(record)
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        """Aggregates per span name, slowest total wall time first."""
+
+        with self._lock:
+            items = sorted(self.stats.items(), key=lambda item: item[1].wall_s, reverse=True)
+            return {name: asdict(stats) for name, stats in items}
+
+    def to_dict(self) -> dict[str, Any]:
+        with self._lock:
+            spans = [asdict(record) for record in self.spans]
+        return {"summary": self.summary(), "spans": spans}
+
+    def export_json(self, path: Path | str) -> Path:
+        return _atomic_write(Path(path), json.dumps(self.to_dict(), indent=2, default=str) + "\n")
+
+    def prometheus_text(self) -> str:
+        """Prometheus text exposition of the per-span aggregates (counters, one ``span`` label)."""
+
+        metrics = (
+            ("calls_total", "calls", "Completed spans."),
+            ("errors_total", "errors", "Spans that exited with an exception."),
+            ("seconds_total", "wall_s", "Wall-clock seconds spent in the span."),
+            ("cpu_seconds_total", "cpu_s", "Process CPU seconds spent in the span."),
+            ("rows_total", "rows", "Rows processed in the span."),
+            ("memory_delta_bytes_total", "memory_delta_bytes", "Net traced memory change across the span."),
+        )
+        summary = self.summary()
+        lines = []
+        for suffix, key, help_text in metrics:
+            metric = f"{PROMETHEUS_PREFIX}_{suffix}"
+            lines += [f"# HELP {metric} {help_text}", f"# TYPE {metric} counter"]
+            lines += [f'{metric}{{span="{_escape_label(name)}"}} {stats[key]}' for name, stats in summary.items()]
+        metric = f"{PROMETHEUS_PREFIX}_max_seconds"
+        lines += [f"# HELP {metric} Slowest single span.", f"# TYPE {metric} gauge"]
+        lines += [f'{metric}{{span="{_escape_label(name)}"}} {s["max_wall_s"]}' for name, s in summary.items()]
+        return "\n".join(lines) + "\n"
+
+    def export_prometheus(self, path: Path | str) -> Path:
+        """Write ``prometheus_text`` atomically (safe for the node-exporter textfile collector)."""
+
+        return _atomic_write(Path(path), self.prometheus_text())
+
+    def export_profiles(self, path: Path | str) -> Path:
+        """Folded stacks of every profiled span, prefixed with the span name."""
+
+        with self._lock:
+            lines = [
+                f"{name};{stack} {count}\n"
+                for name, stacks in self.profiles.items()
+                for stack, count in sorted(stacks.items())
+            ]
+        return _atomic_write(Path(path), "".join(lines))
+
+    def _add_profile(self, name: str, stacks: Counter[str]) -> None:
+        with self._lock:
+            self.profiles.setdefault(name, Counter()).update(stacks)
+
+
+_tracer: Optional[Tracer] = None
+
+
+def enable_tracing(
+    memory: bool = False, profile_spans: Iterable[str] = (), tracer: Optional[Tracer] = None
+) -> Tracer:
+    """Install (and return) the process-wide tracer; instrumented code starts recording."""
+
+    global _tracer
+    tracer = tracer or Tracer(memory=memory, profile_spans=profile_spans)
+    if tracer.memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+        tracer._started_tracemalloc = True
+    _tracer = tracer
+    return tracer
+
+
+def disable_tracing() -> Optional[Tracer]:
+    """Stop recording and return the tracer that was active, if any."""
+
+    global _tracer
+    tracer, _tracer = _tracer, None
+    if tracer is not None and tracer._started_tracemalloc:
+        tracemalloc.stop()
+        tracer._started_tracemalloc = False
+    return tracer
+
+
+def get_tracer() -> Optional[Tracer]:
+    return _tracer
+
+
+def span(name: str, rows: Optional[int] = None, **attributes: Any) -> Span | _NoopSpan:
+    """Context manager timing a block; a shared no-op when tracing is off."""
+
+    tracer = _tracer
+    if tracer is None:
+        return _NOOP_SPAN
+    return tracer.span(name, rows, **attributes)
+
+
+def traced(name: Optional[str] = None, rows_arg: Optional[str] = None) -> Callable[[F], F]:
+    """Decorator recording each call as a span (``module.qualname`` unless ``name`` is given).
+
+    Rows are the length (``shape[0]``) of the argument called ``rows_arg``
+    or, by default, of the return value when it is an array or frame.
+    """
+
+    def decorate(func: F) -> F:
+        label = name or f"{func.__module__.removeprefix('goldbot.')}.{func.__qualname__}"
+        position = None
+        if rows_arg is not None:
+            code = func.__code__
+            position = code.co_varnames[: code.co_argcount].index(rows_arg)
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            tracer = _tracer
+            if tracer is None:
+                return func(*args, **kwargs)
+            with tracer.span(label) as active:
+                result = func(*args, **kwargs)
+                if position is not None:
+                    source = args[position] if position < len(args) else kwargs.get(rows_arg)
+                else:
+                    source = result
+                shape = getattr(source, "shape", None)
+                if shape:
+                    active.add_rows(shape[0])
+                return result
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorate
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _atomic_write(path: Path, text: str) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.tmp")
+    tmp.write_text(text, encoding="utf-8")
+    os.replace(tmp, path)
+    return path
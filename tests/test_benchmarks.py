@@ -0,0 +1,95 @@
+import json
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from goldbot.benchmarks import compare_results, parse_scale, run_suite, synthetic_bars, synthetic_ticks
+from goldbot.benchmarks.suite import CASES, main
+from goldbot.config import settings
+from goldbot.data.quality import scan_prices
+from goldbot.data.sessions import SessionCalendar
+
+BASELINE = Path(__file__).resolve().parents[1] / "benchmarks" / "baseline.json"
+
+
+def test_parse_scale_labels():
+    assert parse_scale("10k") == 10_000
+    assert parse_scale("50M") == 50_000_000
+    assert parse_scale("2.5k") == 2_500
+    assert parse_scale(123) == 123
+
+
+def test_synthetic_bars_are_reproducible_in_session_with_outages():
+    bars = synthetic_bars(50_000, seed=3)
+    again = synthetic_bars(50_000, seed=3)
+    pd.testing.assert_frame_equal(bars, again)
+    assert not bars.equals(synthetic_bars(50_000, seed=4))
+
+    assert len(bars) == 50_000 and bars.index.is_monotonic_increasing and bars.index.is_unique
+    assert SessionCalendar().is_open(bars.index).all()
+    assert (bars["high"] >= bars[["open", "close"]].max(axis=1)).all()
+    assert (bars["low"] <= bars[["open", "close"]].min(axis=1)).all()
+
+    report = scan_prices(bars, freq="1min").report
+    assert report.missing_rows > 0 and report.session_gap_rows > 0
+    assert report.duplicate_rows == report.ohlc_violations == 0
+
+
+def test_synthetic_returns_show_fat_tails_and_volatility_clustering():
+    returns = np.diff(np.log(synthetic_bars(200_000, seed=1)["close"].to_numpy()))
+    standardized = (returns - returns.mean()) / returns.std()
+    assert (standardized**4).mean() > 4  # excess kurtosis
+    magnitude = np.abs(returns) - np.abs(returns).mean()
+    assert (magnitude[1:] * magnitude[:-1]).mean() / magnitude.var() > 0.1
+
+
+def test_synthetic_ticks_match_tick_layout():
+    ticks = synthetic_ticks(20_000, seed=2)
+    assert list(ticks.columns) == ["ts", "bid", "ask", "volume"]
+    assert ticks["ts"].dtype == np.int64 and np.all(np.diff(ticks["ts"]) > 0)
+    assert (ticks["ask"] > ticks["bid"]).all()
+    assert SessionCalendar().closure(ticks["ts"].to_numpy()).max() == 0
+
+
+def test_suite_runs_every_case_and_leaves_raw_dir_alone():
+    raw_dir = settings.data.raw_dir
+    document = run_suite(["2k"], repeats=1, startup=False)
+
+    assert settings.data.raw_dir == raw_dir
+    assert [row["case"] for row in document["results"]] == list(CASES)
+    assert all(row["rows"] == 2_000 and row["seconds"] > 0 for row in document["results"])
+    assert all(row["peak_mb"] > 0 for row in document["results"])
+    assert {"python", "numpy", "pandas", "created"} <= set(document["meta"])
+
+
+def test_compare_flags_only_material_regressions(tmp_path, capsys):
+    def doc(seconds, peak_mb):
+        rows = [
+            {"case": case, "scale": "10k", "rows": 10_000, "seconds": s, "median_seconds": s, "peak_mb": m}
+            for case, s, m in zip(("a", "b", "c"), seconds, peak_mb)
+        ]
+        return {"meta": {}, "results": rows}
+
+    baseline = doc([1.0, 0.001, 1.0], [100.0, 1.0, 10.0])
+    current = doc([1.5, 0.002, 1.1], [100.0, 1.5, 30.0])
+    table = compare_results(baseline, current, threshold=0.2)
+    flagged = set(map(tuple, table.loc[table["regression"], ["case", "metric"]].to_numpy()))
+    # b doubled but only by a millisecond / half a megabyte, which is below the absolute floors.
+    assert flagged == {("a", "seconds"), ("c", "peak_mb")}
+
+    (tmp_path / "base.json").write_text(json.dumps(baseline))
+    (tmp_path / "same.json").write_text(json.dumps(baseline))
+    (tmp_path / "slow.json").write_text(json.dumps(current))
+    args = ["compare", "--baseline", str(tmp_path / "base.json"), "--current"]
+    assert main([*args, str(tmp_path / "same.json")]) == 0
+    assert main([*args, str(tmp_path / "slow.json")]) == 1
+    assert "2 regression(s)" in capsys.readouterr().out
+
+
+def test_stored_baseline_covers_every_case():
+    baseline = json.loads(BASELINE.read_text())
+    scales = {row["scale"] for row in baseline["results"]}
+    assert {"startup", "10k", "1m"} <= scales
+    for scale in scales - {"startup"}:
+        assert [row["case"] for row in baseline["results"] if row["scale"] == scale] == list(CASES)
@@ -0,0 +1,72 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from goldbot.data import BulkFetcher, FetchRequest
+from goldbot.utils.rate_limit import TokenBucket
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    def do_GET(self):  # noqa: N802 - http.server API
+        query = parse_qs(urlparse(self.path).query)
+        symbol = query["symbol"][0]
+        if symbol == "BAD":
+            body = {"status": "error", "message": "symbol not found"}
+        else:
+            price = 2000.0 if symbol == "XAU/USD" else 25.0
+            body = {
+                "status": "ok",
+                "values": [
+                    {"datetime": "2024-01-01 00:00:00", "open": price, "high": price, "low": price, "close": price},
+                    {"datetime": "2024-01-01 01:00:00", "open": price, "high": price, "low": price, "close": price},
+                ],
+            }
+        payload = json.dumps(body).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+
+
+def test_bulk_fetch_against_stub_server(stub_server):
+    fetcher = BulkFetcher(api_key="demo", max_workers=4, requests_per_minute=6000, base_url=stub_server)
+    jobs = [FetchRequest(s, i) for s in ("XAU/USD", "XAG/USD") for i in ("1h", "1day")]
+    result = fetcher.fetch_many([*jobs, FetchRequest("BAD", "1h")])
+
+    assert set(result.frames) == {job.key for job in jobs}
+    assert result.frames[("XAU/USD", "1h")]["close"].iloc[0] == 2000.0
+    assert isinstance(result.errors[("BAD", "1h")], RuntimeError)
+    assert result.latency["time_series"]["count"] == 5
+    assert result.latency["fetch_time_series"]["p99_ms"] > 0
+
+
+def test_token_bucket_blocks_until_refilled():
+    now = [0.0]
+    sleeps = []
+
+    def sleep(seconds):
+        sleeps.append(seconds)
+        now[0] += seconds
+
+    bucket = TokenBucket(rate=2.0, capacity=2.0, clock=lambda: now[0], sleep=sleep)
+    assert bucket.acquire() == 0.0
+    assert bucket.acquire() == 0.0
+    assert not bucket.try_acquire()
+    assert bucket.acquire() == pytest.approx(0.5)
+    assert sleeps == [pytest.approx(0.5)]
@@ -17,7 +17,7 @@ def test_save_price_data(tmp_path):
 
 def test_compute_quality_report():
     idx = pd.date_range("2024-01-01", periods=5, freq="H", tz="UTC")
-    df = pd.DataFrame({"close": range(5)}, index=idx.delete(2))
+    df = pd.DataFrame({"close": range(4)}, index=idx.delete(2))
     report = compute_quality_report(df, freq="1H")
     assert report.n_rows == 4
     assert report.missing_rows == 1
@@ -0,0 +1,45 @@
+import pandas as pd
+
+from goldbot.config import settings
+from goldbot.data.cli import sync_prices
+from goldbot.data.loaders import save_price_data
+from goldbot.data.quality import last_cached_timestamp, load_cached_prices
+from goldbot.data.twelvedata_client import TwelveDataClient
+
+
+def _bar(ts: str, close: float) -> dict:
+    return {"datetime": ts, "open": close, "high": close, "low": close, "close": close, "volume": 1}
+
+
+def test_sync_requests_only_missing_range(tmp_path, requests_mock, monkeypatch):
+    monkeypatch.setattr(settings.data, "raw_dir", tmp_path)
+    idx = pd.date_range("2024-01-01", periods=2, freq="h", tz="UTC", name="datetime")
+    cached = pd.DataFrame({c: [2000.0, 2001.0] for c in ["open", "high", "low", "close"]}, index=idx)
+    cached["volume"] = 1.0
+    save_price_data(cached, symbol="XAU/USD", timeframe="1h")
+    assert last_cached_timestamp(symbol="XAU/USD", timeframe="1h") == idx[-1]
+
+    mock = requests_mock.get(
+        "https://api.twelvedata.com/time_series",
+        json={"status": "ok", "values": [_bar("2024-01-01 01:00:00", 2001.5), _bar("2024-01-01 02:00:00", 2002.0)]},
+    )
+    path, n_new = sync_prices(TwelveDataClient(api_key="demo"), symbol="XAU/USD", interval="1h")
+
+    assert mock.last_request.qs["start_date"] == ["2024-01-01 01:00:00"]
+    assert n_new == 1
+    merged = load_cached_prices(symbol="XAU/USD", timeframe="1h")
+    assert path.exists()
+    assert len(merged) == 3
+    assert merged["close"].tolist() == [2000.0, 2001.5, 2002.0]
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_sync_noop_when_provider_has_no_new_data(tmp_path, requests_mock, monkeypatch):
+    monkeypatch.setattr(settings.data, "raw_dir", tmp_path)
+    idx = pd.date_range("2024-01-01", periods=1, freq="h", tz="UTC", name="datetime")
+    save_price_data(pd.DataFrame({"close": [1.0]}, index=idx), symbol="XAUUSD", timeframe="1h")
+    requests_mock.get(
+        "https://api.twelvedata.com/time_series",
+        json={"status": "error", "message": "No data is available on the specified dates."},
+    )
+    assert sync_prices(TwelveDataClient(api_key="demo"), symbol="XAUUSD", interval="1h") == (None, 0)
@@ -0,0 +1,79 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from goldbot.backtest import EventDrivenBacktester, VectorizedBacktester, event_engine
+from goldbot.config import settings
+
+
+def _bars(close) -> pd.DataFrame:
+    close = np.asarray(close, dtype=float)
+    idx = pd.date_range("2024-01-01", periods=close.size, freq="h", tz="UTC")
+    return pd.DataFrame(
+        {"open": close, "high": close + 0.5, "low": close - 0.5, "close": close},
+        index=idx,
+    )
+
+
+def _random_walk(n=500):
+    rng = np.random.default_rng(5)
+    return _bars(1900 + np.cumsum(rng.normal(0, 2, n)))
+
+
+@pytest.mark.parametrize("use_numba", [True, False])
+def test_matches_vectorized_engine_on_long_flat_strategy(monkeypatch, use_numba):
+    monkeypatch.setattr(settings.backtest, "commission_perc", 0.0)
+    signals = _random_walk()
+    signals["position"] = (np.arange(len(signals)) // 40 % 2).astype(float)  # alternate flat/long
+    signals.iloc[-5:, signals.columns.get_loc("position")] = 1.0
+
+    vectorized = VectorizedBacktester().run(signals)
+    event = EventDrivenBacktester(slippage_bps=0.0, use_numba=use_numba).run(signals)
+
+    np.testing.assert_allclose(event.equity_curve, vectorized.equity_curve, rtol=1e-10)
+    assert (event.trades["exit_reason"].iloc[:-1] == "signal").all()
+    assert event.trades["exit_reason"].iloc[-1] == "open"
+
+
+def test_costs_reduce_equity_and_ledger_pnl_adds_up():
+    signals = _random_walk()
+    signals["position"] = np.sign(np.sin(np.arange(len(signals)) / 15))
+    result = EventDrivenBacktester(spread=0.3, slippage_bps=1.0, commission_perc=0.0001).run(signals)
+    frictionless = EventDrivenBacktester(spread=0.0, slippage_bps=0.0, commission_perc=0.0).run(signals)
+
+    assert result.equity_curve.iloc[-1] < frictionless.equity_curve.iloc[-1]
+    assert set(result.trades["side"]) == {-1, 1}
+    final = result.equity_curve.iloc[-1] - settings.backtest.initial_capital
+    assert result.trades["pnl"].sum() == pytest.approx(final, rel=1e-9)
+
+
+def test_stop_loss_exit_and_limit_entry():
+    signals = _bars([100, 100, 100, 99, 98, 97, 90, 85, 85, 85])
+    signals["position"] = 0.0
+    signals.iloc[1:, signals.columns.get_loc("position")] = 1.0
+    signals["order_type"] = "limit"
+    signals["order_price"] = 98.0
+
+    result = EventDrivenBacktester(slippage_bps=0.0, commission_perc=0.0, stop_loss_pct=0.05).run(signals)
+    trade = result.trades.iloc[0]
+    assert trade["entry_price"] == 98.0  # limit rests until the bar whose low touches 98
+    assert trade["entry_time"] == signals.index[4]
+    assert trade["exit_reason"] == "stop_loss"
+    assert trade["exit_price"] == pytest.approx(90.0)  # gapped through 93.1, filled at the open
+    assert len(result.trades) == 1
+
+
+def test_interpreted_kernel_matches_compiled(monkeypatch):
+    signals = _random_walk()
+    signals["position"] = np.sign(np.sin(np.arange(len(signals)) / 15))
+    params = {"spread": 0.3, "slippage_bps": 1.0, "stop_loss_pct": 0.004, "take_profit_pct": 0.006}
+    compiled = EventDrivenBacktester(**params).run(signals)
+
+    # Without numba the kernel and its fill-price helper both run as plain Python.
+    monkeypatch.setattr(event_engine, "_simulate_compiled", None)
+    assert not hasattr(event_engine._simulate.__globals__["_fill_price"], "py_func")
+    interpreted = EventDrivenBacktester(**params).run(signals)
+
+    pd.testing.assert_series_equal(interpreted.equity_curve, compiled.equity_curve, rtol=1e-12)
+    pd.testing.assert_frame_equal(interpreted.trades, compiled.trades, rtol=1e-12)
+    assert set(interpreted.trades["exit_reason"]) >= {"stop_loss", "take_profit"}
@@ -0,0 +1,67 @@
+import numpy as np
+import pandas as pd
+
+from goldbot.features import FeatureCache, engineer_feature_set
+from goldbot.features.cache import fingerprint_builder, warmup_bars
+
+
+def _ohlc(n: int) -> pd.DataFrame:
+    rng = np.random.default_rng(21)
+    close = 1900 + np.cumsum(rng.normal(0, 2, n))
+    wick = np.abs(rng.normal(0, 1, n))
+    idx = pd.date_range("2024-01-01", periods=n, freq="h", tz="UTC")
+    return pd.DataFrame(
+        {"open": close, "high": close + wick, "low": close - wick, "close": close, "volume": 1.0},
+        index=idx,
+    )
+
+
+def test_cache_hits_and_misses(tmp_path):
+    cache = FeatureCache(root=tmp_path)
+    prices = _ohlc(300)
+    first = cache.get_or_compute(prices)
+    second = cache.get_or_compute(prices)
+
+    pd.testing.assert_frame_equal(first, second, check_freq=False)
+    assert cache.stats_dict() == {"hits": 1, "partial_hits": 0, "misses": 1, "evictions": 0, "rebuilds": 0}
+
+    cache.get_or_compute(prices.iloc[:-1])  # truncation is not a tail extension
+    assert cache.stats.misses == 2
+
+
+def test_cache_recomputes_only_the_tail(tmp_path):
+    full = _ohlc(1500)
+    cache = FeatureCache(root=tmp_path, warmup=600)
+    cache.get_or_compute(full.iloc[:1400])
+    extended = cache.get_or_compute(full)
+
+    assert cache.stats.partial_hits == 1 and cache.stats.rebuilds == 0
+    expected = engineer_feature_set(full)
+    pd.testing.assert_index_equal(extended.index, expected.index)
+    np.testing.assert_allclose(extended.to_numpy(), expected.to_numpy(), rtol=1e-9, atol=1e-8)
+    assert len(list(tmp_path.glob("*.parquet"))) == 1  # superseded prefix entry dropped
+
+
+def test_short_warmup_falls_back_to_full_rebuild(tmp_path):
+    full = _ohlc(1500)
+    cache = FeatureCache(root=tmp_path, warmup=80)  # far too short for the 55-bar EMA to converge
+    cache.get_or_compute(full.iloc[:1400])
+    extended = cache.get_or_compute(full)
+
+    assert cache.stats.partial_hits == 1 and cache.stats.rebuilds == 1
+    pd.testing.assert_frame_equal(extended, engineer_feature_set(full), check_freq=False)
+
+
+def test_warmup_and_fingerprint_follow_builder_params():
+    assert warmup_bars({}) == 600
+    assert warmup_bars({"backend": "polars", "slow": 200, "bb_dev": 2.5}) == 2_000
+    pandas_key = fingerprint_builder(engineer_feature_set, {"backend": "pandas"})
+    assert fingerprint_builder(engineer_feature_set, {"backend": "polars"}) != pandas_key
+
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    cache = FeatureCache(root=tmp_path, max_bytes=1)
+    cache.get_or_compute(_ohlc(200))
+    cache.get_or_compute(_ohlc(200) * 1.01)
+    assert cache.stats.evictions == 1
+    assert len(list(tmp_path.glob("*.parquet"))) == 1
@@ -1,5 +1,50 @@
+import json
+import subprocess
+import sys
+
+from goldbot.benchmarks.suite import STARTUP_BUDGETS, run_startup, startup_over_budget
+
+HEAVY_MODULES = ("pandas", "numpy", "numba", "plotly", "pydantic", "requests", "tenacity", "pyarrow", "loguru")
+
+
 def test_imports():
     import goldbot
 
     assert goldbot.__version__
 
+
+def _loaded_after(code: str, cwd) -> set[str]:
+    script = f"import sys, json\n{code}\nprint(json.dumps(sorted(sys.modules)))"
+    out = subprocess.run([sys.executable, "-c", script], cwd=cwd, check=True, capture_output=True, text=True)
+    return {name.split(".")[0] for name in json.loads(out.stdout)}
+
+
+def test_import_goldbot_is_lazy_and_writes_nothing(tmp_path):
+    loaded = _loaded_after("import goldbot, goldbot.data, goldbot.backtest, goldbot.execution", tmp_path)
+    assert not loaded & set(HEAVY_MODULES)
+    assert not list(tmp_path.iterdir())
+
+
+def test_settings_and_data_exports_load_on_first_access(tmp_path):
+    loaded = _loaded_after(
+        "import goldbot\n"
+        "assert str(goldbot.settings.data.raw_dir) == 'data/raw'\n"
+        "from goldbot.data import load_cached_prices",
+        tmp_path,
+    )
+    assert {"pydantic", "pandas"} <= loaded
+    assert not loaded & {"requests", "tenacity", "numba", "plotly"}
+    assert not list(tmp_path.iterdir())  # settings no longer creates data/raw, data/processed, data/cache
+
+
+def test_baseline_help_skips_the_research_stack(tmp_path):
+    loaded = _loaded_after(
+        "import goldbot.pipeline.baseline as baseline\nbaseline.available_strategies()", tmp_path
+    )
+    assert not loaded & set(HEAVY_MODULES)
+
+
+def test_startup_within_budget():
+    results = run_startup(repeats=3)
+    assert {result.case for result in results} == set(STARTUP_BUDGETS)
+    assert not startup_over_budget(results), results
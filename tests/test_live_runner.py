@@ -0,0 +1,77 @@
+import asyncio
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from goldbot.execution import BarRingBuffer, LiveRunner, frame_feed
+from goldbot.strategies import DualMovingAverageStrategy
+
+
+def _bars(n: int) -> pd.DataFrame:
+    rng = np.random.default_rng(15)
+    close = 1900 + np.cumsum(rng.normal(0, 2, n))
+    idx = pd.date_range("2024-01-01", periods=n, freq="h", tz="UTC", name="datetime")
+    return pd.DataFrame(
+        {"open": close, "high": close + 1, "low": close - 1, "close": close, "volume": 1.0}, index=idx
+    )
+
+
+class RecordingBroker:
+    def __init__(self):
+        self.orders = []
+
+    async def submit(self, order):
+        self.orders.append(order)
+        return f"order-{len(self.orders)}"
+
+    def cancel(self, order_id):
+        pass
+
+
+def test_ring_buffer_wraps_in_order():
+    buffer = BarRingBuffer(capacity=4)
+    for i in range(6):
+        buffer.append(i, {"close": float(i)})
+    assert len(buffer) == 4
+    assert buffer.latest("close").tolist() == [2.0, 3.0, 4.0, 5.0]
+    assert buffer.latest("close", 2).tolist() == [4.0, 5.0]
+    assert list(buffer.to_frame().index.asi8) == [2, 3, 4, 5]
+
+
+def test_live_positions_match_vectorized_signals():
+    prices = _bars(400)
+    strategy = DualMovingAverageStrategy(fast=5, slow=20)
+    broker = RecordingBroker()
+    runner = LiveRunner(strategy, broker=broker, symbol="XAUUSD", buffer_size=64)
+
+    result = asyncio.run(runner.run(frame_feed(prices)))
+
+    signals = strategy.generate_signals(prices)["signal"]
+    expected_orders = int((signals.diff().fillna(signals) != 0).sum())
+    assert result.bars == len(prices)
+    assert len(broker.orders) == expected_orders == len(result.orders)
+    assert result.position == signals.iloc[-1]
+    assert {"features", "strategy", "order", "bar_to_order", "queue_wait"} <= set(result.latency)
+    assert result.latency["bar_to_order"]["count"] == expected_orders
+    assert len(runner.buffer) == 64
+
+
+
+def test_stale_bars_are_skipped_and_features_rebuild_from_buffer():
+    prices = _bars(120)
+    broker = RecordingBroker()
+    runner = LiveRunner(DualMovingAverageStrategy(fast=5, slow=20), broker=broker, buffer_size=64)
+    asyncio.run(runner.run(frame_feed(prices)))
+    orders = len(broker.orders)
+
+    # A reconnecting feed replays recent bars; they must not advance state twice.
+    asyncio.run(runner.run(frame_feed(prices.tail(10))))
+    assert runner.bars_processed == 120
+    assert len(broker.orders) == orders
+
+    original = runner.features
+    rebuilt = runner.rebuild_features()
+    assert rebuilt is runner.features and rebuilt.bars_seen == 64
+    bar = {"high": 2001.0, "low": 1999.0, "close": 2000.0}
+    assert rebuilt.update(bar)["sma_20"] == pytest.approx(original.update(bar)["sma_20"])
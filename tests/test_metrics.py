@@ -0,0 +1,79 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from goldbot.backtest import VectorizedBacktester
+from goldbot.backtest.metrics import (
+    METRIC_NAMES,
+    compute_metrics,
+    curve_metrics,
+    infer_periods_per_year,
+    rolling_sharpe,
+)
+
+
+def _index(freq: str, n: int = 500) -> pd.DatetimeIndex:
+    return pd.date_range("2024-01-01", periods=n, freq=freq, tz="UTC")
+
+
+def test_infer_periods_per_year_follows_sessions():
+    # XAUUSD trades 115 hours a week: Sun 22:00 - Fri 21:00 minus a daily 21:00-22:00 break.
+    assert infer_periods_per_year(_index("h")) == pytest.approx(115 * 365.25 / 7)
+    assert infer_periods_per_year(_index("15min")) == pytest.approx(4 * 115 * 365.25 / 7)
+    assert infer_periods_per_year(_index("D")) == 252
+    assert infer_periods_per_year(_index("W")) == pytest.approx(365.25 / 7)
+    assert infer_periods_per_year(pd.RangeIndex(10)) == 252
+
+
+@pytest.mark.parametrize("use_numba", [True, False])
+def test_single_curve_metrics_match_definitions(use_numba):
+    r = np.array([0.0, 0.02, -0.01, -0.03, 0.01, 0.0, 0.04, -0.02])
+    positions = np.array([0, 1, 1, 1, 1, 0, 1, 1])
+    m = curve_metrics(r, 252, positions=positions, risk_free_rate=0.0, rolling_window=4, use_numba=use_numba)
+
+    equity = np.cumprod(1 + r)
+    drawdown = equity / np.maximum.accumulate(equity) - 1
+    assert m["total_return"] == pytest.approx(equity[-1] - 1)
+    assert m["sharpe"] == pytest.approx(r.mean() * 252 / (r.std(ddof=1) * np.sqrt(252)))
+    assert m["sortino"] == pytest.approx(r.mean() * 252 / (np.sqrt(np.mean(np.minimum(r, 0) ** 2)) * np.sqrt(252)))
+    assert m["max_drawdown"] == pytest.approx(drawdown.min())
+    assert m["ulcer_index"] == pytest.approx(np.sqrt(np.mean(drawdown**2)))
+    assert m["calmar"] == pytest.approx(m["cagr"] / abs(drawdown.min()))
+    assert m["max_drawdown_duration"] == 4  # bars 2..5 below the bar-1 peak
+    assert m["exposure"] == pytest.approx(6 / 8)
+    assert m["hit_rate"] == pytest.approx(3 / 6)
+
+    expected_rolling = pd.Series(r).rolling(4).apply(lambda w: w.mean() * 252 / (w.std() * np.sqrt(252)))
+    np.testing.assert_allclose(rolling_sharpe(r, 4, 252, 0.0), expected_rolling, equal_nan=True)
+    assert m["rolling_sharpe_min"] == pytest.approx(expected_rolling.min())
+    assert m["rolling_sharpe_median"] == pytest.approx(expected_rolling.median())
+
+
+@pytest.mark.parametrize("use_numba", [True, False])
+def test_matrix_scoring_matches_column_by_column(use_numba):
+    rng = np.random.default_rng(21)
+    matrix = rng.normal(0, 0.01, (300, 6))
+    matrix[:, 5] = 0.0  # flat curve
+    positions = (rng.random(matrix.shape) > 0.3).astype(np.int8)
+    scored = compute_metrics(matrix, 6000, positions=positions, rolling_window=50, use_numba=use_numba)
+    assert set(scored) == set(METRIC_NAMES)
+    for col in range(6):
+        single = curve_metrics(
+            matrix[:, col], 6000, positions=positions[:, col], rolling_window=50, use_numba=not use_numba
+        )
+        for name in METRIC_NAMES:
+            assert scored[name][col] == pytest.approx(single[name], nan_ok=True)
+    assert scored["max_drawdown"][5] == 0 and np.isnan(scored["calmar"][5])
+
+
+def test_backtester_annualizes_by_bar_frequency():
+    rng = np.random.default_rng(22)
+    close = 1900 + np.cumsum(rng.normal(0, 2, 2_000))
+    position = np.ones(close.size)
+    hourly = pd.DataFrame({"close": close, "position": position}, index=_index("h", close.size))
+    daily = hourly.set_axis(_index("D", close.size))
+
+    hourly_stats = VectorizedBacktester().run(hourly).stats
+    daily_stats = VectorizedBacktester().run(daily).stats
+    assert hourly_stats["volatility"] / daily_stats["volatility"] == pytest.approx(np.sqrt(6000.5 / 252), rel=1e-3)
+    assert hourly_stats["exposure"] == pytest.approx(1 - 1 / close.size)
@@ -0,0 +1,182 @@
+import threading
+from collections import namedtuple
+
+import pytest
+
+from goldbot.execution import MT5Adapter, MT5Session, OrderDispatcher
+from goldbot.execution.smoke import run_mt5_smoke_test
+
+Tick = namedtuple("Tick", "bid ask")
+Result = namedtuple("Result", "retcode comment volume type")
+Terminal = namedtuple("Terminal", "connected")
+Account = namedtuple("Account", "balance equity margin_free server login")
+Deal = namedtuple("Deal", "order volume price comment magic")
+
+
+class FakeMT5:
+    """Minimal stand-in for the Windows-only ``MetaTrader5`` module."""
+
+    ORDER_TYPE_BUY = 0
+    ORDER_TYPE_SELL = 1
+    TRADE_ACTION_DEAL = 1
+    ORDER_TIME_GTC = 0
+    ORDER_FILLING_IOC = 1
+    TRADE_RETCODE_DONE = 10009
+
+    def __init__(self, fail_initialize: int = 0):
+        self.fail_initialize = fail_initialize
+        self.calls = {"initialize": 0, "shutdown": 0, "symbol_info_tick": 0, "order_send": 0}
+        self.connected = False
+        self.sent = []
+        self.deals = []
+        self.drop_replies = 0  # replies lost after the order executed
+        self.lost_requests = 0  # requests lost before reaching the server
+        self.history_available = True
+        self.lock = threading.Lock()
+
+    def initialize(self, **kwargs):
+        self.calls["initialize"] += 1
+        if self.fail_initialize:
+            self.fail_initialize -= 1
+            return False
+        self.connected = True
+        return True
+
+    def shutdown(self):
+        self.calls["shutdown"] += 1
+        self.connected = False
+
+    def last_error(self):
+        return (-10004, "No connection")
+
+    def terminal_info(self):
+        return Terminal(self.connected) if self.connected else None
+
+    def account_info(self):
+        return Account(10_000.0, 10_000.0, 9_000.0, "FBS-Demo", 1)
+
+    def symbol_info_tick(self, symbol):
+        self.calls["symbol_info_tick"] += 1
+        return Tick(2000.0, 2000.3)
+
+    def symbol_info(self, symbol):
+        return {"name": symbol, "volume_min": 0.01}
+
+    def order_send(self, request):
+        with self.lock:
+            self.calls["order_send"] += 1
+            self.sent.append(request)
+            if self.lost_requests:
+                self.lost_requests -= 1
+                self.connected = False
+                return None
+            self.deals.append(
+                Deal(len(self.sent), request["volume"], request["price"], request["comment"], request["magic"])
+            )
+            if self.drop_replies:
+                self.drop_replies -= 1
+                self.connected = False
+                return None
+        return Result(self.TRADE_RETCODE_DONE, "done", request["volume"], request["type"])
+
+    def history_deals_get(self, date_from, date_to):
+        return list(self.deals) if self.history_available else None
+
+
+@pytest.fixture
+def fake(monkeypatch):
+    module = FakeMT5()
+    monkeypatch.setattr("goldbot.execution.mt5_adapter.mt5", module)
+    monkeypatch.setattr("goldbot.execution.smoke.mt5", module)
+    return module
+
+
+def _adapter():
+    return MT5Adapter(server="FBS-Demo", login=1, password="pwd")
+
+
+def test_adapter_fetches_tick_once_per_order(fake):
+    _adapter().place_market_order("buy", 0.1)
+    assert fake.calls["symbol_info_tick"] == 1
+    assert fake.sent[0]["price"] == 2000.3
+
+
+def test_connect_retries_with_backoff(fake):
+    fake.fail_initialize = 2
+    sleeps = []
+    session = MT5Session(_adapter(), backoff=0.5, sleep=sleeps.append)
+    session.connect()
+    assert sleeps == [0.5, 1.0]
+    assert session.health.connected and fake.calls["initialize"] == 3
+
+
+def test_heartbeat_reconnects_and_tick_cache_expires(fake):
+    now = [0.0]
+    session = MT5Session(_adapter(), tick_ttl=1.0, clock=lambda: now[0])
+    session.connect()
+    session.tick()
+    session.tick()
+    assert fake.calls["symbol_info_tick"] == 1
+    now[0] = 2.0
+    session.tick()
+    assert fake.calls["symbol_info_tick"] == 2
+
+    fake.connected = False  # terminal dropped
+    assert session.heartbeat() is False
+    assert session.health.reconnects == 1 and fake.connected
+
+
+def test_lost_reply_after_fill_is_not_resent(fake):
+    session = MT5Session(_adapter())
+    session.connect()
+    fake.drop_replies = 1
+    result = session.place_market_order("buy", 0.1, comment="entry")
+
+    assert fake.calls["order_send"] == 1
+    assert result["recovered"] and result["volume"] == 0.1
+    assert result["comment"].startswith("entry-")
+    assert session.health.reconnects == 1
+
+
+def test_lost_request_is_resent_once(fake):
+    session = MT5Session(_adapter())
+    session.connect()
+    fake.lost_requests = 1
+    result = session.place_market_order("sell", 0.2)
+
+    assert fake.calls["order_send"] == 2
+    assert fake.sent[0]["comment"] == fake.sent[1]["comment"]
+    assert result["retcode"] == fake.TRADE_RETCODE_DONE and len(fake.deals) == 1
+
+
+def test_unknown_order_outcome_raises_without_resending(fake):
+    session = MT5Session(_adapter())
+    session.connect()
+    fake.drop_replies = 1
+    fake.history_available = False
+    with pytest.raises(RuntimeError, match="outcome unknown"):
+        session.place_market_order("buy", 0.1)
+    assert fake.calls["order_send"] == 1
+
+
+def test_dispatcher_coalesces_bursts(fake):
+    session = MT5Session(_adapter())
+    session.connect()
+    dispatcher = OrderDispatcher(session, coalesce_window=0.2)
+    futures = [dispatcher.submit("buy", 0.1) for _ in range(5)] + [dispatcher.submit("sell", 0.2)]
+    results = [f.result(timeout=5) for f in futures]
+    dispatcher.close()
+
+    assert fake.calls["order_send"] == 1
+    assert fake.sent[0]["volume"] == pytest.approx(0.3)
+    assert all(r["coalesced"] == 6 for r in results)
+    assert session.latency.summary("order_round_trip")["count"] == 6
+    assert sum(session.latency_histogram().values()) == 1
+
+
+def test_smoke_test_reuses_session(fake):
+    session = MT5Session(_adapter())
+    session.connect()
+    result = run_mt5_smoke_test(place_order=True, session=session)
+    assert result.balance == 10_000.0
+    assert fake.calls["initialize"] == 1 and fake.calls["shutdown"] == 0
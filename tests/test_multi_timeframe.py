@@ -0,0 +1,63 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from goldbot.data.loaders import resample_bars
+from goldbot.features.multi_timeframe import MultiTimeframeEngine, timeframe_rule
+
+
+def _bars(n: int) -> pd.DataFrame:
+    rng = np.random.default_rng(12)
+    close = 1900 + np.cumsum(rng.normal(0, 1, n))
+    wick = np.abs(rng.normal(0, 0.5, n))
+    idx = pd.date_range("2024-01-01", periods=n, freq="15min", tz="UTC")
+    return pd.DataFrame(
+        {"open": close, "high": close + wick, "low": close - wick, "close": close, "volume": 1.0},
+        index=idx,
+    )
+
+
+def _returns(df: pd.DataFrame) -> pd.DataFrame:
+    return df.assign(ret=df["close"].pct_change())
+
+
+def test_timeframe_rule():
+    assert timeframe_rule("15M") == "15min"
+    assert timeframe_rule("4H") == "4h"
+    assert timeframe_rule("1D") == "1D"
+    with pytest.raises(ValueError):
+        timeframe_rule("1W")
+
+
+def test_only_closed_higher_bars_are_visible():
+    bars = _bars(24 * 4 * 5)
+    engine = MultiTimeframeEngine("15M", ("1H", "4H"), builder=_returns)
+    aligned = engine.fit(bars)
+
+    four_hour = resample_bars(bars, "4h")
+    for ts in aligned.index[::7]:
+        closed = four_hour[four_hour.index + pd.Timedelta("4h") <= ts + pd.Timedelta("15min")]
+        expected = closed["close"].iloc[-1] if len(closed) else np.nan
+        assert aligned.at[ts, "4h_close"] == pytest.approx(expected, nan_ok=True)
+
+    # The last 15M bar of an hour closes that hour; the first one of the next hour cannot see it.
+    assert aligned.at[pd.Timestamp("2024-01-01 00:45", tz="UTC"), "1h_close"] == bars["close"].iloc[3]
+    assert np.isnan(aligned.at[pd.Timestamp("2024-01-01 00:30", tz="UTC"), "1h_close"])
+
+
+def test_incremental_update_matches_full_rebuild():
+    bars = _bars(24 * 4 * 60)
+    full = MultiTimeframeEngine("15M", ("1H", "4H", "1D")).fit(bars)
+
+    engine = MultiTimeframeEngine("15M", ("1H", "4H", "1D"))
+    engine.fit(bars.iloc[:4000])
+    for start in range(4000, len(bars), 333):
+        engine.update(bars.iloc[start : start + 333])
+
+    pd.testing.assert_index_equal(engine.aligned.index, full.index)
+    np.testing.assert_allclose(engine.aligned.to_numpy(), full.to_numpy(), rtol=1e-9, atol=1e-8)
+
+
+def test_timeframes_must_nest():
+    with pytest.raises(ValueError):
+        MultiTimeframeEngine("15M", ("1H", "90M"))
@@ -0,0 +1,160 @@
+import asyncio
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from goldbot.execution import LiveRunner, Order, PaperBroker, frame_feed
+from goldbot.strategies import DualMovingAverageStrategy
+
+
+def _bar(ts: int, open_: float, high: float, low: float, close: float) -> dict:
+    return {"datetime": ts, "open": open_, "high": high, "low": low, "close": close}
+
+
+def _broker(**kwargs) -> PaperBroker:
+    params = {"initial_balance": 100_000.0, "slippage_bps": 0.0, "commission_perc": 0.0}
+    return PaperBroker(**{**params, **kwargs})
+
+
+def test_order_ids_are_unique():
+    broker = _broker()
+    broker.on_bar(_bar(0, 2000, 2000, 2000, 2000), "XAUUSD")
+    ids = {broker.submit(Order("XAUUSD", "buy", 0.01)) for _ in range(100)}
+    assert len(ids) == 100
+    assert len(ids & {PaperBroker().submit(Order("XAUUSD", "buy", 0.01))}) == 0
+
+
+def test_market_order_fills_at_ask_with_slippage():
+    broker = _broker(slippage_bps=10.0, commission_perc=0.001, spread=0.4)
+    broker.on_bar(_bar(0, 2000, 2001, 1999, 2000), "XAUUSD")
+    order_id = broker.submit(Order("XAUUSD", "buy", 1.0))
+
+    fill = broker.fills[-1]
+    assert fill.order_id == order_id
+    assert fill.price == pytest.approx(2000.2 * 1.001)
+    assert fill.fee == pytest.approx(0.001 * 100 * fill.price)
+    assert broker.orders[order_id].status == "filled"
+    assert broker.positions["XAUUSD"].quantity == 1.0
+
+
+def test_limit_and_stop_orders_trigger_on_bar_range():
+    broker = _broker()
+    broker.on_bar(_bar(0, 2000, 2000, 2000, 2000), "XAUUSD")
+    buy_limit = broker.submit(Order("XAUUSD", "buy", 1.0, price=1995.0, order_type="limit"))
+    sell_stop = broker.submit(Order("XAUUSD", "sell", 1.0, price=1990.0, order_type="stop"))
+    sell_limit = broker.submit(Order("XAUUSD", "sell", 1.0, price=2010.0, order_type="limit"))
+    assert len(broker.open_orders()) == 3
+
+    fills = broker.on_bar(_bar(1, 1998, 1999, 1994, 1996), "XAUUSD")
+    assert [f.order_id for f in fills] == [buy_limit]
+    assert fills[0].price == 1995.0
+
+    # Gap through the stop: fills at the open, not the stop price.
+    fills = broker.on_bar(_bar(2, 1985, 1986, 1980, 1982), "XAUUSD")
+    assert [(f.order_id, f.price) for f in fills] == [(sell_stop, 1985.0)]
+    assert broker.positions["XAUUSD"].quantity == 0.0
+    assert [s.order_id for s in broker.open_orders()] == [sell_limit]
+
+
+def test_partial_fills_are_capped_per_update():
+    broker = _broker(max_fill_per_update=0.5)
+    broker.on_bar(_bar(0, 2000, 2000, 2000, 2000), "XAUUSD")
+    order_id = broker.submit(Order("XAUUSD", "buy", 1.2))
+    state = broker.orders[order_id]
+    assert state.status == "partially_filled" and state.filled == 0.5
+
+    broker.on_bar(_bar(1, 2002, 2002, 2002, 2002), "XAUUSD")
+    broker.on_bar(_bar(2, 2004, 2004, 2004, 2004), "XAUUSD")
+    assert state.status == "filled"
+    assert [f.quantity for f in broker.fills] == pytest.approx([0.5, 0.5, 0.2])
+    assert state.avg_price == pytest.approx((0.5 * 2000 + 0.5 * 2002 + 0.2 * 2004) / 1.2)
+
+
+def test_latency_delays_fill_to_a_later_quote():
+    broker = _broker(latency=2.0)
+    second = 1_000_000_000
+    broker.on_bar(_bar(0, 2000, 2000, 2000, 2000), "XAUUSD")
+    order_id = broker.submit(Order("XAUUSD", "buy", 1.0))
+    assert broker.on_bar(_bar(1 * second, 2001, 2001, 2001, 2001), "XAUUSD") == []
+    fills = broker.on_bar(_bar(2 * second, 2003, 2004, 2002, 2003), "XAUUSD")
+    assert [(f.order_id, f.price) for f in fills] == [(order_id, 2003.0)]
+
+
+def test_margin_rejection():
+    broker = _broker(initial_balance=1_000.0, leverage=100.0)
+    broker.on_bar(_bar(0, 2000, 2000, 2000, 2000), "XAUUSD")
+    # 1 lot = 100 oz * 2000 / 100 leverage = 2000 margin > 1000 equity.
+    order_id = broker.submit(Order("XAUUSD", "buy", 1.0))
+    assert broker.orders[order_id].status == "rejected"
+    assert broker.fills == []
+    assert broker.orders[broker.submit(Order("XAUUSD", "buy", 0.4))].status == "filled"
+
+
+def test_margin_checked_when_order_sent_before_first_quote_activates():
+    broker = _broker(initial_balance=1_000.0, leverage=100.0)
+    rejected = broker.submit(Order("XAUUSD", "buy", 1.0))
+    accepted = broker.submit(Order("XAUUSD", "buy", 0.4))
+    assert broker.orders[rejected].status == "pending"
+
+    fills = broker.on_bar(_bar(0, 2000, 2000, 2000, 2000), "XAUUSD")
+    assert broker.orders[rejected].status == "rejected"
+    assert [f.order_id for f in fills] == [accepted]
+
+
+def test_netting_realizes_pnl_and_reverses():
+    broker = _broker()
+    broker.on_tick({"ts": 0, "bid": 2000.0, "ask": 2000.0}, "XAUUSD")
+    broker.submit(Order("XAUUSD", "buy", 1.0))
+    broker.on_tick({"ts": 1, "bid": 2010.0, "ask": 2010.0}, "XAUUSD")
+    assert broker.equity() == pytest.approx(101_000.0)
+
+    broker.submit(Order("XAUUSD", "sell", 3.0))
+    pos = broker.positions["XAUUSD"]
+    assert pos.realized_pnl == pytest.approx(1_000.0)
+    assert pos.quantity == -2.0 and pos.avg_price == 2010.0
+    assert broker.balance == pytest.approx(101_000.0)
+    account = broker.account()
+    assert account["margin"] == pytest.approx(2 * 100 * 2010 / 100)
+    assert account["free_margin"] == pytest.approx(account["equity"] - account["margin"])
+
+
+def test_cancel_removes_resting_order():
+    broker = _broker()
+    broker.on_bar(_bar(0, 2000, 2000, 2000, 2000), "XAUUSD")
+    order_id = broker.submit(Order("XAUUSD", "buy", 1.0, price=1990.0, order_type="limit"))
+    broker.cancel(order_id)
+    assert broker.on_bar(_bar(1, 1990, 1990, 1980, 1985), "XAUUSD") == []
+    assert broker.orders[order_id].status == "cancelled"
+    assert broker.fills_frame().empty
+
+
+def test_throughput_thousands_of_orders_per_second():
+    broker = _broker(initial_balance=1e12)
+    broker.on_bar(_bar(0, 2000, 2000, 2000, 2000), "XAUUSD")
+    n = 5_000
+    start = time.perf_counter()
+    for i in range(n):
+        side = "buy" if i % 2 else "sell"
+        broker.submit(Order("XAUUSD", side, 0.01, price=2000.0 + (i % 50 - 25), order_type="limit"))
+        if i % 100 == 0:
+            broker.on_bar(_bar(i + 1, 2000, 2030, 1970, 2000), "XAUUSD")
+    elapsed = time.perf_counter() - start
+    assert n / elapsed > 5_000
+    assert len(broker.fills_frame()) > 0
+
+
+def test_live_runner_defaults_to_paper_broker():
+    rng = np.random.default_rng(18)
+    close = 2000 + np.cumsum(rng.normal(0, 2, 300))
+    idx = pd.date_range("2024-01-01", periods=len(close), freq="h", tz="UTC", name="datetime")
+    prices = pd.DataFrame({"open": close, "high": close + 1, "low": close - 1, "close": close}, index=idx)
+
+    runner = LiveRunner(DualMovingAverageStrategy(fast=5, slow=20), symbol="XAUUSD", quantity=0.1)
+    result = asyncio.run(runner.run(frame_feed(prices)))
+
+    broker = runner.broker
+    assert isinstance(broker, PaperBroker)
+    assert len(broker.fills) == len(result.orders) > 0
+    assert broker.positions["XAUUSD"].quantity == pytest.approx(result.position * 0.1)
@@ -16,7 +16,7 @@ def test_run_baseline_backtest(monkeypatch):
         index=idx,
     )
 
-    monkeypatch.setattr("goldbot.pipeline.baseline.load_cached_prices", lambda **_: df)
+    monkeypatch.setattr("goldbot.data.quality.load_cached_prices", lambda **_: df)
     result = run_baseline_backtest(symbol="XAUUSD", timeframe="1h")
     assert "cagr" in result.stats
     assert result.quality["n_rows"] == len(df)
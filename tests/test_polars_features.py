@@ -0,0 +1,30 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from goldbot.features import engineer_feature_set
+
+
+def _ohlc(n: int) -> pd.DataFrame:
+    rng = np.random.default_rng(11)
+    close = 1900 + np.cumsum(rng.normal(0, 2, n))
+    open_ = close + rng.normal(0, 0.5, n)
+    high = np.maximum(open_, close) + np.abs(rng.normal(0, 1, n))
+    low = np.minimum(open_, close) - np.abs(rng.normal(0, 1, n))
+    idx = pd.date_range("2024-01-01", periods=n, freq="min", tz="UTC", name="datetime")
+    return pd.DataFrame({"open": open_, "high": high, "low": low, "close": close, "volume": 1.0}, index=idx)
+
+
+def test_polars_backend_matches_pandas():
+    prices = _ohlc(2_000)
+    expected = engineer_feature_set(prices)
+    result = engineer_feature_set(prices, backend="polars")
+
+    assert list(result.columns) == list(expected.columns)
+    pd.testing.assert_index_equal(result.index, expected.index)
+    np.testing.assert_allclose(result.to_numpy(), expected.to_numpy(), rtol=1e-9, atol=1e-8)
+
+
+def test_unknown_backend_rejected():
+    with pytest.raises(ValueError):
+        engineer_feature_set(_ohlc(100), backend="spark")
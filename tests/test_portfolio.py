@@ -0,0 +1,91 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from goldbot.backtest import PortfolioBacktester, VectorizedBacktester
+from goldbot.features import engineer_feature_set
+from goldbot.strategies import (
+    BollingerMeanReversionStrategy,
+    DonchianBreakoutStrategy,
+    DualMovingAverageStrategy,
+    available_strategies,
+    create_strategy,
+    parse_strategy_spec,
+    strategy_label,
+)
+
+
+def _prices(n: int = 800) -> pd.DataFrame:
+    rng = np.random.default_rng(19)
+    close = 1900 + np.cumsum(rng.normal(0, 2, n))
+    idx = pd.date_range("2024-01-01", periods=n, freq="h", tz="UTC")
+    return pd.DataFrame(
+        {"open": close, "high": close + 1, "low": close - 1, "close": close, "volume": 1.0}, index=idx
+    )
+
+
+def _strategies():
+    return [
+        DualMovingAverageStrategy(fast=10, slow=30),
+        DonchianBreakoutStrategy(window=20),
+        BollingerMeanReversionStrategy(window=20),
+    ]
+
+
+def test_registry_builds_strategies_from_specs():
+    assert {"dual_ma_trend", "donchian_breakout", "bollinger_reversion"} <= set(available_strategies())
+    strategy = parse_strategy_spec("dual_ma_trend:fast=10,slow=50")
+    assert isinstance(strategy, DualMovingAverageStrategy)
+    assert (strategy.fast, strategy.slow) == (10, 50)
+    assert strategy_label(create_strategy("bollinger_reversion", entry_z=1.5)) == (
+        "bollinger_reversion(window=20,entry_z=1.5,exit_z=0.5)"
+    )
+    with pytest.raises(ValueError):
+        create_strategy("nope")
+
+
+def test_strategies_do_not_write_to_shared_features():
+    features = engineer_feature_set(_prices())
+    values = features.select_dtypes("number").to_numpy(dtype=np.float64)
+    values.flags.writeable = False
+    view = pd.DataFrame(values, index=features.index, columns=features.select_dtypes("number").columns)
+    for strategy in _strategies():
+        positions = strategy.positions(view)
+        assert set(np.unique(positions)) <= {-1, 0, 1}
+        assert positions[0] == 0
+
+
+def test_single_strategy_portfolio_matches_vectorized_backtester():
+    prices = _prices()
+    features = engineer_feature_set(prices)
+    strategy = DualMovingAverageStrategy(fast=10, slow=30)
+    result = PortfolioBacktester([strategy], max_workers=1).run(prices, features=features)
+
+    expected = VectorizedBacktester().run(strategy.generate_signals(features))
+    label = strategy_label(strategy)
+    np.testing.assert_allclose(result.equity_curve.to_numpy(), expected.equity_curve.to_numpy())
+    assert result.stats.loc[label, "sharpe"] == pytest.approx(expected.stats["sharpe"])
+
+
+def test_parallel_matches_serial_and_allocations_sum_to_one():
+    prices = _prices()
+    serial = PortfolioBacktester(_strategies(), allocation="inverse_vol", vol_window=100, max_workers=1).run(prices)
+    parallel = PortfolioBacktester(_strategies(), allocation="inverse_vol", vol_window=100, max_workers=2).run(prices)
+
+    pd.testing.assert_frame_equal(serial.positions, parallel.positions)
+    pd.testing.assert_series_equal(serial.equity_curve, parallel.equity_curve)
+    np.testing.assert_allclose(serial.weights.sum(axis=1), 1.0)
+    assert list(serial.stats.index[-1:]) == ["portfolio"]
+    assert len(serial.stats) == 4
+
+
+def test_fixed_weights_combine_strategy_returns():
+    prices = _prices()
+    strategies = _strategies()[:2]
+    result = PortfolioBacktester(
+        strategies, allocation="fixed", weights={"dual_ma_trend": 3, "donchian_breakout": 1}, max_workers=1
+    ).run(prices)
+
+    np.testing.assert_allclose(result.weights.iloc[0].to_numpy(), [0.75, 0.25])
+    expected = 0.75 * result.returns.iloc[:, 0] + 0.25 * result.returns.iloc[:, 1]
+    np.testing.assert_allclose(result.portfolio_returns.to_numpy(), expected.to_numpy())
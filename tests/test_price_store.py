@@ -0,0 +1,44 @@
+import numpy as np
+import pandas as pd
+
+from goldbot.data import PartitionedPriceStore
+
+
+def _bars(start: str, periods: int) -> pd.DataFrame:
+    idx = pd.date_range(start, periods=periods, freq="h", tz="UTC", name="datetime")
+    close = np.arange(periods, dtype=float) + 1900
+    return pd.DataFrame(
+        {"open": close, "high": close + 1, "low": close - 1, "close": close, "volume": 1.0},
+        index=idx,
+    )
+
+
+def test_store_partitions_and_range_reads(tmp_path):
+    store = PartitionedPriceStore(root=tmp_path, row_group_size=24)
+    df = _bars("2024-01-20", 24 * 30)  # spans January and February
+    paths = store.write(df, symbol="XAU/USD", timeframe="1h")
+    assert [p.parent.name for p in paths] == ["month=01", "month=02"]
+
+    week = store.read("XAU/USD", "1h", start="2024-02-01", end="2024-02-08", columns=["close"])
+    assert list(week.columns) == ["close"]
+    assert week.index.min() == pd.Timestamp("2024-02-01", tz="UTC")
+    assert len(week) == 24 * 7
+    pd.testing.assert_series_equal(week["close"], df.loc["2024-02-01":"2024-02-07 23:00", "close"], check_freq=False)
+
+
+def test_store_append_rewrites_only_affected_partition(tmp_path):
+    store = PartitionedPriceStore(root=tmp_path)
+    store.write(_bars("2024-01-30", 72), symbol="XAUUSD", timeframe="1h")
+    january = store.partition_path("XAUUSD", "1h", 2024, 1)
+    before = january.stat().st_mtime_ns
+
+    update = _bars("2024-02-01 12:00", 48)
+    update["close"] += 100
+    written = store.write(update, symbol="XAUUSD", timeframe="1h")
+
+    assert written == [store.partition_path("XAUUSD", "1h", 2024, 2)]
+    assert january.stat().st_mtime_ns == before
+    full = store.read("XAUUSD", "1h")
+    assert not full.index.duplicated().any()
+    assert full.index.max() == update.index.max()
+    assert full.loc[update.index[0], "close"] == update["close"].iloc[0]
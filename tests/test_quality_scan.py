@@ -0,0 +1,102 @@
+import numpy as np
+import pandas as pd
+
+from goldbot.data.quality import scan_partitions, scan_prices, summarize_scans
+from goldbot.data.sessions import SessionCalendar
+from goldbot.data.store import PartitionedPriceStore
+
+CALENDAR = SessionCalendar.with_holidays(["2024-01-17"])
+
+
+def _session_bars(start: str, end: str) -> pd.DataFrame:
+    idx = pd.date_range(start, end, freq="1min", tz="UTC", inclusive="left")
+    idx = idx[CALENDAR.is_open(idx)]
+    rng = np.random.default_rng(14)
+    close = 2000 * np.exp(np.cumsum(rng.normal(0, 2e-4, len(idx))))
+    wick = close * 1e-4
+    return pd.DataFrame(
+        {"open": close, "high": close + wick, "low": close - wick, "close": close, "volume": 1.0}, index=idx
+    )
+
+
+def test_calendar_closures():
+    # Sessions are New York time: the 17:00 break is 22:00 UTC in winter and 21:00 UTC in summer.
+    idx = pd.DatetimeIndex(
+        [
+            "2024-01-12 21:59",
+            "2024-01-12 22:00",
+            "2024-01-14 22:59",
+            "2024-01-14 23:00",
+            "2024-01-16 21:30",
+            "2024-01-16 22:30",
+            "2024-07-16 20:30",
+            "2024-07-16 21:30",
+        ],
+        tz="UTC",
+    )
+    assert CALENDAR.is_open(idx).tolist() == [True, False, False, True, True, False, True, False]
+
+
+def test_winter_hourly_feed_has_no_false_outages():
+    idx = pd.date_range("2024-01-07 23:00", "2024-02-02 22:00", freq="1h", tz="UTC", inclusive="left")
+    local = idx.tz_convert("America/New_York")
+    weekend = ((local.dayofweek == 4) & (local.hour >= 17)) | (local.dayofweek == 5)
+    weekend |= (local.dayofweek == 6) & (local.hour < 18)
+    idx = idx[(local.hour != 17) & ~weekend]
+    df = pd.DataFrame({"open": 2000.0, "high": 2001.0, "low": 1999.0, "close": 2000.0}, index=idx)
+
+    report = scan_prices(df, freq="1h").report
+    assert report.missing_rows == 0 and report.missing_pct == 0.0
+    assert report.expected_rows == len(df)
+
+
+def test_daily_bars_without_sundays_are_complete():
+    idx = pd.bdate_range("2024-01-01", "2024-03-29", tz="UTC")
+    df = pd.DataFrame({"open": 2000.0, "high": 2001.0, "low": 1999.0, "close": 2000.0}, index=idx)
+
+    report = scan_prices(df, freq="1D").report
+    assert report.missing_rows == 0
+    assert report.expected_rows == len(df)
+    assert report.session_gap_rows == 2 * 12  # Saturday and Sunday of each weekend
+
+
+def test_scan_classifies_gaps_and_defects():
+    clean = _session_bars("2024-01-08", "2024-01-20")
+    outage = clean.index[1000:1007]
+    df = clean.drop(outage)
+    df.iloc[2000, df.columns.get_loc("high")] = df.iloc[2000]["low"] - 1  # high < low
+    df.iloc[3000, df.columns.get_loc("close")] *= 1.05  # isolated spike
+    df = pd.concat([df, df.iloc[[500]]])  # duplicate appended out of order
+
+    scan = scan_prices(df, freq="1min", calendar=CALENDAR, repair=True)
+    report = scan.report
+
+    assert report.missing_rows == 7
+    assert report.holiday_gap_rows == 1440
+    assert report.session_gap_rows == 7 * 60 + 49 * 60  # seven daily breaks + one weekend
+    assert report.expected_rows == len(clean)
+    assert report.duplicate_rows == 1
+    assert report.out_of_order_rows == 1
+    assert report.ohlc_violations >= 1
+    assert report.spike_rows >= 1
+    outages = scan.gaps[scan.gaps["kind"] == "outage"]
+    assert len(outages) == 1 and outages.iloc[0]["start"] == outage[0]
+
+    repaired = scan.repaired
+    assert repaired.index.is_monotonic_increasing and repaired.index.is_unique
+    assert (repaired["high"] >= repaired[["open", "close", "low"]].max(axis=1)).all()
+    assert scan_prices(repaired, freq="1min", calendar=CALENDAR).report.spike_rows == 0
+
+
+def test_partition_scan_matches_whole_history(tmp_path):
+    df = _session_bars("2024-01-22", "2024-02-10")
+    df = df.drop(df.index[(df.index >= "2024-01-31 23:57") & (df.index < "2024-02-01 00:03")])
+    store = PartitionedPriceStore(root=tmp_path)
+    store.write(df, "XAUUSD", "1min")
+
+    summary = summarize_scans(scan_partitions(store, "XAUUSD", "1min", calendar=CALENDAR))
+    whole = scan_prices(df, freq="1min", calendar=CALENDAR).report
+
+    assert list(summary["month"]) == [1, 2]
+    assert summary["missing_rows"].sum() == whole.missing_rows == 6
+    assert summary["session_gap_rows"].sum() == whole.session_gap_rows
@@ -0,0 +1,67 @@
+import asyncio
+
+import numpy as np
+import pandas as pd
+
+from goldbot.data.replay import ReplayFeed, ReplayServer, as_bars, replay_client
+from goldbot.execution import LiveRunner
+from goldbot.strategies import DualMovingAverageStrategy
+
+
+def _bars(n: int) -> pd.DataFrame:
+    rng = np.random.default_rng(16)
+    close = 1900 + np.cumsum(rng.normal(0, 1, n))
+    idx = pd.date_range("2024-01-01", periods=n, freq="min", tz="UTC", name="datetime")
+    return pd.DataFrame({"open": close, "high": close + 1, "low": close - 1, "close": close, "volume": 1.0}, index=idx)
+
+
+async def _collect(events):
+    return [event async for event in events]
+
+
+def test_in_process_replay_as_fast_as_possible():
+    feed = ReplayFeed.from_bars(_bars(5_000))
+    events = asyncio.run(_collect(feed.stream()))
+
+    assert len(events) == 5_000 == feed.stats.events
+    assert events[0]["event"] == "price" and events[0]["symbol"] == "XAU/USD"
+    assert events[1]["timestamp"] - events[0]["timestamp"] == 60
+    assert feed.stats.throughput > 0
+
+
+def test_paced_replay_respects_speed():
+    # 10 one-minute bars at 3000x span 9 * 60 / 3000 = 0.18s of wall time.
+    feed = ReplayFeed.from_bars(_bars(10), speed=3_000)
+    asyncio.run(_collect(feed.stream()))
+    assert 0.15 <= feed.stats.elapsed < 1.0
+
+
+def test_tick_replay(tmp_path):
+    n = 2_000
+    ts = pd.Timestamp("2024-01-02", tz="UTC").value + np.arange(n) * 250_000_000
+    ticks = pd.DataFrame({"time_msc": ts // 1_000_000, "bid": 2000.0, "ask": 2000.3, "volume_real": 1.0})
+    path = tmp_path / "ticks.parquet"
+    ticks.to_parquet(path)
+
+    events = asyncio.run(_collect(ReplayFeed.from_ticks(path, chunk_rows=500).stream()))
+    assert len(events) == n
+    assert events[0]["bid"] == 2000.0 and abs(events[0]["price"] - 2000.15) < 1e-9
+
+
+def test_socket_replay_drives_live_runner():
+    prices = _bars(600)
+
+    async def scenario():
+        server = ReplayServer(ReplayFeed.from_bars(prices))
+        port = await server.start()
+        try:
+            runner = LiveRunner(DualMovingAverageStrategy(fast=5, slow=20), symbol="XAUUSD")
+            result = await runner.run(as_bars(replay_client("127.0.0.1", port)))
+        finally:
+            await server.close()
+        return server, result
+
+    server, result = asyncio.run(scenario())
+    assert result.bars == len(prices)
+    assert server.runs[0].events == len(prices)
+    assert result.orders
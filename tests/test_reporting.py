@@ -1,9 +1,18 @@
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
 from goldbot.backtest.engine import BacktestResult
 from goldbot.pipeline.baseline import BaselineResult
+from goldbot.reporting import (
+    ReportRun,
+    downsample,
+    lttb_indices,
+    minmax_indices,
+    render_batch,
+    render_report,
+)
 from goldbot.reporting.baseline_report import generate_baseline_report
 
 
@@ -21,3 +30,51 @@ def test_generate_baseline_report(monkeypatch, tmp_path):
     assert Path(artifacts.stats_path).exists()
     assert Path(artifacts.equity_plot_path).exists()
 
+
+
+def _equity(n: int, seed: int = 22) -> pd.Series:
+    rng = np.random.default_rng(seed)
+    idx = pd.date_range("2020-01-01", periods=n, freq="min", tz="UTC")
+    return pd.Series(10_000 * np.exp(np.cumsum(rng.normal(0, 1e-4, n))), index=idx, name="equity")
+
+
+def test_downsampling_keeps_endpoints_and_extremes():
+    y = np.zeros(100_000)
+    y[54_321] = 5.0
+    y[77_777] = -3.0
+    keep = lttb_indices(y, 500)
+    assert len(keep) == 500 and keep[0] == 0 and keep[-1] == y.size - 1
+    assert np.all(np.diff(keep) > 0)
+    assert {54_321, 77_777} <= set(keep.tolist())
+
+    keep = minmax_indices(y, 500)
+    assert len(keep) <= 502 and {0, 54_321, 77_777, y.size - 1} <= set(keep.tolist())
+
+    series = _equity(50_000)
+    assert downsample(series, None) is series
+    sampled = downsample(series, 1_000, method="minmax")
+    assert sampled.max() == series.max() and sampled.min() == series.min()
+
+
+def test_report_size_does_not_grow_with_bars(tmp_path):
+    sizes = []
+    for n in (20_000, 400_000):
+        run = ReportRun("run", _equity(n), pd.DataFrame({"net_return": np.linspace(-0.01, 0.02, n // 50)}))
+        sizes.append(render_report(run, tmp_path / str(n), max_points=1_000).stat().st_size)
+    assert sizes[1] < 1.2 * sizes[0]
+    assert sizes[1] < 300_000  # Plotly JS is referenced, not embedded
+    assert (tmp_path / "400000" / "plotly.min.js").exists()
+
+
+def test_render_batch_writes_index_for_parallel_runs(tmp_path):
+    runs = [
+        ReportRun(f"run {i}", _equity(5_000, seed=i), stats={"sharpe": float(i), "total_return": 0.1 * i})
+        for i in range(4)
+    ]
+    batch = render_batch(runs, tmp_path, max_points=500, max_workers=2)
+
+    assert [p.name for p in batch.report_paths] == [f"run_{i}.html" for i in range(4)]
+    assert all(p.exists() and p.with_suffix(".json").exists() for p in batch.report_paths)
+    index = batch.index_path.read_text()
+    assert index.index('href="run_3.html"') < index.index('href="run_0.html"')  # sorted by Sharpe
+    assert len(list(tmp_path.glob("*.js"))) == 1
@@ -0,0 +1,84 @@
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from goldbot.backtest import VectorizedBacktester
+from goldbot.features import engineer_feature_set
+from goldbot.strategies import (
+    BollingerMeanReversionStrategy,
+    DonchianBreakoutStrategy,
+    DualMovingAverageStrategy,
+)
+from goldbot.strategies.base import hold_signal, lag_signal
+
+
+def _prices(n: int = 1_000) -> pd.DataFrame:
+    rng = np.random.default_rng(20)
+    close = 1900 + np.cumsum(rng.normal(0, 2, n))
+    idx = pd.date_range("2024-01-01", periods=n, freq="h", tz="UTC")
+    return pd.DataFrame(
+        {"open": close, "high": close + 1, "low": close - 1, "close": close, "volume": 1.0}, index=idx
+    )
+
+
+def test_signal_helpers():
+    assert lag_signal(np.array([1, -1, 0], dtype=np.int8)).tolist() == [0, 1, -1]
+    held = hold_signal(np.array([np.nan, 1.0, np.nan, 0.0, np.nan, -1.0]))
+    assert held.dtype == np.int8
+    assert held.tolist() == [0, 1, 1, 0, 0, -1]
+
+
+@pytest.mark.parametrize(
+    "strategy",
+    [DualMovingAverageStrategy(), DonchianBreakoutStrategy(window=20), BollingerMeanReversionStrategy()],
+)
+def test_positions_are_int8_lagged_signals(strategy):
+    prices = _prices()
+    signals = strategy.signals(prices)
+    positions = strategy.positions(prices)
+    assert signals.dtype == positions.dtype == np.int8
+    assert len(positions) == len(prices)
+    np.testing.assert_array_equal(positions[1:], signals[:-1])
+    frame = strategy.generate_signals(prices)
+    np.testing.assert_array_equal(frame["position"].to_numpy(), positions)
+
+
+def test_strategies_reuse_feature_columns():
+    prices = _prices()
+    features = engineer_feature_set(prices)
+    tail = slice(len(prices) - len(features), None)  # features drop indicator warm-up rows
+    strategy = DualMovingAverageStrategy()
+    np.testing.assert_array_equal(strategy.signals(features), strategy.signals(prices)[tail])
+    reversion = BollingerMeanReversionStrategy()
+    np.testing.assert_allclose(reversion.zscore(features), reversion.zscore(prices)[tail], atol=1e-9)
+
+    # Feature columns are read as-is rather than recomputed.
+    tampered = features.assign(sma_21=features["sma_55"] + 1.0)
+    assert (DualMovingAverageStrategy().signals(tampered)[55:] == 1).all()
+
+
+def test_run_strategy_matches_frame_backtest():
+    prices = _prices()
+    strategy = DualMovingAverageStrategy(fast=10, slow=30)
+    # 252 periods keep the rolling-Sharpe window inside the sample, so no stat is NaN.
+    backtester = VectorizedBacktester(periods_per_year=252)
+    from_arrays = backtester.run_strategy(strategy, prices)
+    from_frame = backtester.run(strategy.generate_signals(prices))
+
+    pd.testing.assert_series_equal(from_arrays.equity_curve, from_frame.equity_curve)
+    pd.testing.assert_frame_equal(from_arrays.trades, from_frame.trades)
+    assert from_arrays.stats == from_frame.stats
+
+
+def test_run_strategy_allocates_less_than_one_frame_copy():
+    features = engineer_feature_set(_prices(50_000))
+    strategy = DualMovingAverageStrategy()
+    frame_bytes = features.memory_usage(index=True).sum()
+
+    tracemalloc.start()
+    VectorizedBacktester().run_strategy(strategy, features)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert peak < frame_bytes
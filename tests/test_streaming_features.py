@@ -0,0 +1,37 @@
+import numpy as np
+import pandas as pd
+
+from goldbot.features import (
+    IncrementalFeatureEngine,
+    add_momentum_indicators,
+    add_trend_indicators,
+    add_volatility_indicators,
+)
+from goldbot.features.streaming import benchmark_update_latency
+
+
+def _ohlc(n: int = 400) -> pd.DataFrame:
+    rng = np.random.default_rng(3)
+    close = 1900 + np.cumsum(rng.normal(0, 2, n))
+    wick = np.abs(rng.normal(0, 1.5, n))
+    idx = pd.date_range("2024-01-01", periods=n, freq="h", tz="UTC")
+    return pd.DataFrame(
+        {"open": close, "high": close + wick, "low": close - wick, "close": close, "volume": 1.0},
+        index=idx,
+    )
+
+
+def test_incremental_engine_matches_batch_indicators():
+    df = _ohlc()
+    batch = add_volatility_indicators(add_momentum_indicators(add_trend_indicators(df)))
+    engine = IncrementalFeatureEngine()
+    streamed = engine.update_frame(df)
+
+    for column in engine.columns:
+        np.testing.assert_allclose(streamed[column], batch[column], rtol=1e-9, atol=1e-9, err_msg=column)
+
+
+def test_benchmark_reports_microseconds():
+    stats = benchmark_update_latency(n_bars=200, warmup=100)
+    assert stats["bars"] == 200
+    assert 0 < stats["p50_us"] <= stats["p99_us"]
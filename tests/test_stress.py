@@ -0,0 +1,41 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from goldbot.backtest import MonteCarloStress, VectorizedBacktester
+
+
+def _result():
+    rng = np.random.default_rng(9)
+    n = 400
+    close = 1900 + np.cumsum(rng.normal(0.1, 2, n))
+    idx = pd.date_range("2024-01-01", periods=n, freq="h", tz="UTC")
+    position = np.where((np.arange(n) // 25) % 3 == 0, 0, 1)
+    signals = pd.DataFrame({"close": close, "position": position}, index=idx)
+    return VectorizedBacktester().run(signals)
+
+
+def test_block_bootstrap_is_seeded_and_chunked():
+    result = _result()
+    stress = MonteCarloStress(n_paths=300, block_size=10, seed=42, max_chunk_bytes=400 * 8 * 8 * 64)
+    first = stress.run(result)
+    second = stress.run(result)
+
+    assert stress.chunk_paths(400) == 64
+    assert len(first.distributions) == 300
+    assert list(first.distributions.columns) == ["cagr", "sharpe", "max_drawdown", "time_to_recovery"]
+    pd.testing.assert_frame_equal(first.distributions, second.distributions)
+    assert (first.distributions["max_drawdown"] <= 0).all()
+    assert first.summary.loc["cagr", 0.05] <= first.summary.loc["cagr", 0.95]
+
+
+def test_trade_reshuffle_preserves_total_return():
+    result = _result()
+    outcome = MonteCarloStress(n_paths=50, method="trades", seed=1).run(result)
+    np.testing.assert_allclose(outcome.distributions["cagr"], outcome.observed["cagr"], rtol=1e-9)
+    assert outcome.distributions["max_drawdown"].nunique() > 1
+
+
+def test_unknown_method_rejected():
+    with pytest.raises(ValueError):
+        MonteCarloStress(method="nope").run(_result())
@@ -0,0 +1,30 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from goldbot.backtest import MovingAverageSweep, VectorizedBacktester
+from goldbot.strategies import DualMovingAverageStrategy
+
+
+def _prices(n: int = 400) -> pd.DataFrame:
+    rng = np.random.default_rng(7)
+    close = 1900 + np.cumsum(rng.normal(0, 2, n))
+    idx = pd.date_range("2024-01-01", periods=n, freq="h", tz="UTC")
+    return pd.DataFrame({"close": close}, index=idx)
+
+
+def test_sweep_matches_single_backtests():
+    prices = _prices()
+    table = MovingAverageSweep(chunk_size=3).run(prices, fast_windows=[5, 10, 21], slow_windows=[20, 55])
+    assert len(table) == 5  # (21, 20) is skipped because fast must be < slow
+
+    for row in table.itertuples():
+        signals = DualMovingAverageStrategy(fast=row.fast, slow=row.slow).generate_signals(prices)
+        stats = VectorizedBacktester().run(signals).stats
+        for key in ("cagr", "volatility", "sharpe", "max_drawdown"):
+            assert getattr(row, key) == pytest.approx(stats[key], rel=1e-9, abs=1e-12)
+
+
+def test_sweep_rejects_empty_grid():
+    with pytest.raises(ValueError):
+        MovingAverageSweep().run(_prices(), fast_windows=[50], slow_windows=[20])
@@ -0,0 +1,104 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from goldbot.data.ticks import TickBarAggregator, aggregate_ticks, read_ticks
+
+
+def _ticks(n: int = 20_000) -> pd.DataFrame:
+    rng = np.random.default_rng(13)
+    ts = pd.Timestamp("2024-03-04", tz="UTC").value + np.cumsum(rng.integers(1, 400, n)) * 1_000_000
+    bid = 2050 + np.cumsum(rng.normal(0, 0.05, n))
+    spread = rng.uniform(0.1, 0.4, n)
+    return pd.DataFrame({"ts": ts, "bid": bid, "ask": bid + spread, "volume": rng.integers(1, 5, n).astype(float)})
+
+
+def _chunks(ticks: pd.DataFrame, size: int):
+    return [ticks.iloc[i : i + size] for i in range(0, len(ticks), size)]
+
+
+def test_time_bars_match_pandas_resample():
+    ticks = _ticks()
+    bars = aggregate_ticks(_chunks(ticks, 777), kind="time", size="1min")
+
+    frame = ticks.set_index(pd.to_datetime(ticks["ts"], utc=True))
+    frame = frame.assign(mid=(frame["bid"] + frame["ask"]) / 2, spread=frame["ask"] - frame["bid"])
+    grouped = frame.resample("1min")
+    expected = pd.DataFrame(
+        {
+            "open": grouped["mid"].first(),
+            "high": grouped["mid"].max(),
+            "low": grouped["mid"].min(),
+            "close": grouped["mid"].last(),
+            "volume": grouped["volume"].sum(),
+            "tick_count": grouped["mid"].count(),
+            "spread_mean": grouped["spread"].mean(),
+            "spread_min": grouped["spread"].min(),
+            "spread_max": grouped["spread"].max(),
+        }
+    )
+    expected = expected[expected["tick_count"] > 0]
+
+    np.testing.assert_array_equal(bars.index.asi8, expected.index.asi8)
+    np.testing.assert_allclose(bars.to_numpy(dtype=float), expected.to_numpy(dtype=float), rtol=1e-12)
+
+
+@pytest.mark.parametrize("kind,size", [("ticks", 250), ("volume", 400.0)])
+def test_chunking_does_not_change_bars(kind, size):
+    ticks = _ticks()
+    whole = aggregate_ticks([ticks], kind=kind, size=size)
+    chunked = aggregate_ticks(_chunks(ticks, 333), kind=kind, size=size)
+
+    pd.testing.assert_frame_equal(whole, chunked)
+    assert whole["tick_count"].sum() == len(ticks)
+    if kind == "ticks":
+        assert (whole["tick_count"].iloc[:-1] == size).all()
+    else:
+        # Each closed bar crosses the next multiple of ``size`` in cumulative volume.
+        crossed = np.floor(whole["volume"].cumsum().iloc[:-1] / size)
+        assert (np.diff(crossed) >= 1).all() and crossed.iloc[0] >= 1
+
+
+def test_read_ticks_from_mt5_exports(tmp_path):
+    ticks = _ticks(5_000)
+    mt5 = pd.DataFrame(
+        {
+            "time": ticks["ts"] // 1_000_000_000,
+            "bid": ticks["bid"],
+            "ask": ticks["ask"],
+            "last": 0.0,
+            "volume": 0,
+            "time_msc": ticks["ts"] // 1_000_000,
+            "flags": 6,
+            "volume_real": ticks["volume"],
+        }
+    )
+    mt5.loc[10, "ask"] = 0.0  # only the bid moved on this tick
+    parquet = tmp_path / "ticks.parquet"
+    csv = tmp_path / "ticks.csv"
+    mt5.to_parquet(parquet)
+    mt5.to_csv(csv, index=False)
+
+    for path in (parquet, csv):
+        chunks = list(read_ticks(path, chunk_rows=1_000))
+        loaded = pd.concat(chunks, ignore_index=True)
+        assert len(loaded) == len(ticks)
+        assert loaded.loc[10, "ask"] == ticks.loc[9, "ask"]
+        np.testing.assert_array_equal(loaded["ts"].to_numpy(), (ticks["ts"] // 1_000_000 * 1_000_000).to_numpy())
+
+
+def test_read_ticks_terminal_export(tmp_path):
+    path = tmp_path / "XAUUSD_ticks.csv"
+    path.write_text(
+        "<DATE>\t<TIME>\t<BID>\t<ASK>\t<LAST>\t<VOLUME>\t<FLAGS>\n"
+        "2024.03.04\t00:00:00.120\t2050.10\t2050.35\t\t\t6\n"
+        "2024.03.04\t00:00:00.480\t2050.15\t\t\t\t2\n"
+    )
+    loaded = next(read_ticks(path))
+    assert list(loaded["ask"]) == [2050.35, 2050.35]
+    assert loaded["ts"].iloc[1] == pd.Timestamp("2024-03-04 00:00:00.480", tz="UTC").value
+
+
+def test_rejects_unknown_kind():
+    with pytest.raises(ValueError):
+        TickBarAggregator(kind="range")
@@ -0,0 +1,142 @@
+import asyncio
+import json
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from goldbot.execution import LiveRunner, frame_feed
+from goldbot.pipeline.baseline import run_baseline_backtest
+from goldbot.strategies import DualMovingAverageStrategy
+from goldbot.utils.tracing import SamplingProfiler, disable_tracing, enable_tracing, get_tracer, span, traced
+
+
+@pytest.fixture
+def tracer():
+    active = enable_tracing()
+    yield active
+    disable_tracing()
+
+
+def _prices(n: int) -> pd.DataFrame:
+    rng = np.random.default_rng(24)
+    close = 2000 + np.cumsum(rng.normal(0, 2, n))
+    idx = pd.date_range("2024-01-01", periods=n, freq="h", tz="UTC", name="datetime")
+    return pd.DataFrame(
+        {"open": close, "high": close + 1, "low": close - 1, "close": close, "volume": 1.0}, index=idx
+    )
+
+
+@traced("double", rows_arg="values")
+def _double(values):
+    return values * 2
+
+
+def test_disabled_tracing_is_a_shared_noop():
+    assert get_tracer() is None
+    assert span("a") is span("b", rows=3)
+    with span("a") as active:
+        active.add_rows(10)
+    assert _double(np.arange(3)).tolist() == [0, 2, 4]
+
+
+def test_spans_nest_and_aggregate(tracer):
+    with span("outer", rows=5, stage="x") as outer:
+        _double(np.arange(4))
+        _double(np.arange(6))
+        outer.add_rows(1)
+    with pytest.raises(ValueError):
+        with span("failing"):
+            raise ValueError("boom")
+
+    records = {record.path: record for record in tracer.spans}
+    assert set(records) == {"outer", "outer/double", "failing"}
+    assert records["outer"].rows == 6 and records["outer"].attributes == {"stage": "x"}
+    assert records["failing"].error == "ValueError"
+    summary = tracer.summary()
+    assert summary["double"]["calls"] == 2
+    assert summary["double"]["rows"] == 10
+    assert summary["failing"]["errors"] == 1
+    assert summary["outer"]["wall_s"] >= summary["double"]["wall_s"]
+
+
+def test_memory_delta_is_recorded():
+    tracer = enable_tracing(memory=True)
+    try:
+        with span("allocate"):
+            kept = np.ones(2_000_000)
+    finally:
+        disable_tracing()
+    assert kept.nbytes <= tracer.summary()["allocate"]["memory_delta_bytes"] < 2 * kept.nbytes
+
+
+def test_baseline_pipeline_reports_each_stage(monkeypatch, tracer):
+    monkeypatch.setattr("goldbot.data.quality.load_cached_prices", lambda **_: _prices(500))
+    run_baseline_backtest(symbol="XAUUSD", timeframe="1h")
+
+    paths = {record.path for record in tracer.spans}
+    for child in (
+        "data.quality.scan_prices",
+        "features.technicals.engineer_feature_set",
+        "strategies.signals",
+        "backtest.engine.VectorizedBacktester.run_arrays",
+    ):
+        assert f"pipeline.baseline/{child}" in paths
+    rows = {record.name: record.rows for record in tracer.spans}
+    assert rows["data.quality.scan_prices"] == rows["features.technicals.engineer_feature_set"] == 500
+    assert 0 < rows["strategies.signals"] == rows["backtest.engine.VectorizedBacktester.run_arrays"] < 500
+
+
+def test_live_runner_spans_per_bar_and_order(tracer):
+    runner = LiveRunner(DualMovingAverageStrategy(fast=5, slow=20), symbol="XAUUSD")
+    result = asyncio.run(runner.run(frame_feed(_prices(200))))
+
+    summary = tracer.summary()
+    assert summary["execution.live.on_bar"]["calls"] == summary["execution.live.on_bar"]["rows"] == 200
+    assert summary["execution.live.order"]["calls"] == len(result.orders) > 0
+    assert any(record.path == "execution.live.on_bar/execution.live.order" for record in tracer.spans)
+
+
+def test_json_and_prometheus_export(tmp_path, tracer):
+    with span('quote"d', rows=3):
+        pass
+    tracer.export_json(tmp_path / "trace.json")
+    text = tracer.export_prometheus(tmp_path / "trace.prom").read_text()
+
+    document = json.loads((tmp_path / "trace.json").read_text())
+    assert document["summary"]['quote"d']["rows"] == 3
+    assert document["spans"][0]["path"] == 'quote"d'
+    assert "# TYPE goldbot_span_seconds_total counter" in text
+    assert 'goldbot_span_rows_total{span="quote\\"d"} 3' in text
+    assert not list(tmp_path.glob(".*.tmp"))
+
+
+def test_sampling_profiler_hook_captures_busy_span(tmp_path):
+    tracer = enable_tracing(profile_spans=["busy"])
+    try:
+        with span("busy"):
+            _spin(0.2)
+        with span("quiet"):
+            pass
+    finally:
+        disable_tracing()
+
+    assert set(tracer.profiles) == {"busy"}
+    assert any("test_tracing:_spin;" in f"{stack};" for stack in tracer.profiles["busy"])
+    folded = tracer.export_profiles(tmp_path / "trace.folded").read_text().splitlines()
+    assert folded and all(line.startswith("busy;") for line in folded)
+
+
+def test_sampling_profiler_top_reports_self_time():
+    profiler = SamplingProfiler(interval=0.002).start()
+    _spin(0.1)
+    profiler.stop()
+    assert profiler.samples > 0
+    assert profiler.top(1)[0][0].endswith("test_tracing:_spin")
+
+
+def _spin(seconds: float) -> None:
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
@@ -0,0 +1,44 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from goldbot.backtest import VectorizedBacktester, build_trade_ledger
+
+
+def test_ledger_pairs_entries_exits_and_splits_reversals():
+    idx = pd.date_range("2024-01-01", periods=8, freq="h")
+    close = np.array([100, 101, 103, 102, 99, 97, 98, 100], dtype=float)
+    high = close + 1
+    low = close - 1
+    position = np.array([0, 1, 1, -1, -1, 0, 1, 1], dtype=float)
+
+    ledger = build_trade_ledger(idx, close, position, high=high, low=low, commission=0.001)
+
+    assert ledger["side"].tolist() == [1, -1, 1]
+    assert ledger["entry_time"].tolist() == [idx[1], idx[3], idx[6]]
+    assert ledger["exit_time"].tolist() == [idx[3], idx[5], idx[7]]
+    assert ledger["bars_held"].tolist() == [2, 2, 1]
+    assert ledger["is_open"].tolist() == [False, False, True]
+
+    long_trade, short_trade = ledger.iloc[0], ledger.iloc[1]
+    assert long_trade["gross_return"] == pytest.approx(102 / 101 - 1)
+    assert long_trade["net_return"] == pytest.approx(102 / 101 - 1 - 0.002)
+    assert long_trade["mfe"] == pytest.approx(104 / 101 - 1)  # high of bar 2
+    assert long_trade["mae"] == pytest.approx(0.0)  # lows never went below 101
+    assert short_trade["gross_return"] == pytest.approx(-(97 / 102 - 1))
+    assert short_trade["mae"] == pytest.approx(0.0)  # highs stayed below the 102 entry
+    assert short_trade["mfe"] == pytest.approx(1 - 96 / 102)
+
+
+def test_backtester_returns_round_trip_ledger():
+    idx = pd.date_range("2024-01-01", periods=6, freq="h")
+    signals = pd.DataFrame({"close": [1.0, 2, 3, 4, 5, 6], "position": [0, 1, 1, 0, 0, 0]}, index=idx)
+    trades = VectorizedBacktester().run(signals).trades
+    assert len(trades) == 1
+    assert trades.iloc[0]["entry_price"] == 2.0
+    assert trades.iloc[0]["exit_price"] == 4.0
+
+
+def test_ledger_handles_flat_series():
+    idx = pd.date_range("2024-01-01", periods=3, freq="h")
+    assert build_trade_ledger(idx, np.ones(3), np.zeros(3)).empty
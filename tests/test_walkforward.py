@@ -0,0 +1,34 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from goldbot.backtest import WalkForwardRunner, walk_forward_folds
+
+
+def _prices(n: int = 600) -> pd.DataFrame:
+    rng = np.random.default_rng(11)
+    close = 1900 + np.cumsum(rng.normal(0, 2, n))
+    idx = pd.date_range("2024-01-01", periods=n, freq="h", tz="UTC")
+    return pd.DataFrame({"close": close}, index=idx)
+
+
+def test_walk_forward_folds_rolling_and_anchored():
+    rolling = walk_forward_folds(100, train_bars=40, test_bars=25)
+    assert [(f.train_start, f.train_end, f.test_end) for f in rolling] == [(0, 40, 65), (25, 65, 90), (50, 90, 100)]
+    anchored = walk_forward_folds(100, train_bars=40, test_bars=25, anchored=True)
+    assert all(f.train_start == 0 for f in anchored)
+    with pytest.raises(ValueError):
+        walk_forward_folds(30, train_bars=40, test_bars=10)
+
+
+def test_walk_forward_parallel_matches_serial():
+    prices = _prices()
+    kwargs = dict(fast_windows=[5, 10], slow_windows=[20, 40], train_bars=200, test_bars=100)
+    serial = WalkForwardRunner(max_workers=1, **kwargs).run(prices)
+    parallel = WalkForwardRunner(max_workers=2, **kwargs).run(prices)
+
+    assert len(serial.folds) == 4
+    assert serial.oos_returns.index[0] == prices.index[200]
+    assert len(serial.equity_curve) == len(prices) - 200
+    pd.testing.assert_series_equal(serial.oos_returns, parallel.oos_returns)
+    pd.testing.assert_frame_equal(serial.folds, parallel.folds)